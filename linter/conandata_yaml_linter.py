@@ -10,61 +10,61 @@ from strictyaml import (
     Enum,
     Any,
 )
-from yaml_linting import file_path
+from yaml_linting import add_batch_arguments, lint_files
 
 
 CONANDATA_YAML_URL = "https://github.com/conan-io/conan-center-index/blob/master/docs/adding_packages/conandata_yml_format.md"
 
 
+PATCH_FIELDS = Map(
+    {
+        "patch_file": Str(),
+        "patch_description": Str(),
+        "patch_type": Enum(
+            ["official", "conan", "portability", "bugfix", "vulnerability"]
+        ),
+        Optional("patch_source"): Str(),
+        # No longer required for v2 recipes with layouts
+        Optional("base_path"): Str(),
+    }
+)
+SCHEMA = Map(
+    {
+        "sources": MapPattern(Str(), Any(), minimum_keys=1),
+        Optional("patches"): MapPattern(Str(), Seq(Any()), minimum_keys=1),
+    }
+)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate Conan's 'conandata.yaml' file to ConanCenterIndex's requirements."
     )
-    parser.add_argument(
-        "path",
-        nargs="?",
-        type=file_path,
-        help="file to validate.",
-    )
+    add_batch_arguments(parser, "conandata.yml")
     args = parser.parse_args()
+    lint_files(lint, __file__, args, "conandata.yml")
 
-    patch_fields = Map(
-        {
-            "patch_file": Str(),
-            "patch_description": Str(),
-            "patch_type": Enum(
-                ["official", "conan", "portability", "bugfix", "vulnerability"]
-            ),
-            Optional("patch_source"): Str(),
-            # No longer required for v2 recipes with layouts
-            Optional("base_path"): Str(),
-        }
-    )
-    schema = Map(
-        {
-            "sources": MapPattern(Str(), Any(), minimum_keys=1),
-            Optional("patches"): MapPattern(Str(), Seq(Any()), minimum_keys=1),
-        }
-    )
 
-    with open(args.path, encoding="utf-8") as f:
+def lint(path):
+    annotations = []
+    with open(path, encoding="utf-8") as f:
         content = f.read()
 
     try:
-        parsed = load(content, schema)
+        parsed = load(content, SCHEMA)
     except YAMLValidationError as error:
-        pretty_print_yaml_validate_error(args, error) # Error when "source" is missing or when "patches" has no versions
-        return
+        annotations.append(format_yaml_validate_error(path, error)) # Error when "source" is missing or when "patches" has no versions
+        return annotations
     except BaseException as error:
-        pretty_print_yaml_validate_error(args, error) # YAML could not be parsed
-        return
+        annotations.append(format_yaml_validate_error(path, error)) # YAML could not be parsed
+        return annotations
 
     if "patches" in parsed:
         for version in parsed["patches"]:
             patches = parsed["patches"][version]
             if version not in parsed["sources"]:
-                print(
-                    f"::warning file={args.path},line={patches.start_line},endline={patches.end_line},"
+                annotations.append(
+                    f"::warning file={path},line={patches.start_line},endline={patches.end_line},"
                     f"title=conandata.yml inconsistency"
                     f"::Patch(es) are listed for version `{version}`, but there is source for this version."
                     f" You should either remove `{version}` from the `patches` section, or add it to the"
@@ -73,9 +73,9 @@ def main():
             for i, patch in enumerate(patches):
                 # Individual report errors for each patch object
                 try:
-                    parsed["patches"][version][i].revalidate(patch_fields)
+                    parsed["patches"][version][i].revalidate(PATCH_FIELDS)
                 except YAMLValidationError as error:
-                    pretty_print_yaml_validate_warning(args, error) # Warning when patch fields are not followed
+                    annotations.append(format_yaml_validate_warning(path, error)) # Warning when patch fields are not followed
                     continue
 
                 # Make sure `patch_source` exists where it's encouraged
@@ -84,8 +84,8 @@ def main():
                     type in ["official", "bugfix", "vulnerability"]
                     and not "patch_source" in patch
                 ):
-                    print(
-                        f"::warning file={args.path},line={type.start_line},endline={type.end_line},"
+                    annotations.append(
+                        f"::warning file={path},line={type.start_line},endline={type.end_line},"
                         f"title=conandata.yml schema warning"
                         f"::'patch_type' should have 'patch_source' as per {CONANDATA_YAML_URL}#patch_type"
                         " it is expected to have a source (e.g. a URL) to where it originates from to help with"
@@ -95,27 +95,29 @@ def main():
                 # v2 migrations suggestion
                 if "base_path" in parsed["patches"][version][i]:
                     base_path = parsed["patches"][version][i]["base_path"]
-                    print(
-                        f"::notice file={args.path},line={base_path.start_line},endline={base_path.end_line},"
+                    annotations.append(
+                        f"::notice file={path},line={base_path.start_line},endline={base_path.end_line},"
                         f"title=conandata.yml v2 migration suggestion"
                         "::'base_path' should not be required once a recipe has been upgraded to take advantage of"
                         " layouts (see https://docs.conan.io/en/latest/reference/conanfile/tools/layout.html) and"
                         " the new helper (see https://docs.conan.io/en/latest/reference/conanfile/tools/files/patches.html#conan-tools-files-apply-conandata-patches)"
                     )
 
+    return annotations
+
 
-def pretty_print_yaml_validate_error(args, error):
+def format_yaml_validate_error(path, error):
     snippet = error.context_mark.get_snippet().replace("\n", "%0A")
-    print(
-        f"::error file={args.path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
+    return (
+        f"::error file={path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
         f"title=conandata.yml schema error"
         f"::Schema outlined in {CONANDATA_YAML_URL}#patches-fields is not followed.%0A%0A{error.problem} in %0A{snippet}%0A"
     )
     
-def pretty_print_yaml_validate_warning(args, error):
+def format_yaml_validate_warning(path, error):
     snippet = error.context_mark.get_snippet().replace("\n", "%0A")
-    print(
-        f"::warning file={args.path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
+    return (
+        f"::warning file={path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
         f"title=conandata.yml schema warning"
         f"::Schema outlined in {CONANDATA_YAML_URL}#patches-fields is not followed.%0A%0A{error.problem} in %0A{snippet}%0A"
     )
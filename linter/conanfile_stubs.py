@@ -0,0 +1,170 @@
+# Generated by linter/generate_conanfile_stubs.py from conan==1.59.0, do not edit.
+#
+# Members Conan injects into ConanFile, loaded by linter/transform_conanfile.py instead of the Conan
+# client modules defining them.
+
+from collections import OrderedDict
+import typing
+
+CONAN_VERSION = "1.59.0"
+
+
+class ConanInfo(object):
+    invalid: typing.Any
+    settings: typing.Any
+    options: typing.Any
+    requires: typing.Any
+    python_requires: typing.Any
+    full_settings: typing.Any
+    full_options: typing.Any
+    full_requires: typing.Any
+    recipe_hash: typing.Any
+    env_values: typing.Any
+
+    def copy(self):
+        ...
+
+    @staticmethod
+    def create(settings, options, prefs_direct, prefs_indirect, default_package_id_mode, python_requires, default_python_requires_id_mode):
+        ...
+
+    @staticmethod
+    def loads(text):
+        ...
+
+    def dumps(self):
+        ...
+
+    def clone(self):
+        ...
+
+    @staticmethod
+    def load_file(conan_info_path):
+        ...
+
+    @staticmethod
+    def load_from_package(package_folder):
+        ...
+
+    def package_id(self):
+        ...
+
+    def serialize_min(self):
+        ...
+
+    def header_only(self):
+        ...
+
+    def clear(self):
+        ...
+
+    def msvc_compatible(self):
+        ...
+
+    def apple_clang_compatible(self):
+        ...
+
+    def vs_toolset_compatible(self):
+        ...
+
+    def vs_toolset_incompatible(self):
+        ...
+
+    def discard_build_settings(self):
+        ...
+
+    def include_build_settings(self):
+        ...
+
+    def default_std_matching(self):
+        ...
+
+    def default_std_non_matching(self):
+        ...
+
+    def shared_library_package_id(self):
+        ...
+
+    def parent_compatible(self, *_, **kwargs):
+        ...
+
+    def base_compatible(self):
+        ...
+
+
+class _RecipeBuildRequires(OrderedDict):
+    _default_context: typing.Any
+
+    def __init__(self, conanfile, default_context):
+        ...
+
+    def add(self, build_require, context, force_host_context=False):
+        ...
+
+    def __call__(self, build_require, force_host_context=False):
+        ...
+
+
+class FileCopier(object):
+    _src_folders: typing.Any
+    _dst_folder: typing.Any
+    _copied: typing.Any
+
+    def __init__(self, source_folders, root_destination_folder):
+        ...
+
+    def report(self, output):
+        ...
+
+    def __call__(self, pattern, dst='', src='', keep_path=True, links=False, symlinks=None, excludes=None, ignore_case=True):
+        ...
+
+    def _copy(self, base_src, pattern, src, dst, symlinks, ignore_case, excludes, keep_path, excluded_folders):
+        ...
+
+    @staticmethod
+    def _filter_files(src, pattern, links, excludes, ignore_case, excluded_folders):
+        ...
+
+    @staticmethod
+    def link_folders(src, dst, linked_folders):
+        ...
+
+    @staticmethod
+    def _copy_files(files, src, dst, keep_path, symlinks):
+        ...
+
+
+class _FileImporter(object):
+    _conanfile: typing.Any
+    _dst_folder: typing.Any
+    copied_files: typing.Any
+
+    def __init__(self, conanfile, dst_folder):
+        ...
+
+    def __call__(self, pattern, dst='', src='', root_package=None, folder=False, ignore_case=True, excludes=None, keep_path=True):
+        ...
+
+
+class PyRequires(object):
+    _pyrequires: typing.Any
+    _transitive: typing.Any
+
+    def __init__(self):
+        ...
+
+    def update_transitive(self, conanfile):
+        ...
+
+    def all_items(self):
+        ...
+
+    def all_refs(self):
+        ...
+
+    def items(self):
+        ...
+
+    def __getitem__(self, item):
+        ...
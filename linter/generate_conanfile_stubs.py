@@ -0,0 +1,147 @@
+"""
+Generates `linter/conanfile_stubs.py`, the description of the members Conan injects into ConanFile.
+
+The stubs are generated from the Conan client installed in the current environment, run it again whenever the version
+of Conan in `.c3i/config_v1.yml` changes:
+
+    pip install conan==<version>
+    python3 linter/generate_conanfile_stubs.py
+"""
+
+import argparse
+import ast
+import importlib
+import inspect
+import os
+import textwrap
+
+
+STUBS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conanfile_stubs.py")
+
+# Classes whose instances are injected to ConanFile, see linter/transform_conanfile.py
+STUBBED_CLASSES = [
+    ("conans.model.info", "ConanInfo"),
+    ("conans.client.graph.graph_manager", "_RecipeBuildRequires"),
+    ("conans.client.file_copier", "FileCopier"),
+    ("conans.client.importer", "_FileImporter"),
+    ("conans.client.graph.python_requires", "PyRequires"),
+]
+
+# Bases which are kept as they are, astroid knows them without parsing Conan
+KNOWN_BASES = {
+    "builtins": None,
+    "collections": "from collections import {name}",
+}
+
+
+def _instance_attributes(klass):
+    """ Attributes assigned to `self`, or to the result of `cls()`/`Klass()` in factory methods """
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(klass)))
+    except (OSError, TypeError):
+        return []
+    attributes = []
+    for function in ast.walk(tree):
+        if not isinstance(function, ast.FunctionDef):
+            continue
+        instances = {"self"}
+        for node in ast.walk(function):
+            if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call) and \
+               isinstance(node.value.func, ast.Name) and node.value.func.id in ("cls", klass.__name__):
+                instances.update(it.id for it in node.targets if isinstance(it, ast.Name))
+        for node in ast.walk(function):
+            targets = node.targets if isinstance(node, ast.Assign) else \
+                [node.target] if isinstance(node, (ast.AugAssign, ast.AnnAssign)) else []
+            for target in targets:
+                if isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) and \
+                   target.value.id in instances and target.attr not in attributes:
+                    attributes.append(target.attr)
+    return attributes
+
+
+def _signature(function):
+    try:
+        signature = inspect.signature(function)
+    except (TypeError, ValueError):
+        return "(self, *args, **kwargs)"
+    # Only literal defaults are kept, anything else would need imports from Conan
+    parameters = [parameter.replace(default=None)
+                  if parameter.default is not parameter.empty and
+                  not isinstance(parameter.default, (type(None), bool, int, float, str)) else parameter
+                  for parameter in signature.parameters.values()]
+    return str(signature.replace(parameters=parameters, return_annotation=signature.empty))
+
+
+def _class_stub(klass, imports, emitted):
+    """ Source of the stub of a class, preceded by the stubs of its bases defined by Conan """
+    sources = []
+    bases = []
+    for base in klass.__bases__:
+        module = base.__module__.split(".")[0]
+        if module in KNOWN_BASES:
+            if KNOWN_BASES[module]:
+                imports.add(KNOWN_BASES[module].format(name=base.__name__))
+            bases.append(base.__name__)
+        else:
+            if base.__name__ not in emitted:
+                sources.append(_class_stub(base, imports, emitted))
+            bases.append(base.__name__)
+    emitted.add(klass.__name__)
+
+    attributes = [name for name in _instance_attributes(klass) if name not in klass.__dict__]
+    body = []
+    for name, member in klass.__dict__.items():
+        if name.startswith("__") and name not in ("__init__", "__call__", "__getitem__", "__iter__", "__len__",
+                                                  "__contains__"):
+            continue
+        if isinstance(member, staticmethod):
+            body.append(f"@staticmethod\ndef {name}{_signature(member.__func__)}:\n    ...")
+        elif isinstance(member, classmethod):
+            body.append(f"@classmethod\ndef {name}{_signature(member.__func__)}:\n    ...")
+        elif isinstance(member, property):
+            body.append(f"@property\ndef {name}(self):\n    ...")
+        elif inspect.isfunction(member):
+            body.append(f"def {name}{_signature(member)}:\n    ...")
+        elif not name.startswith("__"):
+            attributes.append(name)
+
+    members = []
+    if attributes:
+        members.append("\n".join(f"{name}: typing.Any" for name in attributes))
+    members.extend(body)
+    source = f"class {klass.__name__}({', '.join(bases)}):\n"
+    source += textwrap.indent("\n\n".join(members) if members else "pass", "    ")
+    sources.append(source)
+    return "\n\n\n".join(sources)
+
+
+def generate():
+    import conans
+
+    imports = {"import typing"}
+    emitted = set()
+    classes = []
+    for module_name, class_name in STUBBED_CLASSES:
+        klass = getattr(importlib.import_module(module_name), class_name)
+        classes.append(_class_stub(klass, imports, emitted))
+
+    header = textwrap.dedent(f'''\
+        # Generated by linter/generate_conanfile_stubs.py from conan=={conans.__version__}, do not edit.
+        #
+        # Members Conan injects into ConanFile, loaded by linter/transform_conanfile.py instead of the Conan
+        # client modules defining them.
+        ''')
+    return header + "\n" + "\n".join(sorted(imports)) + "\n\n" + \
+        f'CONAN_VERSION = "{conans.__version__}"\n\n\n' + "\n\n\n".join(classes) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the ConanFile stubs used by the linter.")
+    parser.add_argument("--output", default=STUBS_FILE, help="file to write.")
+    args = parser.parse_args()
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(generate())
+
+
+if __name__ == "__main__":
+    main()
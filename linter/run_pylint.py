@@ -0,0 +1,159 @@
+"""
+Runs pylint over many recipes, skipping the files which did not change since the previous run.
+
+Results are cached per file, keyed by the content of the file and of the modules next to it (e.g. a recipe's
+helpers.py), the pylintrc, the sources of the linter plugins and the versions of Python, pylint, astroid and Conan. Files to lint are sharded across several pylint processes.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+LINTER_FOLDER = os.path.dirname(os.path.abspath(__file__))
+REPOSITORY_ROOT = os.path.dirname(LINTER_FOLDER)
+
+# Same template as pylint's 'parseable' output, expected by linter/recipe_linter.json
+PARSEABLE_TEMPLATE = "{path}:{line}: [{message-id}({symbol}), {obj}] {message}"
+
+# Bits of pylint's exit code
+EXIT_CODES = {"fatal": 1, "error": 2, "warning": 4, "refactor": 8, "convention": 16}
+
+
+def _sha256(*contents):
+    sha = hashlib.sha256()
+    for content in contents:
+        sha.update(content)
+    return sha.hexdigest()
+
+
+def _read(filename):
+    with open(filename, "rb") as f:
+        return f.read()
+
+
+def _conan_version():
+    try:
+        from conans import __version__
+    except ImportError:
+        return "none"
+    return __version__
+
+
+def linter_key(rcfile):
+    """ Anything that changes the messages of a file with the same content """
+    import astroid
+    import pylint
+    plugins = sorted(os.path.join(LINTER_FOLDER, it) for it in os.listdir(LINTER_FOLDER) if it.endswith(".py"))
+    versions = f"python={sys.version}\npylint={pylint.__version__}\nastroid={astroid.__version__}\n" \
+               f"conan={_conan_version()}\n"
+    return _sha256(versions.encode(), _read(rcfile), *[_read(it) for it in plugins])
+
+
+def file_key(path):
+    """ Content of the file and of the modules it can import from its own folder """
+    folder = os.path.dirname(os.path.abspath(path))
+    modules = sorted(os.path.join(folder, it) for it in os.listdir(folder)
+                     if it.endswith(".py") and it != os.path.basename(path))
+    contents = [_read(path)]
+    for module in modules:
+        contents += [os.path.basename(module).encode(), _read(module)]
+    return _sha256(*contents)
+
+
+def collect_files(paths, test_packages):
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(path)
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+            in_test_package = os.path.basename(root).startswith("test_")
+            if "conanfile.py" in names and in_test_package == test_packages:
+                files.append(os.path.join(root, "conanfile.py"))
+    return files
+
+
+def _run_pylint(rcfile, files):
+    env = os.environ.copy()
+    # The plugins are loaded as 'linter.<module>'
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPOSITORY_ROOT, env.get("PYTHONPATH")]))
+    process = subprocess.run([sys.executable, "-m", "pylint", f"--rcfile={rcfile}", "--output-format=json",
+                              "--exit-zero", *files], stdout=subprocess.PIPE, env=env, check=True, text=True)
+    messages = {path: [] for path in files}
+    # pylint reports paths relative to the working directory
+    paths = {os.path.abspath(path): path for path in files}
+    for message in json.loads(process.stdout or "[]"):
+        path = paths.get(os.path.abspath(message["path"]), message["path"])
+        messages.setdefault(path, []).append(message)
+    return messages
+
+
+def _shards(files, jobs):
+    jobs = max(1, min(jobs, len(files)))
+    return [files[i::jobs] for i in range(jobs)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run pylint over recipes, only on the files that changed.")
+    parser.add_argument("paths", nargs="+", help="conanfile.py files, or folders to search for them.")
+    parser.add_argument("--rcfile", default=os.path.join(LINTER_FOLDER, "pylintrc_recipe"), help="pylintrc to use.")
+    parser.add_argument("--test-packages", action="store_true",
+                        help="search folders for the conanfile.py of test packages instead of recipes.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of pylint processes, files are sharded across them.")
+    parser.add_argument("--cache-dir", default=".pylint_cache", help="folder keeping the results of linted files.")
+    parser.add_argument("--no-cache", action="store_true", help="lint every file, even if it did not change.")
+    parser.add_argument("--output-format", choices=["parseable", "json"], default="parseable",
+                        help="'parseable' is the format expected by linter/recipe_linter.json.")
+    args = parser.parse_args()
+
+    files = collect_files(args.paths, args.test_packages)
+    key = linter_key(args.rcfile)
+    cache_path = os.path.join(args.cache_dir, f"{os.path.basename(args.rcfile)}.json")
+
+    cache = {}
+    if not args.no_cache:
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if cache.get("key") != key:
+            cache = {}
+    results = cache.get("results", {})
+
+    hashes = {path: file_key(path) for path in files}
+    pending = [path for path in files if results.get(path, {}).get("sha256") != hashes[path]]
+    if pending:
+        # pylint does the heavy lifting in its own processes, threads are enough to wait for them
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            for messages in executor.map(lambda shard: _run_pylint(args.rcfile, shard), _shards(pending, args.jobs)):
+                for path, found in messages.items():
+                    results[path] = {"sha256": hashes.get(path), "messages": found}
+
+    messages = [message for path in files for message in results[path]["messages"]]
+    if args.output_format == "json":
+        print(json.dumps(messages, indent=4))
+    else:
+        for message in messages:
+            print(PARSEABLE_TEMPLATE.format(**message))
+
+    if not args.no_cache:
+        os.makedirs(args.cache_dir, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "results": results}, f)
+
+    exit_code = 0
+    for message in messages:
+        exit_code |= EXIT_CODES.get(message["type"], 0)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 # Class ConanFile doesn't declare all the valid members and functions,
 #   some are injected by Conan dynamically to the class.
 
+import os
 import textwrap
 import astroid
 from astroid.builder import AstroidBuilder
@@ -30,6 +31,15 @@ def _user_info_build_transform():
     return module['UserInfoBuild']
 
 
+# Generated from the Conan client by linter/generate_conanfile_stubs.py, parsing it is much faster than parsing
+#   the Conan modules defining these classes
+_STUBS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conanfile_stubs.py")
+
+
+def _stubs_module():
+    return astroid.MANAGER.ast_from_file(_STUBS_FILE, modname="linter.conanfile_stubs")
+
+
 def register(_):
     pass
 
@@ -38,16 +48,12 @@ def transform_conanfile(node):
 
     str_class = astroid.builtin_lookup("str")
     dict_class = astroid.builtin_lookup("dict")
-    info_class = astroid.MANAGER.ast_from_module_name("conans.model.info").lookup(
-        "ConanInfo")
-    build_requires_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.graph.graph_manager").lookup("_RecipeBuildRequires")
-    file_copier_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.file_copier").lookup("FileCopier")
-    file_importer_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.importer").lookup("_FileImporter")
-    python_requires_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.graph.python_requires").lookup("PyRequires")
+    stubs = _stubs_module()
+    info_class = stubs.lookup("ConanInfo")
+    build_requires_class = stubs.lookup("_RecipeBuildRequires")
+    file_copier_class = stubs.lookup("FileCopier")
+    file_importer_class = stubs.lookup("_FileImporter")
+    python_requires_class = stubs.lookup("PyRequires")
 
     dynamic_fields = {
         "conan_data": str_class,
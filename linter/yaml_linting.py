@@ -1,4 +1,8 @@
 import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 
 def file_path(a_string):
@@ -7,3 +11,108 @@ def file_path(a_string):
     if not isfile(a_string):
         raise argparse.ArgumentTypeError(f"{a_string} does not point to a file")
     return a_string
+
+
+def file_or_dir_path(a_string):
+    if not os.path.isfile(a_string) and not os.path.isdir(a_string):
+        raise argparse.ArgumentTypeError(f"{a_string} does not point to a file or a directory")
+    return a_string
+
+
+def add_batch_arguments(parser, filename):
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=file_or_dir_path,
+        help=f"files to validate, directories are searched for '{filename}' files.",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes validating files in parallel.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".yaml_linter_cache",
+        help="folder keeping the results of already validated files.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="validate every file, even if its content did not change.",
+    )
+
+
+def collect_files(paths, filename):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                files.extend(os.path.join(root, it) for it in sorted(names) if it == filename)
+        else:
+            files.append(path)
+    return files
+
+
+def _sha256(*filenames):
+    sha = hashlib.sha256()
+    for filename in filenames:
+        with open(filename, "rb") as f:
+            sha.update(f.read())
+    return sha.hexdigest()
+
+
+def _lint_one(lint, path):
+    return path, _sha256(path), lint(path)
+
+
+def lint_files(lint, linter_file, args, filename):
+    """ Runs `lint(path) -> list of annotations` on all the files and prints the annotations in order.
+
+    Annotations of a file whose content did not change since the last run are taken from the cache, the cache is
+    dropped whenever the linter itself changes.
+    """
+    files = collect_files(args.paths, filename)
+    linter_sha = _sha256(linter_file, __file__)
+    cache_path = os.path.join(args.cache_dir, f"{os.path.splitext(os.path.basename(linter_file))[0]}.json")
+
+    cache = {}
+    if not args.no_cache:
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if cache.get("linter") != linter_sha:
+            cache = {}
+    results = cache.get("results", {})
+
+    annotations = {}
+    pending = []
+    for path in files:
+        cached = results.get(path)
+        if cached and cached["sha256"] == _sha256(path):
+            annotations[path] = cached["annotations"]
+        else:
+            pending.append(path)
+
+    if len(pending) > 1 and args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            chunksize = max(1, len(pending) // (args.jobs * 4))
+            done = list(executor.map(_lint_one, [lint] * len(pending), pending, chunksize=chunksize))
+    else:
+        done = [_lint_one(lint, path) for path in pending]
+    for path, sha256, found in done:
+        annotations[path] = found
+        results[path] = {"sha256": sha256, "annotations": found}
+
+    for path in files:
+        for annotation in annotations[path]:
+            print(annotation)
+
+    if not args.no_cache:
+        os.makedirs(args.cache_dir, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"linter": linter_sha, "results": results}, f)
@@ -14,12 +14,12 @@ from conan.tools.scm import Version
 
 import glob
 from io import StringIO
+import json
 import os
 import re
 import shlex
 import shutil
 import sys
-import yaml
 
 required_conan_version = ">=1.53.0"
 
@@ -107,6 +107,7 @@ class BoostConan(ConanFile):
         "buildid": [None, "ANY"],
         "python_buildid": [None, "ANY"],
         "system_use_utf8": [True, False],
+        "libraries": [None, "ANY"],  # comma separated without_* names (e.g. "filesystem,json"), only their dependency closure is built
     }
     options.update({f"without_{_name}": [True, False] for _name in CONFIGURE_OPTIONS})
 
@@ -146,6 +147,7 @@ class BoostConan(ConanFile):
         "buildid": None,
         "python_buildid": None,
         "system_use_utf8": False,
+        "libraries": None,
     }
     default_options.update({f"without_{_name}": False for _name in CONFIGURE_OPTIONS})
     default_options.update({f"without_{_name}": True for _name in ("graph_parallel", "mpi", "python")})
@@ -153,6 +155,7 @@ class BoostConan(ConanFile):
     short_paths = True
     no_copy_source = True
     _cached_dependencies = None
+    _without_defaults = None
 
     def export(self):
         copy(self, f"dependencies/{self._dependency_filename}", src=self.recipe_folder, dst=self.export_folder)
@@ -185,7 +188,8 @@ class BoostConan(ConanFile):
 
     @property
     def _dependency_filename(self):
-        return f"dependencies-{self.version}.yml"
+        # Compiled from dependencies-x.y.z.yml by rebuild-dependencies.py, with the transitive closures expanded
+        return f"dependencies-{self.version}.json"
 
     @property
     def _dependencies(self):
@@ -194,34 +198,27 @@ class BoostConan(ConanFile):
             if not os.path.isfile(dependencies_filepath):
                 raise ConanException(f"Cannot find {dependencies_filepath}")
             with open(dependencies_filepath, encoding='utf-8') as f:
-                self._cached_dependencies = yaml.safe_load(f)
+                self._cached_dependencies = json.load(f)
         return self._cached_dependencies
 
     def _all_dependent_modules(self, name):
-        dependencies = {name}
-        while True:
-            new_dependencies = set()
-            for dependency in dependencies:
-                new_dependencies.update(set(self._dependencies["dependencies"][dependency]))
-                new_dependencies.update(dependencies)
-            if len(new_dependencies) > len(dependencies):
-                dependencies = new_dependencies
-            else:
-                break
-        return dependencies
+        return set(self._dependencies["dependent_modules"][name])
+
+    @property
+    def _requested_libraries(self):
+        return [library.strip() for library in str(self.options.libraries).split(",") if library.strip()]
+
+    @property
+    def _requested_libraries_closure(self):
+        # The requested libraries and the libraries they depend on
+        closure = set()
+        for library in self._requested_libraries:
+            if library in self._dependencies["dependencies"]:
+                closure.update(self._all_dependent_modules(library))
+        return closure
 
     def _all_super_modules(self, name):
-        dependencies = {name}
-        while True:
-            new_dependencies = set(dependencies)
-            for module in self._dependencies["dependencies"]:
-                if dependencies.intersection(set(self._dependencies["dependencies"][module])):
-                    new_dependencies.add(module)
-            if len(new_dependencies) > len(dependencies):
-                dependencies = new_dependencies
-            else:
-                break
-        return dependencies
+        return set(self._dependencies["super_modules"][name])
 
     @property
     def _bcp_dir(self):
@@ -369,6 +366,10 @@ class BoostConan(ConanFile):
                 elif Version(self.settings.compiler.version) < min_compiler_version:
                     disable_locale()
 
+        # Values of without_* before the user ones are applied, configure() must not override explicit values
+        self._without_defaults = {opt_name: bool(getattr(self.options, f"without_{opt_name}"))
+                                  for opt_name in self._configure_options}
+
     @property
     def _configure_options(self):
         return self._dependencies["configure_options"]
@@ -392,9 +393,23 @@ class BoostConan(ConanFile):
         if self.options.header_only:
             self.options.rm_safe("shared")
             self.options.rm_safe("fPIC")
+            self.options.rm_safe("libraries")
         elif self.options.shared:
             self.options.rm_safe("fPIC")
 
+        if self.options.get_safe("libraries"):
+            # Build only the requested libraries and the libraries they depend on. without_* values differing from
+            # their default, and the ones config_options() disabled for the compiler, are kept: validate() rejects
+            # the contradictions. An explicit value equal to the default (e.g. without_filesystem=False) can't be
+            # told apart from the default, so it is overridden like any other.
+            closure = self._requested_libraries_closure
+            self.output.info(f"libraries={self.options.libraries}: building {', '.join(sorted(closure & set(self._configure_options)))}")
+            for opt_name in self._configure_options:
+                default = self._without_defaults[opt_name]
+                explicit = bool(getattr(self.options, f"without_{opt_name}")) != default
+                if not explicit and default == self.default_options[f"without_{opt_name}"]:
+                    setattr(self.options, f"without_{opt_name}", opt_name not in closure)
+
         if self.options.i18n_backend != "deprecated":
             self.output.warning("i18n_backend option is deprecated, do not use anymore.")
             if self.options.i18n_backend == "iconv":
@@ -454,6 +469,23 @@ class BoostConan(ConanFile):
                 if not self.options.get_safe(f"without_{lib}"):
                     raise ConanInvalidConfiguration(f"Boost '{lib}' library requires multi threading")
 
+        if self.options.get_safe("libraries"):
+            # Only names with a without_* option can be requested, not the modules they contain (e.g. log_setup)
+            unknown_libraries = [library for library in self._requested_libraries
+                                 if library not in self._configure_options]
+            if unknown_libraries:
+                raise ConanInvalidConfiguration(
+                    f"Unknown Boost libraries requested: {', '.join(unknown_libraries)} "
+                    f"(use the names of the without_* options: {', '.join(self._configure_options)})")
+            closure = self._requested_libraries_closure
+            contradictions = [f"without_{opt_name}={self.options.get_safe(f'without_{opt_name}')}"
+                              for opt_name in self._configure_options
+                              if bool(self.options.get_safe(f"without_{opt_name}")) == (opt_name in closure)]
+            if contradictions:
+                raise ConanInvalidConfiguration(
+                    f"libraries={self.options.libraries} contradicts {', '.join(contradictions)} "
+                    "(set explicitly, or the default for this compiler and C++ standard)")
+
         if is_msvc(self) and self._shared and is_msvc_static_runtime(self):
             raise ConanInvalidConfiguration("Boost can not be built as shared library with MT runtime.")
 
@@ -553,6 +585,7 @@ class BoostConan(ConanFile):
             self.info.clear()
         else:
             del self.info.options.debug_level
+            del self.info.options.libraries  # already expressed by the without_* options
             del self.info.options.filesystem_version
             del self.info.options.pch
             del self.info.options.python_executable  # PATH to the interpreter is not important, only version matters
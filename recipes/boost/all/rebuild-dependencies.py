@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 
 import argparse
+from concurrent.futures import as_completed, ProcessPoolExecutor
 import dataclasses
+import hashlib
 from pathlib import Path
 import re
 import subprocess
 import tempfile
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from conans import tools
 import logging
@@ -87,6 +89,38 @@ WINDOWS_SYSTEM_LIBS = (
 )
 
 
+def compile_dependencies(data: Dict) -> Dict:
+    """
+    Add the transitive closures of the dependency tree to the data of a dependencies-x.y.z.yml file.
+    conanfile.py loads the result, so it needs neither PyYAML nor graph walks when resolving a graph.
+    """
+    tree = data["dependencies"]
+    closures = {}
+
+    def closure(module: str) -> Set[str]:
+        if module not in closures:
+            modules = {module}
+            for dependency in tree.get(module, []):
+                modules.update(closure(dependency))
+            closures[module] = modules
+        return closures[module]
+
+    for module in tree:
+        closure(module)
+
+    compiled = dict(data)
+    compiled["dependent_modules"] = {module: sorted(modules) for module, modules in sorted(closures.items())}
+    compiled["super_modules"] = {module: sorted(super_module for super_module, modules in closures.items() if module in modules)
+                                 for module in sorted(closures)}
+    return compiled
+
+
+def write_compiled_dependencies(data: Dict, path: Path) -> None:
+    with path.open("w") as fout:
+        json.dump(compile_dependencies(data), fout, sort_keys=True, separators=(",", ":"))
+        fout.write("\n")
+
+
 @dataclasses.dataclass
 class BoostDependenciesExport(object):
     version: str
@@ -104,17 +138,25 @@ class BoostDependencies(object):
 
 
 class BoostDependencyBuilder(object):
-    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool):
+    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool,
+                 boost_path: Optional[Path] = None, boostdep_path: Optional[Path] = None):
         self.boost_version = boost_version
         self.boostdep_version = boostdep_version
         self.git_url = git_url
         self.tmppath = tmppath
         self.outputdir = outputdir
         self.unsafe = unsafe
+        self._boost_path = boost_path
+        self._boostdep_path = boostdep_path
 
     @property
     def boost_path(self) -> Path:
-        return self.tmppath / "boost"
+        return self._boost_path or self.tmppath / "boost"
+
+    @property
+    def boostdep_path(self) -> Path:
+        """ Folder where boostdep is installed by conan """
+        return self._boostdep_path or self.boost_path
 
     def do_git_update(self) -> None:
         if not self.boost_path.exists():
@@ -155,14 +197,24 @@ class BoostDependencyBuilder(object):
             print("Removing unknown files/directories")
             subprocess.check_call(["git", "clean", "-d", "-f"])
 
-    def do_install_boostdep(self):
+    def do_git_worktree_submodule_update(self):
+        """ Checkout the submodules of a worktree created by BoostWorktrees, it is already at the right version """
         with tools.chdir(str(self.boost_path)):
+            print("[{}] Updating git submodules".format(self.boost_version))
+            # a local mirror is reached through the file protocol, which git disallows for submodules by default
+            subprocess.check_call(["git", "-c", "protocol.file.allow=always", "submodule", "update", "--force"])
+
+            print("[{}] Removing unknown files/directories".format(self.boost_version))
+            subprocess.check_call(["git", "clean", "-d", "-f"])
+
+    def do_install_boostdep(self):
+        with tools.chdir(str(self.boostdep_path)):
             print("Installing boostdep/{}".format(self.boostdep_version))
             subprocess.check_call(["conan", "install", "boostdep/{}@".format(self.boostdep_version), "-g", "json"])
 
     @property
     def _bin_paths(self):
-        with tools.chdir(str(self.boost_path)):
+        with tools.chdir(str(self.boostdep_path)):
             data = json.loads(open("conanbuildinfo.json").read())
             return data["dependencies"][0]["bin_paths"]
 
@@ -396,6 +448,10 @@ class BoostDependencyBuilder(object):
     def _outputpath(self) -> Path:
         return self.outputdir / "dependencies-{}.yml".format(self.boost_version)
 
+    @property
+    def _compiled_outputpath(self) -> Path:
+        return self.outputdir / "dependencies-{}.json".format(self.boost_version)
+
     @classmethod
     def _sort_item(cls, item):
         if isinstance(item, dict):
@@ -426,17 +482,164 @@ class BoostDependencyBuilder(object):
         print("Creating {}".format(self.outputdir))
         with self._outputpath.open("w") as fout:
             yaml.dump(data, fout)
+        write_compiled_dependencies(data, self._compiled_outputpath)
+
+
+class BoostWorktrees(object):
+    """
+    A bare clone of boost, shared by one git worktree per boost version.
+    Used by the parallel mode (-j): the worktrees are independent, so the versions can be processed concurrently.
+    """
+    def __init__(self, tmppath: Path, git_url: str):
+        self.tmppath = tmppath
+        self.git_url = git_url
+
+    @property
+    def bare_path(self) -> Path:
+        return self.tmppath / "boost.git"
+
+    def worktree_path(self, boost_version: str) -> Path:
+        return self.tmppath / "boost-worktrees" / boost_version
+
+    def _git(self, *args: str) -> str:
+        return subprocess.check_output(["git", "--git-dir", str(self.bare_path)] + list(args), text=True).strip()
+
+    def do_git_update(self) -> None:
+        if not self.bare_path.exists():
+            print("Cloning boost git (bare)")
+            subprocess.check_call(["git", "clone", "--mirror", "--", self.git_url, str(self.bare_path)])
+        else:
+            print("Updating bare git repo")
+            subprocess.check_call(["git", "--git-dir", str(self.bare_path), "fetch", "--prune", "origin"])
+
+    def tag_hash(self, boost_version: str) -> str:
+        try:
+            return self._git("rev-parse", "--verify", "boost-{}^{{commit}}".format(boost_version))
+        except subprocess.CalledProcessError:
+            print("version {} does not exist".format(boost_version))
+            raise
+
+    def do_add_worktree(self, boost_version: str) -> Path:
+        path = self.worktree_path(boost_version)
+        tag = "boost-{}".format(boost_version)
+        if path.exists():
+            print("[{}] Resetting worktree {}".format(boost_version, path))
+            subprocess.check_call(["git", "checkout", "--force", "--detach", tag], cwd=str(path))
+        else:
+            print("[{}] Adding worktree {}".format(boost_version, path))
+            self._git("worktree", "prune")
+            self._git("worktree", "add", "--force", "--detach", str(path), tag)
+        # the worktrees share the configuration of the bare repository: register the submodules from here,
+        # concurrent `git submodule init` would fight over its lock
+        subprocess.check_call(["git", "submodule", "--quiet", "init"], cwd=str(path))
+        return path
+
+
+class RebuildCache(object):
+    """
+    Inputs of the last successful run for each version: the files of a version are regenerated only when the
+    boost tag, this script or the boostdep version changed.
+    """
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries = json.loads(path.read_text()) if path.is_file() else {}
+
+    @staticmethod
+    def key(tag_hash: str, boostdep_version: str) -> Dict[str, str]:
+        return {
+            "tag": tag_hash,
+            "script": hashlib.sha256(Path(__file__).read_bytes()).hexdigest(),
+            "boostdep": boostdep_version,
+        }
+
+    def is_up_to_date(self, boost_version: str, key: Dict[str, str], outputs: List[Path]) -> bool:
+        return self.entries.get(boost_version) == key and all(output.is_file() for output in outputs)
+
+    def update(self, boost_version: str, key: Dict[str, str]) -> None:
+        self.entries[boost_version] = key
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True))
+
+
+def _rebuild_worktree(builder_kwargs: Dict) -> None:
+    boost_collector = BoostDependencyBuilder(**builder_kwargs)
+    boost_collector.do_git_worktree_submodule_update()
+    boost_collector.do_create_dependency_file()
+
+
+def rebuild_parallel(ns: argparse.Namespace, boost_versions: List[str]) -> int:
+    worktrees = BoostWorktrees(tmppath=ns.tmppath, git_url=ns.git_url)
+    if ns.git_update:
+        worktrees.do_git_update()
+    elif not worktrees.bare_path.exists():
+        log.error("Boost bare repository does not exist. Re-execute this script with -U to clone it.")
+        return 1
+
+    cache = RebuildCache(ns.tmppath / "boost-dependencies-cache.json")
+    outdated = {}
+    for boost_version in boost_versions:
+        key = cache.key(worktrees.tag_hash(boost_version), ns.boostdep_version)
+        outputs = [ns.outputdir / "dependencies-{}.{}".format(boost_version, ext) for ext in ("yml", "json")]
+        if not ns.force and cache.is_up_to_date(boost_version, key, outputs):
+            print("Skipping {}: unchanged since the last run".format(boost_version))
+            continue
+        # git locks the bare repository when adding a worktree: add them one by one, before starting the pool
+        outdated[boost_version] = (key, worktrees.do_add_worktree(boost_version))
+
+    if not outdated:
+        return 0
+
+    boostdep_path = ns.tmppath / "boostdep-{}".format(ns.boostdep_version)
+    boostdep_path.mkdir(exist_ok=True)
+    builder_kwargs = {
+        "boostdep_version": ns.boostdep_version,
+        "git_url": ns.git_url,
+        "outputdir": ns.outputdir,
+        "tmppath": ns.tmppath,
+        "unsafe": ns.unsafe,
+        "boostdep_path": boostdep_path,
+    }
+    BoostDependencyBuilder(boost_version=next(iter(outdated)), **builder_kwargs).do_install_boostdep()
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=ns.jobs) as executor:
+        futures = {
+            executor.submit(_rebuild_worktree, dict(builder_kwargs, boost_version=boost_version, boost_path=path)): boost_version
+            for boost_version, (_, path) in outdated.items()
+        }
+        for future in as_completed(futures):
+            boost_version = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                log.error("Failed to create the dependencies of %s: %s", boost_version, e)
+                failed.append(boost_version)
+                continue
+            print("Finished {}".format(boost_version))
+            if not ns.unsafe:
+                cache.update(boost_version, outdated[boost_version][0])
+
+    if failed:
+        log.error("Failed versions: %s", ", ".join(sorted(failed)))
+        return 1
+    return 0
 
 
 def main(args=None) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--verbose", dest="verbose", action="store_true", help="verbose output")
-    parser.add_argument("-t", dest="tmppath", help="temporary folder where to clone boost (default is system temporary folder)")
+    parser.add_argument("-t", dest="tmppath", type=Path, help="temporary folder where to clone boost (default is system temporary folder)")
     parser.add_argument("-d", dest="boostdep_version", default="1.75.0", type=str, help="boostdep version")
-    parser.add_argument("-u", dest="git_url", default=BOOST_GIT_URL, help="boost git url")
+    parser.add_argument("-u", dest="git_url", default=BOOST_GIT_URL,
+                        help="boost git url, or path to a local mirror of boostorg (submodules are found next to it)")
     parser.add_argument("-U", dest="git_update", action="store_true", help="update the git repo")
     parser.add_argument("-o", dest="outputdir", default=None, type=Path, help="output dependency dir")
     parser.add_argument("-x", dest="unsafe", action="store_true", help="unsafe fast(er) operation")
+    parser.add_argument("-j", dest="jobs", type=int, default=None,
+                        help="process the versions in parallel with this many jobs, from a bare clone with one worktree per version")
+    parser.add_argument("-f", dest="force", action="store_true",
+                        help="with -j, also process the versions unchanged since the last run")
+    parser.add_argument("-c", dest="compile_only", action="store_true",
+                        help="only regenerate the dependencies-x.y.z.json files from the existing yml files")
 
     version_group = parser.add_mutually_exclusive_group(required=True)
     version_group.add_argument("-v", dest="boost_version", help="boost version")
@@ -455,6 +658,7 @@ def main(args=None) -> int:
     print("Dependencies folder is {}".format(ns.outputdir))
 
     ns.outputdir.mkdir(exist_ok=True)
+    ns.outputdir = ns.outputdir.resolve()
 
     git_update_done = False
 
@@ -464,6 +668,17 @@ def main(args=None) -> int:
     else:
         boost_versions = [ns.boost_version]
 
+    if ns.compile_only:
+        for boost_version in boost_versions:
+            ymlpath = ns.outputdir / "dependencies-{}.yml".format(boost_version)
+            print("Compiling {}".format(ymlpath))
+            write_compiled_dependencies(yaml.safe_load(ymlpath.open()),
+                                        ns.outputdir / "dependencies-{}.json".format(boost_version))
+        return 0
+
+    if ns.jobs:
+        return rebuild_parallel(ns, boost_versions)
+
     for boost_version in boost_versions:
         print("Starting {}".format(boost_version))
         boost_collector = BoostDependencyBuilder(
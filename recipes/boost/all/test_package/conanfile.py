@@ -16,6 +16,15 @@ class TestPackageConan(ConanFile):
         except (AttributeError, ConanException):
             return default
 
+    def _check_requested_libraries(self):
+        # With boost:libraries, only the requested libraries and their dependencies are built (and tested below)
+        libraries = str(self._boost_option("libraries", None))
+        if libraries == "None":
+            return
+        for library in filter(None, (it.strip() for it in libraries.split(","))):
+            if self._boost_option(f"without_{library}", True):
+                raise ConanException(f"boost:libraries={libraries} but Boost.{library} was not built")
+
     def layout(self):
         cmake_layout(self)
 
@@ -23,6 +32,7 @@ class TestPackageConan(ConanFile):
         self.requires(self.tested_reference_str)
 
     def generate(self):
+        self._check_requested_libraries()
         tc = CMakeToolchain(self)
         tc.cache_variables["HEADER_ONLY"] = self.dependencies["boost"].options.header_only
         if not self.dependencies["boost"].options.header_only:
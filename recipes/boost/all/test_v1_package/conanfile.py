@@ -13,7 +13,17 @@ class TestPackageConan(ConanFile):
         except (AttributeError, ConanException):
             return default
 
+    def _check_requested_libraries(self):
+        # With boost:libraries, only the requested libraries and their dependencies are built (and tested below)
+        libraries = str(self._boost_option("libraries", None))
+        if libraries == "None":
+            return
+        for library in filter(None, (it.strip() for it in libraries.split(","))):
+            if self._boost_option("without_{}".format(library), True):
+                raise ConanException("boost:libraries={} but Boost.{} was not built".format(libraries, library))
+
     def build(self):
+        self._check_requested_libraries()
         # FIXME: tools.vcvars added for clang-cl. Remove once conan supports clang-cl properly. (https://github.com/conan-io/conan-center-index/pull/1453)
         with tools.vcvars(self.settings) if (self.settings.os == "Windows" and self.settings.compiler == "clang") else tools.no_op():
             cmake = CMake(self)
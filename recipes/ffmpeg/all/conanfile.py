@@ -53,6 +53,8 @@ class FFMpegConan(ConanFile):
         "with_libmp3lame": [True, False],
         "with_libfdk_aac": [True, False],
         "with_libwebp": [True, False],
+        "with_dav1d": [True, False],
+        "with_libsvtav1": [True, False],
         "with_ssl": [False, "openssl", "securetransport"],
         "with_libalsa": [True, False],
         "with_pulse": [True, False],
@@ -130,6 +132,8 @@ class FFMpegConan(ConanFile):
         "with_libmp3lame": True,
         "with_libfdk_aac": True,
         "with_libwebp": True,
+        "with_dav1d": True,
+        "with_libsvtav1": True,
         "with_ssl": "openssl",
         "with_libalsa": True,
         "with_pulse": True,
@@ -216,6 +220,8 @@ class FFMpegConan(ConanFile):
             "with_libmp3lame": ["avcodec"],
             "with_libfdk_aac": ["avcodec"],
             "with_libwebp": ["avcodec"],
+            "with_dav1d": ["avcodec"],
+            "with_libsvtav1": ["avcodec"],
             "with_freetype": ["avfilter"],
             "with_zeromq": ["avfilter", "avformat"],
             "with_libalsa": ["avdevice"],
@@ -244,6 +250,8 @@ class FFMpegConan(ConanFile):
             del self.options.with_avfoundation
         if not self._version_supports_vulkan():
             del self.options.with_vulkan
+        if not self._version_supports_libsvtav1():
+            del self.options.with_libsvtav1
 
     def configure(self):
         if self.options.shared:
@@ -286,6 +294,14 @@ class FFMpegConan(ConanFile):
             self.requires("libfdk_aac/2.0.2")
         if self.options.with_libwebp:
             self.requires("libwebp/1.2.4")
+        if self.options.with_dav1d:
+            # dav1d 1.0.0 replaced n_frame_threads/n_tile_threads, only handled by libavcodec since 5.0
+            if Version(self.version) >= "5.0":
+                self.requires("dav1d/1.0.0")
+            else:
+                self.requires("dav1d/0.9.1")
+        if self.options.get_safe("with_libsvtav1"):
+            self.requires("libsvtav1/1.2.1")
         if self.options.with_ssl == "openssl":
             self.requires("openssl/1.1.1s")
         if self.options.get_safe("with_libalsa"):
@@ -316,6 +332,10 @@ class FFMpegConan(ConanFile):
                 raise ConanInvalidConfiguration("FFmpeg '{}' option requires '{}' option to be enabled".format(
                     dependency, "' or '".join(features)))
 
+        if self.options.get_safe("with_libsvtav1") and not self.options["libsvtav1"].build_encoder:
+            raise ConanInvalidConfiguration(
+                "FFmpeg 'with_libsvtav1' option requires 'libsvtav1:build_encoder=True'")
+
     def build_requirements(self):
         if self.settings.arch in ("x86", "x86_64"):
             self.build_requires("yasm/1.3.0")
@@ -427,6 +447,7 @@ class FFMpegConan(ConanFile):
             opt_enable_disable("libmp3lame", self.options.with_libmp3lame),
             opt_enable_disable("libfdk-aac", self.options.with_libfdk_aac),
             opt_enable_disable("libwebp", self.options.with_libwebp),
+            opt_enable_disable("libdav1d", self.options.with_dav1d),
             opt_enable_disable("openssl", self.options.with_ssl == "openssl"),
             opt_enable_disable("alsa", self.options.get_safe("with_libalsa")),
             opt_enable_disable(
@@ -523,6 +544,9 @@ class FFMpegConan(ConanFile):
         if self._version_supports_vulkan():
             args.append(opt_enable_disable(
                 "vulkan", self.options.get_safe("with_vulkan")))
+        if self._version_supports_libsvtav1():
+            args.append(opt_enable_disable(
+                "libsvtav1", self.options.get_safe("with_libsvtav1")))
         if is_apple_os(self):
             # relocatable shared libs
             args.append("--install-name-dir=@rpath")
@@ -868,6 +892,12 @@ class FFMpegConan(ConanFile):
             if self.options.with_libwebp:
                 self.cpp_info.components["avcodec"].requires.append(
                     "libwebp::libwebp")
+            if self.options.with_dav1d:
+                self.cpp_info.components["avcodec"].requires.append(
+                    "dav1d::dav1d")
+            if self.options.get_safe("with_libsvtav1"):
+                self.cpp_info.components["avcodec"].requires.append(
+                    "libsvtav1::encoder")
             if self.options.get_safe("with_audiotoolbox"):
                 self.cpp_info.components["avcodec"].frameworks.append(
                     "AudioToolbox")
@@ -918,3 +948,6 @@ class FFMpegConan(ConanFile):
 
     def _version_supports_vulkan(self):
         return Version(self.version) >= "4.3.0"
+
+    def _version_supports_libsvtav1(self):
+        return Version(self.version) >= "5.1.0"
@@ -17,6 +17,12 @@ class TestPackageConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
+        ffmpeg_options = self.options["ffmpeg"]
+        decoders_enabled = ffmpeg_options.avcodec and not ffmpeg_options.disable_everything and \
+                           not ffmpeg_options.disable_all_decoders
+        cmake.definitions["FFMPEG_WITH_DAV1D"] = bool(decoders_enabled and ffmpeg_options.with_dav1d)
+        cmake.definitions["FFMPEG_WITH_LIBSVTAV1"] = bool(
+            ffmpeg_options.avcodec and ffmpeg_options.get_safe("with_libsvtav1"))
         cmake.configure()
         cmake.build()
 
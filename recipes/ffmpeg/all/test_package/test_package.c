@@ -17,15 +17,79 @@
 #   include <libswscale/swscale.h>
 #endif
 #include <libavutil/hwcontext.h>
+#include <libavutil/pixdesc.h>
 
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
+
+#ifdef FFMPEG_WITH_DAV1D
+/* 16x16 mid-gray AV1 key frame (temporal delimiter, sequence header and frame OBUs), encoded with libaom */
+static const uint8_t av1_sample[] = {
+    0x12, 0x00, 0x0a, 0x06, 0x18, 0x0c, 0xff, 0xfb, 0x00, 0x80, 0x32,
+    0x09, 0x12, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x40, 0x05,
+};
+
+static int decode_av1_sample(void)
+{
+    const AVCodec *codec = avcodec_find_decoder_by_name("libdav1d");
+    AVCodecContext *context = NULL;
+    AVPacket *packet = NULL;
+    AVFrame *frame = NULL;
+    int decoded = 0;
+
+    if (!codec) {
+        fprintf(stderr, "libdav1d decoder not found\n");
+        return EXIT_FAILURE;
+    }
+    context = avcodec_alloc_context3(codec);
+    packet = av_packet_alloc();
+    frame = av_frame_alloc();
+    if (!context || !packet || !frame || avcodec_open2(context, codec, NULL) < 0 ||
+        av_new_packet(packet, sizeof(av1_sample)) < 0) {
+        fprintf(stderr, "failed to setup the libdav1d decoder\n");
+        return EXIT_FAILURE;
+    }
+    memcpy(packet->data, av1_sample, sizeof(av1_sample));
+
+    if (avcodec_send_packet(context, packet) >= 0 && avcodec_send_packet(context, NULL) >= 0) {
+        while (avcodec_receive_frame(context, frame) >= 0) {
+            printf("libdav1d decoded a %dx%d %s frame, first luma sample %d\n", frame->width, frame->height,
+                   av_get_pix_fmt_name((enum AVPixelFormat)frame->format), frame->data[0][0]);
+            decoded = frame->width == 16 && frame->height == 16 && frame->format == AV_PIX_FMT_YUV420P &&
+                      abs(frame->data[0][0] - 128) <= 2;
+            av_frame_unref(frame);
+        }
+    }
+
+    av_frame_free(&frame);
+    av_packet_free(&packet);
+    avcodec_free_context(&context);
+    if (!decoded) {
+        fprintf(stderr, "failed to decode the AV1 sample with libdav1d\n");
+        return EXIT_FAILURE;
+    }
+    return EXIT_SUCCESS;
+}
+#endif
 
 int main()
 {
     #ifdef HAVE_FFMPEG_AVCODEC
         printf("configuration: %s\n", avcodec_configuration());
         printf("avcodec version: %d.%d.%d\n", AV_VERSION_MAJOR(avcodec_version()), AV_VERSION_MINOR(avcodec_version()), AV_VERSION_MICRO(avcodec_version()));
+        #ifdef FFMPEG_WITH_DAV1D
+            if (decode_av1_sample() != EXIT_SUCCESS) {
+                return EXIT_FAILURE;
+            }
+        #endif
+        #ifdef FFMPEG_WITH_LIBSVTAV1
+            if (!avcodec_find_encoder_by_name("libsvtav1")) {
+                fprintf(stderr, "libsvtav1 encoder not found\n");
+                return EXIT_FAILURE;
+            }
+            printf("libsvtav1 encoder found\n");
+        #endif
     #else
         printf("avcodec is disabled!\n");
     #endif
@@ -4,7 +4,7 @@ import glob
 from io import StringIO
 
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import cmake_layout, CMake
 from conan.tools.files import apply_conandata_patches, copy, get, export_conandata_patches, copy
@@ -12,7 +12,7 @@ from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 
 
-from helpers import parse_proto_libraries
+from helpers import load_proto_libraries, save_proto_libraries
 
 required_conan_version = ">=1.50.0"
 
@@ -28,11 +28,14 @@ class GoogleAPIS(ConanFile):
     generators = "CMakeDeps", "CMakeToolchain"
     options = {
         "shared": [True, False],
-        "fPIC": [True, False]
+        "fPIC": [True, False],
+        # comma separated Bazel labels (//google/pubsub/v1:pubsub_cc_proto) or package prefixes (//google/rpc)
+        "targets": [None, "ANY"],
         }
     default_options = {
         "shared": False,
-        "fPIC": True
+        "fPIC": True,
+        "targets": None,
         }
     exports = "helpers.py"
     short_paths = True
@@ -43,6 +46,9 @@ class GoogleAPIS(ConanFile):
 
     def source(self):
         get(self, **self.conan_data["sources"][str(self.version)], destination=self.source_folder, strip_root=True)
+        # Patches only touch BUILD files: apply them here so the parsed graph is shared by all configurations
+        apply_conandata_patches(self)
+        save_proto_libraries(self._build_files, self.source_folder, self.output.error)
 
     def config_options(self):
         if self.settings.os == "Windows":
@@ -90,15 +96,23 @@ class GoogleAPIS(ConanFile):
         if not self._cmake_new_enough:
             self.build_requires('cmake/3.23.5')
 
+    @property
+    def _selected_targets(self):
+        if not self.options.targets:
+            return []
+        return list(filter(None, "".join(str(self.options.targets).split()).split(",")))
+
+    @property
+    def _build_files(self):
+        filenames = []
+        for folder in ("google", "grafeas"):
+            filenames += glob.glob(os.path.join(self.source_folder, folder, '**', 'BUILD.bazel'), recursive=True)
+        return filenames
+
     @functools.lru_cache(1)
     def _parse_proto_libraries(self):
-        # Generate the libraries to build dynamically
-        proto_libraries = []
-        for filename in glob.iglob(os.path.join(self.source_folder, 'google', '**', 'BUILD.bazel'), recursive=True):
-            proto_libraries += parse_proto_libraries(filename, self.source_folder, self.output.error)
-
-        for filename in glob.iglob(os.path.join(self.source_folder, 'grafeas', '**', 'BUILD.bazel'), recursive=True):
-            proto_libraries += parse_proto_libraries(filename, self.source_folder, self.output.error)
+        # Generate the libraries to build dynamically, from the graph parsed in source()
+        proto_libraries = load_proto_libraries(self.source_folder)
 
         # Validate that all files exist and all dependencies are found
         all_deps = [f"{it.qname}:{it.name}" for it in proto_libraries]
@@ -106,6 +120,14 @@ class GoogleAPIS(ConanFile):
         for it in proto_libraries:
             it.validate(self.source_folder, all_deps)
 
+        # Restrict the roots to the requested targets, everything else is only built if it is a dependency
+        selected_targets = self._selected_targets
+        if selected_targets:
+            for it in proto_libraries:
+                it.is_used = any(it.matches(selector) for selector in selected_targets)
+            if not any(it.is_used for it in proto_libraries):
+                raise ConanException(f"{self.ref}: option targets={self.options.targets} doesn't match any proto library")
+
         # Mark the libraries we need recursively (C++ context)
         all_dict = {f"{it.qname}:{it.name}": it for it in proto_libraries}
 
@@ -155,7 +177,6 @@ class GoogleAPIS(ConanFile):
         return proto_libraries
 
     def build(self):
-        apply_conandata_patches(self)
         proto_libraries = self._parse_proto_libraries()
         # Use a separate file to host the generated code, which is generated in full each time.
         # This is safe to call multiple times, for example, if you need to invoke `conan build` more than
@@ -1,3 +1,4 @@
+import json
 import os
 import re
 import textwrap
@@ -24,15 +25,33 @@ class _ProtoLibrary:
         for it in self.deps:
             assert it in all_deps, f"{self.qname}:{self.name} - dep '{it}' not found"
 
-    def dumps(self):
-        import json
-        return json.dumps({
+    def matches(self, selector):
+        # Selector is either a Bazel label (//google/pubsub/v1:pubsub_proto) or a package prefix (//google/pubsub)
+        if ":" in selector:
+            return selector == f"{self.qname}:{self.name}"
+        prefix = selector.rstrip("/")
+        return self.qname == prefix or self.qname.startswith(f"{prefix}/")
+
+    def as_dict(self):
+        return {
             "name": self.name,
             "qname": self.qname,
             "srcs": self.srcs,
-            "deps": list(self.deps),
+            "deps": sorted(self.deps),
             "is_cc": self.is_cc,
-        }, indent=4)
+        }
+
+    @classmethod
+    def loads(cls, data):
+        proto_library = cls(is_cc=data["is_cc"])
+        proto_library.name = data["name"]
+        proto_library.qname = data["qname"]
+        proto_library.srcs = list(data["srcs"])
+        proto_library.deps = set(data["deps"])
+        return proto_library
+
+    def dumps(self):
+        return json.dumps(self.as_dict(), indent=4)
 
     @property
     def cmake_target(self):
@@ -184,3 +203,20 @@ def parse_proto_libraries(filename, source_folder, error):
                     action(line)
 
     return proto_libraries
+
+
+_PROTO_LIBRARIES_CACHE = "conan_proto_libraries.json"
+
+
+def save_proto_libraries(filenames, source_folder, error):
+    # Parse the BUILD files once, from source(), and keep the graph with the sources every build reads
+    proto_libraries = []
+    for filename in filenames:
+        proto_libraries += parse_proto_libraries(filename, source_folder, error)
+    with open(os.path.join(source_folder, _PROTO_LIBRARIES_CACHE), "w", encoding="utf-8") as f:
+        json.dump([it.as_dict() for it in proto_libraries], f, indent=4)
+
+
+def load_proto_libraries(source_folder):
+    with open(os.path.join(source_folder, _PROTO_LIBRARIES_CACHE), "r", encoding="utf-8") as f:
+        return [_ProtoLibrary.loads(it) for it in json.load(f)]
@@ -0,0 +1,169 @@
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.apple import fix_apple_shared_install_name
+from conan.tools.build import check_min_cppstd, cross_building, stdcpp_library
+from conan.tools.env import VirtualRunEnv
+from conan.tools.files import copy, get, rm, rmdir
+from conan.tools.gnu import Autotools, AutotoolsDeps, AutotoolsToolchain
+from conan.tools.layout import basic_layout
+import os
+
+
+required_conan_version = ">=1.54.0"
+
+
+class GperftoolsConan(ConanFile):
+    name = "gperftools"
+    description = "Google Performance Tools: tcmalloc, a fast multi-threaded malloc, plus heap and CPU profilers"
+    license = "BSD-3-Clause"
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://github.com/gperftools/gperftools"
+    topics = ("tcmalloc", "malloc", "allocator", "profiler", "heap-profiler", "heap-checker")
+    package_type = "library"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "minimal": [True, False],
+        "enable_cpu_profiler": [True, False],
+        "enable_heap_profiler": [True, False],
+        "enable_heap_checker": [True, False],
+        "enable_debugalloc": [True, False],
+        "with_libunwind": [True, False],
+        "tcmalloc_pagesize": [8, 32, 64, 128, 256],
+        "tcmalloc_alignment": [8, 16],
+        "aggressive_decommit": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "minimal": False,
+        "enable_cpu_profiler": True,
+        "enable_heap_profiler": True,
+        "enable_heap_checker": True,
+        "enable_debugalloc": False,
+        "with_libunwind": True,
+        "tcmalloc_pagesize": 8,
+        "tcmalloc_alignment": 16,
+        "aggressive_decommit": False,
+    }
+
+    @property
+    def _build_tcmalloc(self):
+        return not self.options.minimal
+
+    @property
+    def _build_profiler(self):
+        return not self.options.minimal and self.options.enable_cpu_profiler
+
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+        if self.settings.os != "Linux":
+            # the heap checker relies on /proc and ptrace
+            del self.options.enable_heap_checker
+        if self.settings.os not in ["Linux", "FreeBSD"]:
+            del self.options.with_libunwind
+
+    def configure(self):
+        if self.options.shared:
+            self.options.rm_safe("fPIC")
+        if self.options.minimal:
+            # only libtcmalloc_minimal is built, without any stack trace collection
+            self.options.rm_safe("enable_cpu_profiler")
+            self.options.rm_safe("enable_heap_profiler")
+            self.options.rm_safe("enable_heap_checker")
+            self.options.rm_safe("enable_debugalloc")
+            self.options.rm_safe("with_libunwind")
+
+    def layout(self):
+        basic_layout(self, src_folder="src")
+
+    def requirements(self):
+        if self.options.get_safe("with_libunwind"):
+            self.requires("libunwind/1.6.2")
+
+    def validate(self):
+        if self.settings.compiler.get_safe("cppstd"):
+            check_min_cppstd(self, 11)
+        if self.settings.os not in ["Linux", "FreeBSD", "Macos"]:
+            raise ConanInvalidConfiguration(f"{self.ref} is not supported on {self.settings.os}.")
+
+    def source(self):
+        get(self, **self.conan_data["sources"][self.version], strip_root=True)
+
+    def generate(self):
+        if not cross_building(self):
+            env = VirtualRunEnv(self)
+            env.generate(scope="build")
+        tc = AutotoolsToolchain(self)
+        yes_no = lambda v: "yes" if v else "no"
+        tc.configure_args.extend([
+            f"--enable-minimal={yes_no(self.options.minimal)}",
+            f"--enable-cpu-profiler={yes_no(self.options.get_safe('enable_cpu_profiler'))}",
+            f"--enable-heap-profiler={yes_no(self.options.get_safe('enable_heap_profiler'))}",
+            f"--enable-heap-checker={yes_no(self.options.get_safe('enable_heap_checker'))}",
+            f"--enable-debugalloc={yes_no(self.options.get_safe('enable_debugalloc'))}",
+            f"--enable-libunwind={yes_no(self.options.get_safe('with_libunwind'))}",
+            f"--with-tcmalloc-pagesize={self.options.tcmalloc_pagesize}",
+            f"--with-tcmalloc-alignment={self.options.tcmalloc_alignment}",
+            f"--enable-aggressive-decommit-by-default={yes_no(self.options.aggressive_decommit)}",
+        ])
+        if not self.options.minimal and not self.options.get_safe("with_libunwind") and \
+           self.settings.arch == "x86_64":
+            # without libunwind, stack traces of the profilers are only reliable with frame pointers
+            tc.configure_args.append("--enable-frame-pointers")
+        tc.generate()
+        deps = AutotoolsDeps(self)
+        deps.generate()
+
+    def build(self):
+        autotools = Autotools(self)
+        autotools.configure()
+        autotools.make()
+
+    def package(self):
+        copy(self, pattern="COPYING", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
+        autotools = Autotools(self)
+        autotools.install()
+
+        rm(self, "*.la", os.path.join(self.package_folder, "lib"))
+        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        rmdir(self, os.path.join(self.package_folder, "share"))
+        # pprof and pprof-symbolize are perl scripts, upstream recommends the Go version of pprof
+        rmdir(self, os.path.join(self.package_folder, "bin"))
+        fix_apple_shared_install_name(self)
+
+    def package_info(self):
+        self.cpp_info.set_property("cmake_file_name", "gperftools")
+
+        system_libs = []
+        if self.settings.os in ["Linux", "FreeBSD"]:
+            system_libs = ["m", "pthread"]
+        if not self.options.shared and stdcpp_library(self):
+            system_libs.append(stdcpp_library(self))
+
+        # Malloc only, without heap profiler, heap checker nor stack trace collection
+        minimal = self.cpp_info.components["tcmalloc_minimal"]
+        minimal.set_property("cmake_target_name", "gperftools::tcmalloc_minimal")
+        minimal.set_property("pkg_config_name", "libtcmalloc_minimal")
+        minimal.libs = ["tcmalloc_minimal"]
+        minimal.system_libs = list(system_libs)
+
+        if self._build_tcmalloc:
+            tcmalloc = self.cpp_info.components["tcmalloc"]
+            tcmalloc.set_property("cmake_target_name", "gperftools::tcmalloc")
+            tcmalloc.set_property("pkg_config_name", "libtcmalloc")
+            tcmalloc.libs = ["tcmalloc"]
+            tcmalloc.system_libs = list(system_libs)
+            if self.options.get_safe("with_libunwind"):
+                tcmalloc.requires = ["libunwind::libunwind"]
+
+        if self._build_profiler:
+            profiler = self.cpp_info.components["profiler"]
+            profiler.set_property("cmake_target_name", "gperftools::profiler")
+            profiler.set_property("pkg_config_name", "libprofiler")
+            profiler.libs = ["profiler"]
+            profiler.system_libs = list(system_libs)
+            if self.options.get_safe("with_libunwind"):
+                profiler.requires = ["libunwind::libunwind"]
@@ -0,0 +1,33 @@
+from conan import ConanFile
+from conan.tools.build import can_run
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
+import os
+
+
+class TestPackageConan(ConanFile):
+    settings = "os", "arch", "compiler", "build_type"
+    generators = "CMakeDeps", "VirtualRunEnv"
+    test_type = "explicit"
+
+    def layout(self):
+        cmake_layout(self)
+
+    def requirements(self):
+        self.requires(self.tested_reference_str)
+
+    def generate(self):
+        options = self.dependencies["gperftools"].options
+        tc = CMakeToolchain(self)
+        tc.variables["GPERFTOOLS_MINIMAL"] = bool(options.minimal)
+        tc.variables["GPERFTOOLS_EXPECTED_AGGRESSIVE_DECOMMIT"] = 1 if options.aggressive_decommit else 0
+        tc.generate()
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def test(self):
+        if can_run(self):
+            bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
+            self.run(bin_path, env="conanrun")
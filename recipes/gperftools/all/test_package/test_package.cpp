@@ -0,0 +1,65 @@
+#include <gperftools/malloc_extension.h>
+#include <gperftools/tcmalloc.h>
+
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <vector>
+
+static size_t numeric_property(const char *name) {
+    size_t value = 0;
+    if (!MallocExtension::instance()->GetNumericProperty(name, &value)) {
+        std::fprintf(stderr, "Property %s is not supported\n", name);
+        std::exit(EXIT_FAILURE);
+    }
+    return value;
+}
+
+int main() {
+    int major = 0, minor = 0;
+    const char *patch = nullptr;
+    std::printf("gperftools %s\n", tc_version(&major, &minor, &patch));
+
+    const size_t allocated_before = numeric_property("generic.current_allocated_bytes");
+
+    // A small allocation benchmark, to compare with the other allocators of the index
+    const int blocks = 100000;
+    std::vector<void *> pointers(blocks);
+    const auto start = std::chrono::steady_clock::now();
+    for (int i = 0; i < blocks; ++i) {
+        pointers[i] = std::malloc(16 + (i % 64) * 16);
+        std::memset(pointers[i], 0, 16);
+    }
+    const size_t allocated_during = numeric_property("generic.current_allocated_bytes");
+    for (void *pointer : pointers) {
+        std::free(pointer);
+    }
+    const auto elapsed = std::chrono::duration<double, std::micro>(std::chrono::steady_clock::now() - start);
+    std::printf("%d malloc/free pairs: %.3f us per pair\n", blocks, elapsed.count() / blocks);
+
+    if (allocated_during <= allocated_before) {
+        std::fprintf(stderr, "Allocations are not served by tcmalloc\n");
+        return EXIT_FAILURE;
+    }
+
+    std::printf("generic.heap_size: %zu\n", numeric_property("generic.heap_size"));
+    std::printf("tcmalloc.pageheap_free_bytes: %zu\n", numeric_property("tcmalloc.pageheap_free_bytes"));
+    std::printf("tcmalloc.pageheap_unmapped_bytes: %zu\n", numeric_property("tcmalloc.pageheap_unmapped_bytes"));
+    std::printf("tcmalloc.current_total_thread_cache_bytes: %zu\n",
+                numeric_property("tcmalloc.current_total_thread_cache_bytes"));
+
+    // TCMALLOC_AGGRESSIVE_DECOMMIT in the environment overrides the default chosen at build time
+    const size_t aggressive_decommit = numeric_property("tcmalloc.aggressive_memory_decommit");
+    std::printf("tcmalloc.aggressive_memory_decommit: %zu\n", aggressive_decommit);
+    if (std::getenv("TCMALLOC_AGGRESSIVE_DECOMMIT") == nullptr &&
+        aggressive_decommit != static_cast<size_t>(EXPECTED_AGGRESSIVE_DECOMMIT)) {
+        std::fprintf(stderr, "Expected tcmalloc.aggressive_memory_decommit to be %d\n", EXPECTED_AGGRESSIVE_DECOMMIT);
+        return EXIT_FAILURE;
+    }
+
+    char stats[4096];
+    MallocExtension::instance()->GetStats(stats, sizeof(stats));
+    std::printf("%s\n", stats);
+    return EXIT_SUCCESS;
+}
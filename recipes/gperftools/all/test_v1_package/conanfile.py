@@ -0,0 +1,21 @@
+from conans import ConanFile, CMake
+from conan.tools.build import cross_building
+import os
+
+
+class TestPackageV1Conan(ConanFile):
+    settings = "os", "arch", "compiler", "build_type"
+    generators = "cmake", "cmake_find_package_multi"
+
+    def build(self):
+        options = self.options["gperftools"]
+        cmake = CMake(self)
+        cmake.definitions["GPERFTOOLS_MINIMAL"] = bool(options.minimal)
+        cmake.definitions["GPERFTOOLS_EXPECTED_AGGRESSIVE_DECOMMIT"] = 1 if options.aggressive_decommit else 0
+        cmake.configure()
+        cmake.build()
+
+    def test(self):
+        if not cross_building(self):
+            bin_path = os.path.join("bin", "test_package")
+            self.run(bin_path, run_environment=True)
@@ -1,12 +1,12 @@
 import os
 import functools
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeToolchain
 from conan.tools.files import get, collect_libs, copy
 
-from helpers import parse_proto_libraries
+from helpers import load_proto_libraries, save_proto_libraries
 
 
 class GRPCProto(ConanFile):
@@ -21,11 +21,14 @@ class GRPCProto(ConanFile):
     generators = "CMakeDeps"
     options = {
         "shared": [True, False],
-        "fPIC": [True, False]
+        "fPIC": [True, False],
+        # comma separated Bazel labels (//:health_proto) of the libraries to build
+        "targets": [None, "ANY"],
         }
     default_options = {
         "shared": False,
-        "fPIC": True
+        "fPIC": True,
+        "targets": None,
         }
     exports = "helpers.py"
 
@@ -34,6 +37,7 @@ class GRPCProto(ConanFile):
 
     def source(self):
         get(self, **self.conan_data["sources"][str(self.version)], destination=self.source_folder, strip_root=True)
+        save_proto_libraries([os.path.join(self.source_folder, "BUILD.bazel")], self.source_folder, self.output.error)
 
     def config_options(self):
         if self.settings.os == "Windows":
@@ -65,10 +69,16 @@ class GRPCProto(ConanFile):
     def build_requirements(self):
         self.build_requires('protobuf/3.21.4')
 
+    @property
+    def _selected_targets(self):
+        if not self.options.targets:
+            return []
+        return list(filter(None, "".join(str(self.options.targets).split()).split(",")))
+
     @functools.lru_cache(1)
     def _parse_proto_libraries(self):
-        # Generate the libraries to build dynamically
-        proto_libraries = parse_proto_libraries(os.path.join(self.source_folder, 'BUILD.bazel'), self.source_folder, self.output.error)
+        # Generate the libraries to build dynamically, from the graph parsed in source()
+        proto_libraries = load_proto_libraries(self.source_folder)
 
         # Validate that all files exist and all dependencies are found
         all_deps = [it.cmake_target for it in proto_libraries]
@@ -76,6 +86,14 @@ class GRPCProto(ConanFile):
         for it in proto_libraries:
             it.validate(self.source_folder, all_deps)
 
+        # Restrict the roots to the requested targets, everything else is only built if it is a dependency
+        selected_targets = self._selected_targets
+        if selected_targets:
+            for it in proto_libraries:
+                it.is_used = any(it.matches(selector) for selector in selected_targets)
+            if not any(it.is_used for it in proto_libraries):
+                raise ConanException(f"{self.ref}: option targets={self.options.targets} doesn't match any proto library")
+
         # Mark the libraries we need recursively (C++ context)
         all_dict = {it.cmake_target: it for it in proto_libraries}
         def activate_library(proto_library):
@@ -1,3 +1,4 @@
+import json
 import os
 import re
 import textwrap
@@ -26,13 +27,27 @@ class _ProtoLibrary:
         for it in self.deps:
             assert it in all_deps, f"{self.name} - dep '{it}' not found"
 
-    def dumps(self):
-        import json
-        return json.dumps({
+    def matches(self, selector):
+        # All libraries live in the root package, selector is a Bazel label (//:health_proto) or a bare name
+        return selector.split(":")[-1] == self.name
+
+    def as_dict(self):
+        return {
             "name": self.name,
             "srcs": self.srcs,
-            "deps": list(self.deps),
-        }, indent=4)
+            "deps": sorted(self.deps),
+        }
+
+    @classmethod
+    def loads(cls, data):
+        proto_library = cls()
+        proto_library.name = data["name"]
+        proto_library.srcs = list(data["srcs"])
+        proto_library.deps = set(data["deps"])
+        return proto_library
+
+    def dumps(self):
+        return json.dumps(self.as_dict(), indent=4)
 
     @property
     def cmake_target(self):
@@ -149,3 +164,20 @@ def parse_proto_libraries(filename, source_folder, error):
                     action(line)
 
     return proto_libraries
+
+
+_PROTO_LIBRARIES_CACHE = "conan_proto_libraries.json"
+
+
+def save_proto_libraries(filenames, source_folder, error):
+    # Parse the BUILD files once, from source(), and keep the graph with the sources every build reads
+    proto_libraries = []
+    for filename in filenames:
+        proto_libraries += parse_proto_libraries(filename, source_folder, error)
+    with open(os.path.join(source_folder, _PROTO_LIBRARIES_CACHE), "w", encoding="utf-8") as f:
+        json.dump([it.as_dict() for it in proto_libraries], f, indent=4)
+
+
+def load_proto_libraries(source_folder):
+    with open(os.path.join(source_folder, _PROTO_LIBRARIES_CACHE), "r", encoding="utf-8") as f:
+        return [_ProtoLibrary.loads(it) for it in json.load(f)]
@@ -2,7 +2,7 @@ from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, replace_in_file, rmdir
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, replace_in_file, rm, rmdir
 from conan.tools.scm import Version
 import os
 
@@ -21,10 +21,14 @@ class HighwayConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "contrib": [True, False],
+        "with_test": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "contrib": True,
+        "with_test": True,
     }
 
     @property
@@ -46,6 +50,10 @@ class HighwayConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if Version(self.version) < "0.12.1":
+            del self.options.contrib
+        if Version(self.version) < "0.15.0":
+            del self.options.with_test
 
     def configure(self):
         if Version(self.version) < "0.16.0":
@@ -73,6 +81,9 @@ class HighwayConan(ConanFile):
         tc = CMakeToolchain(self)
         tc.variables["BUILD_TESTING"] = False
         tc.variables["HWY_ENABLE_EXAMPLES"] = False
+        if Version(self.version) >= "1.0.0":
+            tc.variables["HWY_ENABLE_CONTRIB"] = bool(self.options.get_safe("contrib"))
+            tc.variables["HWY_ENABLE_TESTS"] = bool(self.options.get_safe("with_test"))
         # Honor BUILD_SHARED_LIBS from conan_toolchain (see https://github.com/conan-io/conan/issues/11840)
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"
         tc.generate()
@@ -97,6 +108,14 @@ class HighwayConan(ConanFile):
         cmake = CMake(self)
         cmake.install()
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        # Older versions always build these libraries
+        if not self.options.get_safe("contrib"):
+            rmdir(self, os.path.join(self.package_folder, "include", "hwy", "contrib"))
+            for folder in ["lib", "bin"]:
+                rm(self, "*hwy_contrib*", os.path.join(self.package_folder, folder))
+        if not self.options.get_safe("with_test"):
+            for folder in ["lib", "bin"]:
+                rm(self, "*hwy_test*", os.path.join(self.package_folder, folder))
 
     def package_info(self):
         self.cpp_info.components["hwy"].set_property("pkg_config_name", "libhwy")
@@ -105,14 +124,14 @@ class HighwayConan(ConanFile):
             self.cpp_info.components["hwy"].defines.append(
                 "HWY_SHARED_DEFINE" if self.options.shared else "HWY_STATIC_DEFINE"
             )
-        if Version(self.version) >= "0.12.1":
+        if self.settings.os in ["Linux", "FreeBSD"]:
+            self.cpp_info.components["hwy"].system_libs.append("m")
+        if self.options.get_safe("contrib"):
+            # hwy_contrib (vqsort, image, math...) depends on hwy, which must come after it on the link line
             self.cpp_info.components["hwy_contrib"].set_property("pkg_config_name", "libhwy-contrib")
             self.cpp_info.components["hwy_contrib"].libs = ["hwy_contrib"]
             self.cpp_info.components["hwy_contrib"].requires = ["hwy"]
-        if Version(self.version) >= "0.15.0":
+        if self.options.get_safe("with_test"):
             self.cpp_info.components["hwy_test"].set_property("pkg_config_name", "libhwy-test")
             self.cpp_info.components["hwy_test"].libs = ["hwy_test"]
             self.cpp_info.components["hwy_test"].requires = ["hwy"]
-
-        if self.settings.os in ["Linux", "FreeBSD"]:
-            self.cpp_info.system_libs.append("m")
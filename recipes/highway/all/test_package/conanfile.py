@@ -1,12 +1,13 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
+from conan.tools.scm import Version
 import os
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeToolchain", "CMakeDeps", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
     test_type = "explicit"
 
     def layout(self):
@@ -15,6 +16,16 @@ class TestPackageConan(ConanFile):
     def requirements(self):
         self.requires(self.tested_reference_str)
 
+    @property
+    def _with_vqsort(self):
+        highway = self.dependencies["highway"]
+        return highway.options.get_safe("contrib") and Version(highway.ref.version) >= "1.0.0"
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.variables["HIGHWAY_WITH_VQSORT"] = bool(self._with_vqsort)
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -24,3 +35,6 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
             self.run(bin_path, env="conanrun")
+            if self._with_vqsort:
+                bin_path = os.path.join(self.cpp.build.bindirs[0], "test_vqsort")
+                self.run(bin_path, env="conanrun")
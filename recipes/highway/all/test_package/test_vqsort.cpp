@@ -0,0 +1,37 @@
+#include "hwy/contrib/sort/vqsort.h"
+
+#include <algorithm>
+#include <chrono>
+#include <cstdint>
+#include <cstdlib>
+#include <iostream>
+#include <random>
+#include <vector>
+
+int main()
+{
+    const size_t count = 4 * 1000 * 1000;
+    std::vector<uint64_t> keys(count);
+    std::mt19937_64 rng(42);
+    for (uint64_t& key : keys) {
+        key = rng();
+    }
+    std::vector<uint64_t> expected(keys);
+
+    const auto start = std::chrono::steady_clock::now();
+    hwy::Sorter sorter;
+    sorter(keys.data(), keys.size(), hwy::SortAscending());
+    const std::chrono::duration<double> vqsort_elapsed = std::chrono::steady_clock::now() - start;
+
+    const auto std_start = std::chrono::steady_clock::now();
+    std::sort(expected.begin(), expected.end());
+    const std::chrono::duration<double> std_elapsed = std::chrono::steady_clock::now() - std_start;
+
+    if (keys != expected) {
+        std::cerr << "vqsort result differs from std::sort" << std::endl;
+        return EXIT_FAILURE;
+    }
+    std::cout << "Sorted " << count << " 64-bit keys: vqsort " << vqsort_elapsed.count() * 1000 << " ms, std::sort "
+              << std_elapsed.count() * 1000 << " ms" << std::endl;
+    return EXIT_SUCCESS;
+}
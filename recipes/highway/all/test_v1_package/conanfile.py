@@ -6,8 +6,14 @@ class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     generators = "cmake", "cmake_find_package_multi"
 
+    @property
+    def _with_vqsort(self):
+        return self.options["highway"].get_safe("contrib") and \
+               tools.Version(self.deps_cpp_info["highway"].version) >= "1.0.0"
+
     def build(self):
         cmake = CMake(self)
+        cmake.definitions["HIGHWAY_WITH_VQSORT"] = bool(self._with_vqsort)
         cmake.configure()
         cmake.build()
 
@@ -15,3 +21,6 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if self._with_vqsort:
+                bin_path = os.path.join("bin", "test_vqsort")
+                self.run(bin_path, run_environment=True)
@@ -33,6 +33,14 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": [True, False],
         "enable_libdl": [True, False],
         "enable_prof": [True, False],
+        "malloc_conf": "ANY",
+        "background_thread": [None, True, False],
+        "dirty_decay_ms": [None, "ANY"],
+        "muzzy_decay_ms": [None, "ANY"],
+        "narenas": [None, "ANY"],
+        "percpu_arena": [None, "disabled", "percpu", "phycpu"],
+        "lg_page": [None, "ANY"],
+        "lg_hugepage": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -48,6 +56,14 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": True,
         "enable_libdl": True,
         "enable_prof": False,
+        "malloc_conf": "",
+        "background_thread": None,
+        "dirty_decay_ms": None,
+        "muzzy_decay_ms": None,
+        "narenas": None,
+        "percpu_arena": None,
+        "lg_page": None,
+        "lg_hugepage": None,
     }
     exports_sources = ["patches/**"]
 
@@ -56,6 +72,10 @@ class JemallocConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.os not in ["Linux", "FreeBSD"]:
+            # Both rely on pthread & sched_getcpu(), jemalloc ignores them elsewhere
+            del self.options.background_thread
+            del self.options.percpu_arena
 
     def configure(self):
         if self.options.shared:
@@ -85,6 +105,13 @@ class JemallocConan(ConanFile):
             raise ConanInvalidConfiguration("Unsupported compiler version")
         if self.settings.os == "Macos" and self.settings.arch not in ("x86_64", "x86"):
             raise ConanInvalidConfiguration("Unsupported arch")
+        for option, minimum in (("dirty_decay_ms", -1), ("muzzy_decay_ms", -1), ("narenas", 1),
+                                ("lg_page", 12), ("lg_hugepage", 12)):
+            value = self._option_value(option)
+            if value is not None and (not value.lstrip("-").isdigit() or int(value) < minimum):
+                raise ConanInvalidConfiguration(f"{self.ref}:{option} must be an integer >= {minimum}")
+        if any(":" not in entry for entry in str(self.options.malloc_conf).split(",") if entry):
+            raise ConanInvalidConfiguration(f"{self.ref}:malloc_conf must be a comma separated list of option:value")
 
     def layout(self):
         basic_layout(self, src_folder="src")
@@ -100,6 +127,23 @@ class JemallocConan(ConanFile):
     def source(self):
         get(self, **self.conan_data["sources"][self.version], destination=self.source_folder, strip_root=True)
 
+    def _option_value(self, option):
+        # None options are not falsy enough: 0 is a meaningful value for the decay times
+        value = str(self.options.get_safe(option))
+        return None if value == "None" else value
+
+    @property
+    def _malloc_conf(self):
+        # Default options baked in the library, MALLOC_CONF still takes precedence at runtime
+        conf = []
+        for option in ("background_thread", "dirty_decay_ms", "muzzy_decay_ms", "narenas", "percpu_arena"):
+            value = self._option_value(option)
+            if value is not None:
+                conf.append(f"{option}:{value.lower()}")
+        if self.options.malloc_conf:
+            conf.append(str(self.options.malloc_conf).strip(","))
+        return ",".join(conf)
+
     @property
     def _autotools_args(self):
         conf_args = [
@@ -117,6 +161,12 @@ class JemallocConan(ConanFile):
         ]
         if self.options.enable_prof:
             conf_args.append("--enable-prof")
+        if self._malloc_conf:
+            conf_args.append("--with-malloc-conf={}".format(self._malloc_conf))
+        if self._option_value("lg_page") is not None:
+            conf_args.append("--with-lg-page={}".format(self.options.lg_page))
+        if self._option_value("lg_hugepage") is not None:
+            conf_args.append("--with-lg-hugepage={}".format(self.options.lg_hugepage))
         if self.options.shared:
             conf_args.extend(["--enable-shared", "--disable-static"])
         else:
@@ -224,3 +274,6 @@ class JemallocConan(ConanFile):
             self.cpp_info.defines = ["JEMALLOC_EXPORT="]
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs.extend(["dl", "pthread", "rt"])
+        # So that consumers (and test_package) can check what is baked in the library
+        self.user_info.malloc_conf = self._malloc_conf
+        self.user_info.lg_page = self._option_value("lg_page") or ""
@@ -8,6 +8,9 @@ class TestPackageConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
+        user_info = self.deps_user_info["jemalloc"]
+        cmake.definitions["JEMALLOC_EXPECTED_MALLOC_CONF"] = user_info.vars.get("malloc_conf", "")
+        cmake.definitions["JEMALLOC_EXPECTED_LG_PAGE"] = user_info.vars.get("lg_page", "") or "0"
         cmake.configure()
         cmake.build()
 
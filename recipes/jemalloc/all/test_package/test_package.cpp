@@ -1,6 +1,18 @@
 #include <jemalloc/jemalloc.h>
 
-#include <stdlib.h>
+#include <cstddef>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <map>
+#include <string>
+
+#ifndef EXPECTED_MALLOC_CONF
+#define EXPECTED_MALLOC_CONF ""
+#endif
+#ifndef EXPECTED_LG_PAGE
+#define EXPECTED_LG_PAGE 0
+#endif
 
 void
 do_something(size_t i) {
@@ -8,6 +20,103 @@ do_something(size_t i) {
         malloc(i * 100);
 }
 
+template <typename T>
+static bool
+read_mallctl(const char *name, T *value) {
+        size_t size = sizeof(T);
+        if (mallctl(name, value, &size, NULL, 0) != 0) {
+                std::fprintf(stderr, "mallctl(\"%s\") failed\n", name);
+                return false;
+        }
+        return true;
+}
+
+// Options are applied in order, the last occurrence of a key wins
+static void
+parse_conf(const std::string &conf, std::map<std::string, std::string> &options) {
+        size_t begin = 0;
+        while (begin < conf.size()) {
+                size_t end = conf.find(',', begin);
+                if (end == std::string::npos) {
+                        end = conf.size();
+                }
+                const std::string entry = conf.substr(begin, end - begin);
+                const size_t colon = entry.find(':');
+                if (colon != std::string::npos) {
+                        options[entry.substr(0, colon)] = entry.substr(colon + 1);
+                }
+                begin = end + 1;
+        }
+}
+
+// Read back every option baked in with --with-malloc-conf
+static bool
+check_malloc_conf(const std::string &expected) {
+        const char *baked = NULL;
+        if (!read_mallctl("config.malloc_conf", &baked)) {
+                return false;
+        }
+        std::printf("config.malloc_conf: \"%s\"\n", baked);
+        if (expected != baked) {
+                std::fprintf(stderr, "expected config.malloc_conf \"%s\"\n", expected.c_str());
+                return false;
+        }
+
+        // MALLOC_CONF from the environment is applied after the baked in options
+        std::map<std::string, std::string> options;
+        parse_conf(expected, options);
+        const char *environment = std::getenv("MALLOC_CONF");
+        if (environment != NULL) {
+                std::printf("MALLOC_CONF: \"%s\"\n", environment);
+                parse_conf(environment, options);
+        }
+
+        bool ok = true;
+        bool percpu = false;
+        for (std::map<std::string, std::string>::const_iterator it = options.begin(); it != options.end(); ++it) {
+                const std::string &key = it->first;
+                const std::string &value = it->second;
+                const std::string name = "opt." + key;
+
+                if (key == "background_thread") {
+                        bool actual = false;
+                        ok = read_mallctl(name.c_str(), &actual) && ok;
+                        std::printf("%s: %s\n", name.c_str(), actual ? "true" : "false");
+                        ok = ok && actual == (value == "true");
+                } else if (key == "dirty_decay_ms" || key == "muzzy_decay_ms") {
+                        std::ptrdiff_t actual = 0;
+                        ok = read_mallctl(name.c_str(), &actual) && ok;
+                        std::printf("%s: %ld\n", name.c_str(), static_cast<long>(actual));
+                        ok = ok && actual == std::atol(value.c_str());
+                } else if (key == "percpu_arena") {
+                        const char *actual = NULL;
+                        ok = read_mallctl(name.c_str(), &actual) && ok;
+                        std::printf("%s: %s\n", name.c_str(), actual ? actual : "(null)");
+                        ok = ok && actual != NULL && value == actual;
+                        percpu = value != "disabled";
+                }
+        }
+        // With a per CPU arena jemalloc sizes the number of arenas itself
+        std::map<std::string, std::string>::const_iterator narenas = options.find("narenas");
+        if (narenas != options.end() && !percpu) {
+                unsigned actual = 0;
+                ok = read_mallctl("opt.narenas", &actual) && ok;
+                std::printf("opt.narenas: %u\n", actual);
+                ok = ok && actual == static_cast<unsigned>(std::atol(narenas->second.c_str()));
+        }
+        return ok;
+}
+
+static bool
+check_lg_page(int lg_page) {
+        size_t page = 0;
+        if (!read_mallctl("arenas.page", &page)) {
+                return false;
+        }
+        std::printf("arenas.page: %lu\n", static_cast<unsigned long>(page));
+        return lg_page == 0 || page == (static_cast<size_t>(1) << lg_page);
+}
+
 int
 main(int argc, char **argv) {
         for (size_t i = 0; i < 1000; i++) {
@@ -17,5 +126,9 @@ main(int argc, char **argv) {
         // Dump allocator statistics to stderr.
         malloc_stats_print(NULL, NULL, NULL);
 
+        if (!check_malloc_conf(EXPECTED_MALLOC_CONF) || !check_lg_page(EXPECTED_LG_PAGE)) {
+                std::fprintf(stderr, "jemalloc is not configured as requested\n");
+                return EXIT_FAILURE;
+        }
         return 0;
 }
@@ -52,6 +52,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": [True, False],
         "with_largemaxwritesize": [True, False],
         "with_nghttp2": [True, False],
+        "with_http3": [True, False],
         "with_zlib": [True, False],
         "with_brotli": [True, False],
         "with_zstd": [True, False],
@@ -97,6 +98,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": False,
         "with_largemaxwritesize": False,
         "with_nghttp2": False,
+        "with_http3": False,
         "with_zlib": True,
         "with_brotli": False,
         "with_zstd": False,
@@ -142,6 +144,11 @@ class LibcurlConan(ConanFile):
     def _has_with_libpsl_option(self):
         return not (self._is_using_cmake_build and Version(self.version) < "7.84.0")
 
+    @property
+    def _has_http3_option(self):
+        # ngtcp2 >= 0.13 / nghttp3 >= 0.8 API is used since 7.88.0
+        return Version(self.version) >= "7.88.0"
+
     def export_sources(self):
         copy(self, "lib_Makefile_add.am", self.recipe_folder, self.export_sources_folder)
         export_conandata_patches(self)
@@ -155,6 +162,8 @@ class LibcurlConan(ConanFile):
             del self.options.with_libpsl
         if self._is_using_cmake_build:
             del self.options.with_libgsasl
+        if not self._has_http3_option:
+            del self.options.with_http3
 
         # Before 7.86.0, enabling unix sockets configure option would fail on windows
         # It was fixed with this PR: https://github.com/curl/curl/pull/9688
@@ -176,13 +185,24 @@ class LibcurlConan(ConanFile):
         else:
             basic_layout(self, src_folder="src")
 
+    @property
+    def _openssl_name(self):
+        # ngtcp2 needs the QUIC API of quictls, a fork of OpenSSL which provides "openssl" in the graph
+        return "quictls" if self.options.get_safe("with_http3") else "openssl"
+
     def requirements(self):
         if self.options.with_ssl == "openssl":
-            self.requires("openssl/1.1.1t")
+            if self.options.get_safe("with_http3"):
+                self.requires("quictls/3.0.8+quic1")
+            else:
+                self.requires("openssl/1.1.1t")
         elif self.options.with_ssl == "wolfssl":
             self.requires("wolfssl/5.5.1")
         if self.options.with_nghttp2:
             self.requires("libnghttp2/1.51.0")
+        if self.options.get_safe("with_http3"):
+            self.requires("ngtcp2/0.13.1")
+            self.requires("nghttp3/0.8.0")
         if self.options.with_libssh2:
             self.requires("libssh2/1.10.0")
         if self.options.with_zlib:
@@ -202,9 +222,14 @@ class LibcurlConan(ConanFile):
         if self.options.with_ssl == "darwinssl" and not is_apple_os(self):
             raise ConanInvalidConfiguration("darwinssl only suppported on Apple like OS (Macos, iOS, watchOS or tvOS).")
         if self.options.with_ssl == "openssl":
-            openssl = self.dependencies["openssl"]
-            if self.options.with_ntlm and openssl.options.no_des:
-                raise ConanInvalidConfiguration("option with_ntlm=True requires openssl:no_des=False")
+            openssl = self.dependencies[self._openssl_name]
+            if self.options.with_ntlm and openssl.options.get_safe("no_des"):
+                raise ConanInvalidConfiguration(f"option with_ntlm=True requires {self._openssl_name}:no_des=False")
+        if self.options.get_safe("with_http3"):
+            if self.options.with_ssl != "openssl":
+                raise ConanInvalidConfiguration("option with_http3=True requires with_ssl=openssl (quictls backend of ngtcp2).")
+            if not self.dependencies["ngtcp2"].options.with_openssl:
+                raise ConanInvalidConfiguration("option with_http3=True requires ngtcp2:with_openssl=True")
 
     def build_requirements(self):
         if self._is_using_cmake_build:
@@ -347,6 +372,15 @@ class LibcurlConan(ConanFile):
         replace_in_file(self, cmakelists, "${NGHTTP2_INCLUDE_DIRS}", "${libnghttp2_INCLUDE_DIRS}")
         replace_in_file(self, cmakelists, "${NGHTTP2_LIBRARIES}", "libnghttp2::nghttp2")
 
+        # ngtcp2 & nghttp3
+        if self.options.get_safe("with_http3"):
+            replace_in_file(self, cmakelists, "find_package(NGTCP2 REQUIRED OpenSSL)", "find_package(ngtcp2 REQUIRED CONFIG)")
+            replace_in_file(self, cmakelists, "${NGTCP2_LIBRARIES}", "ngtcp2::ngtcp2 ngtcp2::ngtcp2_crypto_openssl")
+            replace_in_file(self, cmakelists, "${NGTCP2_INCLUDE_DIRS}", "${ngtcp2_INCLUDE_DIRS}")
+            replace_in_file(self, cmakelists, "find_package(NGHTTP3 REQUIRED)", "find_package(nghttp3 REQUIRED CONFIG)")
+            replace_in_file(self, cmakelists, "${NGHTTP3_LIBRARIES}", "nghttp3::nghttp3")
+            replace_in_file(self, cmakelists, "${NGHTTP3_INCLUDE_DIRS}", "${nghttp3_INCLUDE_DIRS}")
+
         # wolfssl
         replace_in_file(self, cmakelists, "find_package(WolfSSL REQUIRED)", "find_package(wolfssl REQUIRED CONFIG)")
         replace_in_file(self, cmakelists, "${WolfSSL_LIBRARIES}", "${wolfssl_LIBRARIES}")
@@ -417,7 +451,7 @@ class LibcurlConan(ConanFile):
 
         openssl_option = "ssl" if Version(self.version) < "7.77.0" else "openssl"
         if self.options.with_ssl == "openssl":
-            path = unix_path(self, self.dependencies["openssl"].package_folder)
+            path = unix_path(self, self.dependencies[self._openssl_name].package_folder)
             tc.configure_args.append(f"--with-{openssl_option}={path}")
         else:
             tc.configure_args.append(f"--without-{openssl_option}")
@@ -440,6 +474,15 @@ class LibcurlConan(ConanFile):
         else:
             tc.configure_args.append("--without-nghttp2")
 
+        if self.options.get_safe("with_http3"):
+            path = unix_path(self, self.dependencies["ngtcp2"].package_folder)
+            tc.configure_args.append(f"--with-ngtcp2={path}")
+            path = unix_path(self, self.dependencies["nghttp3"].package_folder)
+            tc.configure_args.append(f"--with-nghttp3={path}")
+        elif self._has_http3_option:
+            tc.configure_args.append("--without-ngtcp2")
+            tc.configure_args.append("--without-nghttp3")
+
         if self.options.with_zlib:
             path = unix_path(self, self.dependencies["zlib"].package_folder)
             tc.configure_args.append(f"--with-zlib={path}")
@@ -560,6 +603,8 @@ class LibcurlConan(ConanFile):
         else:
             tc.variables["CMAKE_USE_WOLFSSL"] = self.options.with_ssl == "wolfssl"
         tc.variables["USE_NGHTTP2"] = self.options.with_nghttp2
+        if self._has_http3_option:
+            tc.variables["USE_NGTCP2"] = self.options.with_http3
         tc.variables["CURL_ZLIB"] = self.options.with_zlib
         tc.variables["CURL_BROTLI"] = self.options.with_brotli
         tc.variables["CURL_ZSTD"] = self.options.with_zstd
@@ -668,11 +713,15 @@ class LibcurlConan(ConanFile):
             self.cpp_info.components["curl"].defines.append("CURL_STATICLIB=1")
 
         if self.options.with_ssl == "openssl":
-            self.cpp_info.components["curl"].requires.append("openssl::openssl")
+            self.cpp_info.components["curl"].requires.append(f"{self._openssl_name}::{self._openssl_name}")
         if self.options.with_ssl == "wolfssl":
             self.cpp_info.components["curl"].requires.append("wolfssl::wolfssl")
         if self.options.with_nghttp2:
             self.cpp_info.components["curl"].requires.append("libnghttp2::libnghttp2")
+        if self.options.get_safe("with_http3"):
+            self.cpp_info.components["curl"].requires.extend([
+                "ngtcp2::ngtcp2", "ngtcp2::ngtcp2_crypto_openssl", "nghttp3::nghttp3",
+            ])
         if self.options.with_libssh2:
             self.cpp_info.components["curl"].requires.append("libssh2::libssh2")
         if self.options.with_zlib:
@@ -0,0 +1,416 @@
+/* Minimal HTTP/3 server on top of ngtcp2, nghttp3 and quictls, answering
+   every request with the same body. It serves a single connection on an
+   already bound UDP socket until the process is killed. */
+#include "http3_server.h"
+
+#include <ngtcp2/ngtcp2.h>
+#include <ngtcp2/ngtcp2_crypto.h>
+#include <ngtcp2/ngtcp2_crypto_openssl.h>
+#include <nghttp3/nghttp3.h>
+#include <openssl/err.h>
+#include <openssl/evp.h>
+#include <openssl/rand.h>
+#include <openssl/ssl.h>
+#include <openssl/x509.h>
+
+#include <poll.h>
+#include <stdio.h>
+#include <string.h>
+#include <sys/socket.h>
+#include <time.h>
+
+struct server {
+  int fd;
+  struct sockaddr_storage local_addr;
+  socklen_t local_addrlen;
+  struct sockaddr_storage remote_addr;
+  socklen_t remote_addrlen;
+  SSL_CTX *ssl_ctx;
+  SSL *ssl;
+  ngtcp2_crypto_conn_ref conn_ref;
+  ngtcp2_conn *conn;
+  nghttp3_conn *h3;
+  const char *body;
+};
+
+static ngtcp2_tstamp timestamp(void)
+{
+  struct timespec tp;
+  clock_gettime(CLOCK_MONOTONIC, &tp);
+  return (ngtcp2_tstamp)tp.tv_sec * NGTCP2_SECONDS + (ngtcp2_tstamp)tp.tv_nsec;
+}
+
+static ngtcp2_conn *get_conn(ngtcp2_crypto_conn_ref *conn_ref)
+{
+  return ((struct server *)conn_ref->user_data)->conn;
+}
+
+static int alpn_select_cb(SSL *ssl, const unsigned char **out, unsigned char *outlen,
+                          const unsigned char *in, unsigned int inlen, void *arg)
+{
+  static const unsigned char h3[] = "\x02h3";
+  (void)ssl;
+  (void)arg;
+  if(SSL_select_next_proto((unsigned char **)out, outlen, h3, sizeof(h3) - 1, in, inlen) !=
+     OPENSSL_NPN_NEGOTIATED)
+    return SSL_TLSEXT_ERR_ALERT_FATAL;
+  return SSL_TLSEXT_ERR_OK;
+}
+
+/* self-signed certificate, the client doesn't verify it */
+static int setup_tls(struct server *s)
+{
+  EVP_PKEY *pkey = EVP_EC_gen("P-256");
+  X509 *x509 = X509_new();
+  X509_NAME *name;
+  int ok;
+
+  if(!pkey || !x509)
+    goto fail;
+  ASN1_INTEGER_set(X509_get_serialNumber(x509), 1);
+  X509_gmtime_adj(X509_getm_notBefore(x509), 0);
+  X509_gmtime_adj(X509_getm_notAfter(x509), 3600);
+  X509_set_pubkey(x509, pkey);
+  name = X509_get_subject_name(x509);
+  X509_NAME_add_entry_by_txt(name, "CN", MBSTRING_ASC, (const unsigned char *)"localhost", -1, -1, 0);
+  X509_set_issuer_name(x509, name);
+  if(!X509_sign(x509, pkey, EVP_sha256()))
+    goto fail;
+
+  s->ssl_ctx = SSL_CTX_new(TLS_server_method());
+  ok = s->ssl_ctx &&
+       ngtcp2_crypto_openssl_configure_server_context(s->ssl_ctx) == 0 &&
+       SSL_CTX_use_certificate(s->ssl_ctx, x509) == 1 &&
+       SSL_CTX_use_PrivateKey(s->ssl_ctx, pkey) == 1;
+  X509_free(x509);
+  EVP_PKEY_free(pkey);
+  if(!ok)
+    return -1;
+  SSL_CTX_set_alpn_select_cb(s->ssl_ctx, alpn_select_cb, NULL);
+
+  s->ssl = SSL_new(s->ssl_ctx);
+  if(!s->ssl)
+    return -1;
+  s->conn_ref.get_conn = get_conn;
+  s->conn_ref.user_data = s;
+  SSL_set_app_data(s->ssl, &s->conn_ref);
+  SSL_set_accept_state(s->ssl);
+  return 0;
+
+fail:
+  X509_free(x509);
+  EVP_PKEY_free(pkey);
+  return -1;
+}
+
+/* nghttp3 callbacks */
+
+static nghttp3_ssize read_body(nghttp3_conn *h3, int64_t stream_id, nghttp3_vec *vec, size_t veccnt,
+                               uint32_t *pflags, void *conn_user_data, void *stream_user_data)
+{
+  struct server *s = conn_user_data;
+  (void)h3;
+  (void)stream_id;
+  (void)veccnt;
+  (void)stream_user_data;
+  vec[0].base = (uint8_t *)s->body;
+  vec[0].len = strlen(s->body);
+  *pflags |= NGHTTP3_DATA_FLAG_EOF;
+  return 1;
+}
+
+#define MAKE_NV(NAME, VALUE) \
+  { (uint8_t *)(NAME), (uint8_t *)(VALUE), sizeof(NAME) - 1, sizeof(VALUE) - 1, NGHTTP3_NV_FLAG_NONE }
+
+/* whatever the request is, answer once it has been fully received */
+static int h3_end_stream(nghttp3_conn *h3, int64_t stream_id, void *conn_user_data, void *stream_user_data)
+{
+  nghttp3_nv nva[] = {
+    MAKE_NV(":status", "200"),
+    MAKE_NV("content-type", "text/plain"),
+  };
+  nghttp3_data_reader dr;
+  (void)conn_user_data;
+  (void)stream_user_data;
+  dr.read_data = read_body;
+  return nghttp3_conn_submit_response(h3, stream_id, nva, sizeof(nva) / sizeof(nva[0]), &dr) == 0
+           ? 0 : NGHTTP3_ERR_CALLBACK_FAILURE;
+}
+
+static int setup_h3(struct server *s)
+{
+  nghttp3_callbacks callbacks;
+  nghttp3_settings settings;
+  int64_t ctrl_stream_id, qpack_enc_stream_id, qpack_dec_stream_id;
+
+  memset(&callbacks, 0, sizeof(callbacks));
+  callbacks.end_stream = h3_end_stream;
+  nghttp3_settings_default(&settings);
+  if(nghttp3_conn_server_new(&s->h3, &callbacks, &settings, nghttp3_mem_default(), s) != 0)
+    return -1;
+  nghttp3_conn_set_max_client_streams_bidi(s->h3, 100);
+
+  if(ngtcp2_conn_open_uni_stream(s->conn, &ctrl_stream_id, NULL) != 0 ||
+     ngtcp2_conn_open_uni_stream(s->conn, &qpack_enc_stream_id, NULL) != 0 ||
+     ngtcp2_conn_open_uni_stream(s->conn, &qpack_dec_stream_id, NULL) != 0)
+    return -1;
+  if(nghttp3_conn_bind_control_stream(s->h3, ctrl_stream_id) != 0 ||
+     nghttp3_conn_bind_qpack_streams(s->h3, qpack_enc_stream_id, qpack_dec_stream_id) != 0)
+    return -1;
+  return 0;
+}
+
+/* ngtcp2 callbacks */
+
+static void rand_cb(uint8_t *dest, size_t destlen, const ngtcp2_rand_ctx *rand_ctx)
+{
+  (void)rand_ctx;
+  RAND_bytes(dest, (int)destlen);
+}
+
+static int get_new_connection_id(ngtcp2_conn *conn, ngtcp2_cid *cid, uint8_t *token,
+                                 size_t cidlen, void *user_data)
+{
+  (void)conn;
+  (void)user_data;
+  if(RAND_bytes(cid->data, (int)cidlen) != 1 ||
+     RAND_bytes(token, NGTCP2_STATELESS_RESET_TOKENLEN) != 1)
+    return NGTCP2_ERR_CALLBACK_FAILURE;
+  cid->datalen = cidlen;
+  return 0;
+}
+
+static int recv_stream_data(ngtcp2_conn *conn, uint32_t flags, int64_t stream_id, uint64_t offset,
+                            const uint8_t *data, size_t datalen, void *user_data, void *stream_user_data)
+{
+  struct server *s = user_data;
+  nghttp3_ssize consumed;
+  (void)offset;
+  (void)stream_user_data;
+
+  if(!s->h3 && setup_h3(s) != 0)
+    return NGTCP2_ERR_CALLBACK_FAILURE;
+  consumed = nghttp3_conn_read_stream(s->h3, stream_id, data, datalen,
+                                      flags & NGTCP2_STREAM_DATA_FLAG_FIN);
+  if(consumed < 0)
+    return NGTCP2_ERR_CALLBACK_FAILURE;
+  ngtcp2_conn_extend_max_stream_offset(conn, stream_id, (uint64_t)consumed);
+  ngtcp2_conn_extend_max_offset(conn, (uint64_t)consumed);
+  return 0;
+}
+
+static int acked_stream_data_offset(ngtcp2_conn *conn, int64_t stream_id, uint64_t offset,
+                                    uint64_t datalen, void *user_data, void *stream_user_data)
+{
+  struct server *s = user_data;
+  (void)conn;
+  (void)offset;
+  (void)stream_user_data;
+  if(s->h3 && nghttp3_conn_add_ack_offset(s->h3, stream_id, datalen) != 0)
+    return NGTCP2_ERR_CALLBACK_FAILURE;
+  return 0;
+}
+
+static int stream_close(ngtcp2_conn *conn, uint32_t flags, int64_t stream_id, uint64_t app_error_code,
+                        void *user_data, void *stream_user_data)
+{
+  struct server *s = user_data;
+  int rv;
+  (void)conn;
+  (void)stream_user_data;
+  if(!s->h3)
+    return 0;
+  if(!(flags & NGTCP2_STREAM_CLOSE_FLAG_APP_ERROR_CODE_SET))
+    app_error_code = NGHTTP3_H3_NO_ERROR;
+  rv = nghttp3_conn_close_stream(s->h3, stream_id, app_error_code);
+  if(rv != 0 && rv != NGHTTP3_ERR_STREAM_NOT_FOUND)
+    return NGTCP2_ERR_CALLBACK_FAILURE;
+  return 0;
+}
+
+static int extend_max_stream_data(ngtcp2_conn *conn, int64_t stream_id, uint64_t max_data,
+                                  void *user_data, void *stream_user_data)
+{
+  struct server *s = user_data;
+  (void)conn;
+  (void)max_data;
+  (void)stream_user_data;
+  if(s->h3 && nghttp3_conn_unblock_stream(s->h3, stream_id) != 0)
+    return NGTCP2_ERR_CALLBACK_FAILURE;
+  return 0;
+}
+
+static int accept_conn(struct server *s, const uint8_t *pkt, size_t pktlen)
+{
+  ngtcp2_pkt_hd hd;
+  ngtcp2_path path;
+  ngtcp2_cid scid;
+  ngtcp2_callbacks callbacks;
+  ngtcp2_settings settings;
+  ngtcp2_transport_params params;
+
+  if(ngtcp2_accept(&hd, pkt, pktlen) != 0)
+    return -1;
+
+  memset(&callbacks, 0, sizeof(callbacks));
+  callbacks.recv_client_initial = ngtcp2_crypto_recv_client_initial_cb;
+  callbacks.recv_crypto_data = ngtcp2_crypto_recv_crypto_data_cb;
+  callbacks.encrypt = ngtcp2_crypto_encrypt_cb;
+  callbacks.decrypt = ngtcp2_crypto_decrypt_cb;
+  callbacks.hp_mask = ngtcp2_crypto_hp_mask_cb;
+  callbacks.update_key = ngtcp2_crypto_update_key_cb;
+  callbacks.delete_crypto_aead_ctx = ngtcp2_crypto_delete_crypto_aead_ctx_cb;
+  callbacks.delete_crypto_cipher_ctx = ngtcp2_crypto_delete_crypto_cipher_ctx_cb;
+  callbacks.get_path_challenge_data = ngtcp2_crypto_get_path_challenge_data_cb;
+  callbacks.rand = rand_cb;
+  callbacks.get_new_connection_id = get_new_connection_id;
+  callbacks.recv_stream_data = recv_stream_data;
+  callbacks.acked_stream_data_offset = acked_stream_data_offset;
+  callbacks.stream_close = stream_close;
+  callbacks.extend_max_stream_data = extend_max_stream_data;
+
+  ngtcp2_settings_default(&settings);
+  settings.initial_ts = timestamp();
+
+  ngtcp2_transport_params_default(&params);
+  params.original_dcid = hd.dcid;
+  params.initial_max_streams_bidi = 100;
+  params.initial_max_streams_uni = 3;
+  params.initial_max_stream_data_bidi_local = 256 * 1024;
+  params.initial_max_stream_data_bidi_remote = 256 * 1024;
+  params.initial_max_stream_data_uni = 256 * 1024;
+  params.initial_max_data = 1024 * 1024;
+  params.max_idle_timeout = 30 * NGTCP2_SECONDS;
+
+  scid.datalen = NGTCP2_MAX_CIDLEN;
+  if(RAND_bytes(scid.data, (int)scid.datalen) != 1)
+    return -1;
+
+  path.local.addr = (ngtcp2_sockaddr *)&s->local_addr;
+  path.local.addrlen = s->local_addrlen;
+  path.remote.addr = (ngtcp2_sockaddr *)&s->remote_addr;
+  path.remote.addrlen = s->remote_addrlen;
+  path.user_data = NULL;
+
+  if(ngtcp2_conn_server_new(&s->conn, &hd.scid, &scid, &path, hd.version, &callbacks,
+                            &settings, &params, NULL, s) != 0)
+    return -1;
+  ngtcp2_conn_set_tls_native_handle(s->conn, s->ssl);
+  return 0;
+}
+
+static int write_packets(struct server *s)
+{
+  uint8_t buf[1452];
+  ngtcp2_path_storage ps;
+  ngtcp2_pkt_info pi;
+
+  ngtcp2_path_storage_zero(&ps);
+  for(;;) {
+    nghttp3_vec vec[16];
+    nghttp3_ssize sveccnt = 0;
+    int64_t stream_id = -1;
+    int fin = 0;
+    uint32_t flags = NGTCP2_WRITE_STREAM_FLAG_MORE;
+    ngtcp2_ssize ndatalen, nwrite;
+
+    if(s->h3) {
+      sveccnt = nghttp3_conn_writev_stream(s->h3, &stream_id, &fin, vec, sizeof(vec) / sizeof(vec[0]));
+      if(sveccnt < 0)
+        return -1;
+    }
+    if(fin)
+      flags |= NGTCP2_WRITE_STREAM_FLAG_FIN;
+
+    nwrite = ngtcp2_conn_writev_stream(s->conn, &ps.path, &pi, buf, sizeof(buf), &ndatalen, flags,
+                                       stream_id, (const ngtcp2_vec *)vec, (size_t)sveccnt, timestamp());
+    if(nwrite < 0) {
+      switch(nwrite) {
+      case NGTCP2_ERR_STREAM_DATA_BLOCKED:
+        nghttp3_conn_block_stream(s->h3, stream_id);
+        continue;
+      case NGTCP2_ERR_STREAM_SHUT_WR:
+        nghttp3_conn_shutdown_stream_write(s->h3, stream_id);
+        continue;
+      case NGTCP2_ERR_WRITE_MORE:
+        if(nghttp3_conn_add_write_offset(s->h3, stream_id, (size_t)ndatalen) != 0)
+          return -1;
+        continue;
+      }
+      return -1;
+    }
+    if(ndatalen >= 0 && nghttp3_conn_add_write_offset(s->h3, stream_id, (size_t)ndatalen) != 0)
+      return -1;
+    if(nwrite == 0)
+      return 0;
+    sendto(s->fd, buf, (size_t)nwrite, 0, (struct sockaddr *)&s->remote_addr, s->remote_addrlen);
+  }
+}
+
+int http3_serve(int fd, const char *body)
+{
+  struct server s;
+  uint8_t buf[65536];
+  ngtcp2_tstamp deadline;
+
+  memset(&s, 0, sizeof(s));
+  s.fd = fd;
+  s.body = body;
+  s.local_addrlen = sizeof(s.local_addr);
+  if(getsockname(fd, (struct sockaddr *)&s.local_addr, &s.local_addrlen) != 0 || setup_tls(&s) != 0) {
+    ERR_print_errors_fp(stderr);
+    return 1;
+  }
+
+  /* the parent process kills the server once the transfer is done */
+  deadline = timestamp() + 30 * NGTCP2_SECONDS;
+  while(timestamp() < deadline) {
+    struct pollfd pfd;
+    int timeout = 1000;
+
+    if(s.conn) {
+      ngtcp2_tstamp expiry = ngtcp2_conn_get_expiry(s.conn);
+      ngtcp2_tstamp now = timestamp();
+      if(expiry <= now) {
+        if(ngtcp2_conn_handle_expiry(s.conn, now) != 0 || write_packets(&s) != 0)
+          break;
+        continue;
+      }
+      if(expiry - now < (ngtcp2_tstamp)timeout * NGTCP2_MILLISECONDS)
+        timeout = (int)((expiry - now) / NGTCP2_MILLISECONDS) + 1;
+    }
+
+    pfd.fd = fd;
+    pfd.events = POLLIN;
+    if(poll(&pfd, 1, timeout) > 0) {
+      ngtcp2_path path;
+      ngtcp2_pkt_info pi;
+      ssize_t nread;
+
+      memset(&pi, 0, sizeof(pi));
+      s.remote_addrlen = sizeof(s.remote_addr);
+      nread = recvfrom(fd, buf, sizeof(buf), 0, (struct sockaddr *)&s.remote_addr, &s.remote_addrlen);
+      if(nread <= 0)
+        continue;
+      if(!s.conn && accept_conn(&s, buf, (size_t)nread) != 0)
+        continue;
+
+      path.local.addr = (ngtcp2_sockaddr *)&s.local_addr;
+      path.local.addrlen = s.local_addrlen;
+      path.remote.addr = (ngtcp2_sockaddr *)&s.remote_addr;
+      path.remote.addrlen = s.remote_addrlen;
+      path.user_data = NULL;
+      /* draining or closed once the client is done */
+      if(ngtcp2_conn_read_pkt(s.conn, &path, &pi, buf, (size_t)nread, timestamp()) != 0)
+        break;
+    }
+    if(s.conn && write_packets(&s) != 0)
+      break;
+  }
+
+  nghttp3_conn_del(s.h3);
+  ngtcp2_conn_del(s.conn);
+  SSL_free(s.ssl);
+  SSL_CTX_free(s.ssl_ctx);
+  return 0;
+}
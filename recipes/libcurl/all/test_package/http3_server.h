@@ -0,0 +1,8 @@
+#ifndef HTTP3_SERVER_H
+#define HTTP3_SERVER_H
+
+/* Serve one HTTP/3 connection on the bound UDP socket fd, answering every
+   request with body, until the connection ends or after 30 seconds. */
+int http3_serve(int fd, const char *body);
+
+#endif
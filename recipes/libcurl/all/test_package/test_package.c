@@ -1,6 +1,97 @@
 #include <stdio.h>
 #include <curl/curl.h>
 
+#if defined(WITH_HTTP3)
+#include "http3_server.h"
+
+#include <arpa/inet.h>
+#include <netinet/in.h>
+#include <signal.h>
+#include <string.h>
+#include <sys/socket.h>
+#include <sys/wait.h>
+#include <unistd.h>
+
+static const char http3_body[] = "Hello from the HTTP/3 loopback server\n";
+
+struct buffer {
+  char data[256];
+  size_t len;
+};
+
+static size_t write_cb(char *ptr, size_t size, size_t nmemb, void *userdata)
+{
+  struct buffer *buf = userdata;
+  size_t len = size * nmemb;
+  if(len > sizeof(buf->data) - buf->len)
+    return 0;
+  memcpy(buf->data + buf->len, ptr, len);
+  buf->len += len;
+  return len;
+}
+
+/* Run an ngtcp2/nghttp3 server in a child process on a loopback UDP socket,
+   fetch its page over HTTP/3 only and check the response. */
+static int test_http3(CURL *curl)
+{
+  struct sockaddr_in addr;
+  socklen_t addr_len = sizeof(addr);
+  struct buffer response;
+  char url[64];
+  CURLcode res;
+  long http_version = 0, status = 0;
+  pid_t pid;
+  int fd = socket(AF_INET, SOCK_DGRAM, 0);
+
+  if(fd < 0) {
+    printf("HTTP/3: no UDP socket available\n");
+    return 4;
+  }
+  addr.sin_family = AF_INET;
+  addr.sin_addr.s_addr = htonl(INADDR_LOOPBACK);
+  addr.sin_port = 0;
+  if(bind(fd, (struct sockaddr *)&addr, sizeof(addr)) != 0 ||
+     getsockname(fd, (struct sockaddr *)&addr, &addr_len) != 0) {
+    printf("HTTP/3: cannot bind a loopback UDP socket\n");
+    close(fd);
+    return 4;
+  }
+  pid = fork();
+  if(pid < 0) {
+    close(fd);
+    return 4;
+  }
+  if(pid == 0)
+    _exit(http3_serve(fd, http3_body));
+  close(fd);
+
+  snprintf(url, sizeof(url), "https://127.0.0.1:%d/", ntohs(addr.sin_port));
+  response.len = 0;
+  curl_easy_setopt(curl, CURLOPT_URL, url);
+  curl_easy_setopt(curl, CURLOPT_HTTP_VERSION, (long)CURL_HTTP_VERSION_3ONLY);
+  curl_easy_setopt(curl, CURLOPT_TIMEOUT, 10L);
+  curl_easy_setopt(curl, CURLOPT_SSL_VERIFYPEER, 0L);
+  curl_easy_setopt(curl, CURLOPT_SSL_VERIFYHOST, 0L);
+  curl_easy_setopt(curl, CURLOPT_WRITEFUNCTION, write_cb);
+  curl_easy_setopt(curl, CURLOPT_WRITEDATA, &response);
+  res = curl_easy_perform(curl);
+  curl_easy_getinfo(curl, CURLINFO_HTTP_VERSION, &http_version);
+  curl_easy_getinfo(curl, CURLINFO_RESPONSE_CODE, &status);
+
+  kill(pid, SIGTERM);
+  waitpid(pid, NULL, 0);
+
+  printf("HTTP/3 transfer to %s: %s, status %ld\n", url, curl_easy_strerror(res), status);
+  if(res != CURLE_OK || http_version != CURL_HTTP_VERSION_3 || status != 200 ||
+     response.len != strlen(http3_body) || memcmp(response.data, http3_body, response.len) != 0) {
+    printf("HTTP/3: unexpected response\n");
+    return 4;
+  }
+  printf("HTTP/3: response body received from the loopback server\n");
+  return 0;
+}
+#endif
+
 int main(void)
 {
   CURL *curl;
@@ -23,9 +114,20 @@ int main(void)
     /* provide a buffer to store errors in */
     curl_easy_setopt(curl, CURLOPT_ERRORBUFFER, errbuf);
 
+#if defined(WITH_HTTP3)
+    if(id->features & CURL_VERSION_HTTP3) {
+      printf("quic version: %s\n", id->quic_version);
+      retval = test_http3(curl);
+    } else {
+      printf("HTTP/3 feature missing\n");
+      retval = 4;
+    }
+#endif
+
     /* always cleanup */
     curl_easy_cleanup(curl);
-    printf("Succeed\n");
+    if(retval == 0)
+      printf("Succeed\n");
   } else {
     printf("Failed to init curl\n");
     retval = 3;
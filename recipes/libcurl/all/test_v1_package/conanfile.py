@@ -10,6 +10,8 @@ class TestPackageConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
+        libcurl_options = self.options["libcurl"]
+        cmake.definitions["WITH_HTTP3"] = "with_http3" in libcurl_options and bool(libcurl_options.with_http3)
         cmake.configure()
         cmake.build()
 
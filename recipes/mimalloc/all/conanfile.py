@@ -1,11 +1,12 @@
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.microsoft import is_msvc, msvc_runtime_flag, VCVars
 from conan.tools.files import apply_conandata_patches, export_conandata_patches, get, copy, rm, rmdir, replace_in_file, save, collect_libs
 from conan.tools.build import check_min_cppstd
 from conan.tools.scm import Version
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 import os
+import re
 import shutil
 import textwrap
 
@@ -28,6 +29,13 @@ class MimallocConan(ConanFile):
         "override": [True, False],
         "inject": [True, False],
         "single_object": [True, False],
+        "opt_arch": [True, False],
+        "padding": [True, False],
+        "see_asm": [True, False],
+        "use_cxx": [True, False],
+        "debug_full": [True, False],
+        "large_os_pages": [True, False],
+        "reserve_os_memory": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -36,6 +44,13 @@ class MimallocConan(ConanFile):
         "override": False,
         "inject": False,
         "single_object": False,
+        "opt_arch": False,
+        "padding": True,
+        "see_asm": False,
+        "use_cxx": False,
+        "debug_full": False,
+        "large_os_pages": False,
+        "reserve_os_memory": None,
     }
 
 
@@ -65,6 +80,10 @@ class MimallocConan(ConanFile):
         if is_msvc(self):
             del self.options.single_object
             del self.options.inject
+            # MI_SEE_ASM relies on -save-temps
+            del self.options.see_asm
+        if Version(self.version) < "1.7.0":
+            del self.options.reserve_os_memory
 
     def configure(self):
         if self.options.shared:
@@ -110,6 +129,10 @@ class MimallocConan(ConanFile):
            self.options.get_safe("inject"):
             raise ConanInvalidConfiguration("Single object is incompatible with library injection")
 
+        if self._reserve_os_memory_kib is None:
+            raise ConanInvalidConfiguration(
+                f"{self.ref}:reserve_os_memory must be a size like 1073741824, 512MiB or 1GiB")
+
         if self.info.settings.compiler.cppstd:
             check_min_cppstd(self, self._min_cppstd)
         minimum_version = self._compilers_minimum_version.get(str(self.settings.compiler), False)
@@ -118,17 +141,77 @@ class MimallocConan(ConanFile):
                 f"{self.ref} requires C++{self._min_cppstd}, which your compiler does not support."
             )
 
+    @property
+    def _reserve_os_memory_kib(self):
+        # mimalloc stores option values in KiB (sizes are rounded up), returns 0 when not set and None when invalid
+        value = str(self.options.get_safe("reserve_os_memory"))
+        if value == "None":
+            return 0
+        match = re.fullmatch(r"(\d+)\s*(|KiB|MiB|GiB)", value)
+        if not match:
+            return None
+        factor = {"": 1, "KiB": 1024, "MiB": 1024 ** 2, "GiB": 1024 ** 3}[match.group(2)]
+        return -(-int(match.group(1)) * factor // 1024)
+
+    @property
+    def _has_opt_arch(self):
+        # MI_OPT_ARCH appeared in mimalloc 1.8.8 and 2.1.8
+        version = Version(self.version)
+        return version >= "2.1.8" or ("1.8.8" <= version < "2.0.0")
+
+    @property
+    def _opt_arch_flags(self):
+        # Same flags MI_OPT_ARCH adds in newer mimalloc versions
+        if is_msvc(self):
+            return "/arch:AVX2" if self.settings.arch == "x86_64" else ""
+        if self.settings.compiler in ("gcc", "clang", "apple-clang"):
+            return {
+                "x86_64": "-march=haswell",
+                "armv8": "-march=armv8.1-a",
+            }.get(str(self.settings.arch), "")
+        return ""
+
+    @property
+    def _variant(self):
+        variant = []
+        for option in ("secure", "opt_arch", "padding", "use_cxx", "debug_full", "large_os_pages"):
+            if self.options.get_safe(option):
+                variant.append(option)
+        if self._reserve_os_memory_kib:
+            variant.append(f"reserve_os_memory={self._reserve_os_memory_kib}KiB")
+        return ",".join(variant) or "default"
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], destination=self.source_folder, strip_root=True)
 
     def generate(self):
         tc = CMakeToolchain(self)
+        if not self._has_opt_arch and self.options.opt_arch and self._opt_arch_flags:
+            opt_arch_flags = self._opt_arch_flags
+
+            # Versions without MI_OPT_ARCH: add the -march flags after the profile ones in the toolchain
+            class OptArchFlagsBlock:
+                template = textwrap.dedent("""\
+                    string(APPEND CMAKE_C_FLAGS_INIT " {{ flags }}")
+                    string(APPEND CMAKE_CXX_FLAGS_INIT " {{ flags }}")
+                """)
+
+                def context(self):
+                    return {"flags": opt_arch_flags}
+
+            tc.blocks["opt_arch_flags"] = OptArchFlagsBlock
         tc.variables["MI_BUILD_TESTS"] = "OFF"
         tc.variables["MI_BUILD_SHARED"] = self.options.shared
         tc.variables["MI_BUILD_STATIC"] = not self.options.shared
         tc.variables["MI_BUILD_OBJECT"] = self.options.get_safe("single_object", False)
         tc.variables["MI_OVERRIDE"] = "ON" if self.options.override else "OFF"
         tc.variables["MI_SECURE"] = "ON" if self.options.secure else "OFF"
+        tc.variables["MI_PADDING"] = self.options.padding
+        tc.variables["MI_SEE_ASM"] = self.options.get_safe("see_asm", False)
+        tc.variables["MI_USE_CXX"] = self.options.use_cxx
+        tc.variables["MI_DEBUG_FULL"] = self.options.debug_full
+        if self._has_opt_arch:
+            tc.variables["MI_OPT_ARCH"] = self.options.opt_arch
         if Version(self.version) >= "1.7.0":
             tc.variables["MI_INSTALL_TOPLEVEL"] = "ON"
         tc.generate()
@@ -137,8 +220,23 @@ class MimallocConan(ConanFile):
             vcvars = VCVars(self)
             vcvars.generate()
 
+    def _patch_option_default(self, option, value):
+        # Compile a different default in the options table of src/options.c, environment variables still win
+        options_c = os.path.join(self.source_folder, "src", "options.c")
+        with open(options_c, encoding="utf-8") as f:
+            content = f.read()
+        pattern = r"\{\s*0\s*,\s*UNINIT\s*,\s*MI_OPTION\(" + option + r"\)"
+        content, count = re.subn(pattern, f"{{ {value}, UNINIT, MI_OPTION({option})", content)
+        if count != 1:
+            raise ConanException(f"Could not change the default of mimalloc option {option}")
+        save(self, options_c, content)
+
     def build(self):
         apply_conandata_patches(self)
+        if self.options.large_os_pages:
+            self._patch_option_default("large_os_pages", 1)
+        if self._reserve_os_memory_kib:
+            self._patch_option_default("reserve_os_memory", self._reserve_os_memory_kib)
         if is_msvc(self) and self.settings.arch == "x86":
             replace_in_file(self, os.path.join(self.source_folder, "CMakeLists.txt"),
                             "mimalloc-redirect.lib",
@@ -226,6 +324,10 @@ class MimallocConan(ConanFile):
         self.cpp_info.set_property("cmake_file_name", "mimalloc")
         self.cpp_info.set_property("cmake_target_name", "mimalloc" if self.options.shared else "mimalloc-static")
 
+        self.conf_info.define("user.mimalloc:variant", self._variant)
+        # TODO: to remove in conan v2
+        self.user_info.variant = self._variant
+
         self.cpp_info.names["cmake_find_package"] = "mimalloc"
         self.cpp_info.names["cmake_find_package_multi"] = "mimalloc"
         self.cpp_info.builddirs.append(self._module_subfolder)
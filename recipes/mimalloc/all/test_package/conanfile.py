@@ -107,3 +107,7 @@ class MimallocTestConan(ConanFile):
             test_package_cpp = os.path.join(self.cpp.build.bindirs[0], f"{file}_cpp")
             self.output.info("test: {}".format(test_package_cpp))
             self.run(test_package_cpp, run_environment=True)
+
+        if "mi_api" in test_files:
+            self.output.info("mimalloc variant: {}".format(self.dependencies["mimalloc"].conf_info.get("user.mimalloc:variant")))
+            self.run(os.path.join(self.cpp.build.bindirs[0], "throughput"), run_environment=True)
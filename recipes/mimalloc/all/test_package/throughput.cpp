@@ -0,0 +1,78 @@
+#include "mimalloc.h"
+
+#include <algorithm>
+#include <chrono>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <thread>
+#include <vector>
+
+// Small multi-threaded alloc/free benchmark, compares mi_malloc with the system allocator
+
+static const std::size_t kRounds = 2000;
+static const std::size_t kBlocks = 256;
+
+struct Allocator {
+    const char *name;
+    void *(*allocate)(std::size_t);
+    void (*release)(void *);
+};
+
+static void *system_malloc(std::size_t size) { return std::malloc(size); }
+static void system_free(void *ptr) { std::free(ptr); }
+
+static void worker(const Allocator &allocator, unsigned seed, std::uint64_t *checksum) {
+    std::vector<void *> blocks(kBlocks, nullptr);
+    std::uint64_t sum = 0;
+    for (std::size_t round = 0; round < kRounds; ++round) {
+        for (std::size_t i = 0; i < kBlocks; ++i) {
+            seed = seed * 1103515245u + 12345u;
+            const std::size_t size = 16 + (seed >> 16) % 1024;
+            unsigned char *block = static_cast<unsigned char *>(allocator.allocate(size));
+            block[0] = static_cast<unsigned char>(i);
+            block[size - 1] = static_cast<unsigned char>(round);
+            blocks[i] = block;
+        }
+        // Free in a different order than the allocations
+        for (std::size_t i = 0; i < kBlocks; ++i) {
+            const std::size_t index = (i * 7) % kBlocks;
+            sum += static_cast<unsigned char *>(blocks[index])[0];
+            allocator.release(blocks[index]);
+        }
+    }
+    *checksum = sum;
+}
+
+static bool run(const Allocator &allocator, unsigned threads) {
+    std::vector<std::thread> workers;
+    std::vector<std::uint64_t> checksums(threads, 0);
+    const auto start = std::chrono::steady_clock::now();
+    for (unsigned t = 0; t < threads; ++t) {
+        workers.emplace_back(worker, std::cref(allocator), 42u + t, &checksums[t]);
+    }
+    for (auto &thread : workers) {
+        thread.join();
+    }
+    const double seconds = std::max(1e-9, std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count());
+    const double operations = static_cast<double>(threads) * kRounds * kBlocks;
+    std::printf("%-8s %u thread(s): %8.2f M malloc+free/s\n", allocator.name, threads, operations / seconds / 1e6);
+
+    // Every block got (i % 256) written in its first byte
+    const std::uint64_t expected = static_cast<std::uint64_t>(kRounds) * (kBlocks * (kBlocks - 1) / 2);
+    return std::all_of(checksums.begin(), checksums.end(), [expected](std::uint64_t it) { return it == expected; });
+}
+
+int main() {
+    const Allocator mimalloc = {"mimalloc", mi_malloc, mi_free};
+    const Allocator system = {"system", system_malloc, system_free};
+    const unsigned threads = std::max(1u, std::min(4u, std::thread::hardware_concurrency()));
+
+    std::printf("mimalloc version %d\n", mi_version());
+    bool ok = true;
+    for (unsigned count = 1; count <= threads; count *= 2) {
+        ok = run(mimalloc, count) && ok;
+        ok = run(system, count) && ok;
+    }
+    return ok ? EXIT_SUCCESS : EXIT_FAILURE;
+}
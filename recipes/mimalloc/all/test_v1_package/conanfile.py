@@ -89,3 +89,7 @@ class MimallocTestConan(ConanFile):
                 test_package_cpp = os.path.join("bin", file + "_cpp")
                 self.output.info("test: {}".format(test_package_cpp))
                 self.run(test_package_cpp, run_environment=True)
+
+            if "mi_api" in self._test_files:
+                self.output.info("mimalloc variant: {}".format(self.deps_user_info["mimalloc"].variant))
+                self.run(os.path.join("bin", "throughput"), run_environment=True)
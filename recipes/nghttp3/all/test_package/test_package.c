@@ -0,0 +1,19 @@
+#include <stdio.h>
+
+#include <nghttp3/nghttp3.h>
+
+int main(void) {
+    const nghttp3_info *info = nghttp3_version(0);
+    nghttp3_settings settings;
+
+    if (info == NULL) {
+        printf("nghttp3: cannot get version\n");
+        return 1;
+    }
+    printf("nghttp3 version: %s\n", info->version_str);
+
+    nghttp3_settings_default(&settings);
+    printf("nghttp3 default max_field_section_size: %llu\n",
+           (unsigned long long)settings.max_field_section_size);
+    return 0;
+}
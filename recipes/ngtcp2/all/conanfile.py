@@ -0,0 +1,98 @@
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
+from conan.tools.files import copy, get, rm, rmdir
+import os
+
+
+required_conan_version = ">=1.53.0"
+
+
+class Ngtcp2Conan(ConanFile):
+    name = "ngtcp2"
+    description = "ngtcp2 project is an effort to implement IETF QUIC protocol"
+    license = "MIT"
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://github.com/ngtcp2/ngtcp2"
+    topics = ("quic", "http3", "networking")
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "with_openssl": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "with_openssl": True,
+    }
+
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+
+    def configure(self):
+        if self.options.shared:
+            self.options.rm_safe("fPIC")
+        self.settings.rm_safe("compiler.libcxx")
+        self.settings.rm_safe("compiler.cppstd")
+
+    def layout(self):
+        cmake_layout(self, src_folder="src")
+
+    def requirements(self):
+        if self.options.with_openssl:
+            # ngtcp2_crypto_openssl needs the QUIC API of the quictls fork (SSL_provide_quic_data & co)
+            self.requires("quictls/3.0.8+quic1")
+
+    def validate(self):
+        if self.options.with_openssl and self.dependencies.get("quictls") is None:
+            # plain openssl (e.g. replacing quictls in the graph) lacks the QUIC API
+            raise ConanInvalidConfiguration(f"{self.ref} crypto backend requires quictls, not openssl")
+
+    def source(self):
+        get(self, **self.conan_data["sources"][self.version], strip_root=True)
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.variables["ENABLE_SHARED_LIB"] = self.options.shared
+        tc.variables["ENABLE_STATIC_LIB"] = not self.options.shared
+        tc.variables["ENABLE_OPENSSL"] = self.options.with_openssl
+        tc.variables["ENABLE_GNUTLS"] = False
+        tc.variables["ENABLE_BORINGSSL"] = False
+        tc.variables["ENABLE_PICOTLS"] = False
+        tc.variables["ENABLE_WOLFSSL"] = False
+        tc.variables["BUILD_TESTING"] = False
+        # examples are only built when these are found, don't pick them from the system
+        tc.variables["CMAKE_DISABLE_FIND_PACKAGE_Libev"] = True
+        tc.variables["CMAKE_DISABLE_FIND_PACKAGE_Libnghttp3"] = True
+        tc.variables["CMAKE_DISABLE_FIND_PACKAGE_Jemalloc"] = True
+        tc.generate()
+
+        deps = CMakeDeps(self)
+        deps.generate()
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def package(self):
+        copy(self, pattern="COPYING", dst=os.path.join(self.package_folder, "licenses"), src=self.source_folder)
+        cmake = CMake(self)
+        cmake.install()
+        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        rmdir(self, os.path.join(self.package_folder, "share"))
+        rm(self, "*.pdb", os.path.join(self.package_folder, "lib"))
+        rm(self, "*.pdb", os.path.join(self.package_folder, "bin"))
+
+    def package_info(self):
+        self.cpp_info.components["ngtcp2"].set_property("pkg_config_name", "libngtcp2")
+        self.cpp_info.components["ngtcp2"].libs = ["ngtcp2"]
+        if self.settings.os == "Windows" and not self.options.shared:
+            self.cpp_info.components["ngtcp2"].defines.append("NGTCP2_STATICLIB")
+
+        if self.options.with_openssl:
+            self.cpp_info.components["ngtcp2_crypto_openssl"].set_property("pkg_config_name", "libngtcp2_crypto_openssl")
+            self.cpp_info.components["ngtcp2_crypto_openssl"].libs = ["ngtcp2_crypto_openssl"]
+            self.cpp_info.components["ngtcp2_crypto_openssl"].requires = ["ngtcp2", "quictls::ssl", "quictls::crypto"]
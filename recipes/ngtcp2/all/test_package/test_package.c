@@ -0,0 +1,18 @@
+#include <stdio.h>
+
+#include <ngtcp2/ngtcp2.h>
+
+int main(void) {
+    const ngtcp2_info *info = ngtcp2_version(0);
+    ngtcp2_settings settings;
+
+    if (info == NULL) {
+        printf("ngtcp2: cannot get version\n");
+        return 1;
+    }
+    printf("ngtcp2 version: %s\n", info->version_str);
+
+    ngtcp2_settings_default(&settings);
+    printf("ngtcp2 default max_tx_udp_payload_size: %lu\n", (unsigned long)settings.max_tx_udp_payload_size);
+    return 0;
+}
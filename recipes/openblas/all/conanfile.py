@@ -2,6 +2,7 @@ from conans import ConanFile, CMake, tools
 from conans.errors import ConanInvalidConfiguration
 import os
 import functools
+import re
 
 required_conan_version = ">=1.43.0"
 
@@ -18,15 +19,23 @@ class OpenblasConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "build_lapack": [True, False],
-        "use_thread": [True, False],
+        "use_thread": [True, False, "deprecated"],
+        "threading": ["none", "pthreads", "openmp"],
+        "num_threads": [None, "ANY"],
+        "target": [None, "ANY"],
         "dynamic_arch": [True, False],
+        "dynamic_list": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "build_lapack": False,
-        "use_thread": True,
+        "use_thread": "deprecated",
+        "threading": "pthreads",
+        "num_threads": None,
+        "target": None,
         "dynamic_arch": False,
+        "dynamic_list": None,
     }
     generators = "cmake"
     short_paths = True
@@ -39,6 +48,14 @@ class OpenblasConan(ConanFile):
     def _build_subfolder(self):
         return "build_subfolder"
 
+    @property
+    def _dynamic_list(self):
+        return [it for it in re.split(r"[\s,;]+", str(self.options.get_safe("dynamic_list") or "")) if it]
+
+    @property
+    def _openmp_lib(self):
+        return "gomp" if self.settings.compiler == "gcc" else "iomp5" if self.settings.compiler == "intel-cc" else "omp"
+
     def export_sources(self):
         self.copy("CMakeLists.txt")
 
@@ -49,8 +66,35 @@ class OpenblasConan(ConanFile):
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
+        # TODO: to remove once deprecated use_thread option removed
+        if self.options.use_thread != "deprecated":
+            self.output.warn("use_thread option is deprecated, please use threading option instead")
+            self.options.threading = "pthreads" if self.options.use_thread else "none"
+        if not self.options.dynamic_arch:
+            del self.options.dynamic_list
+
+    def package_id(self):
+        # TODO: to remove once deprecated use_thread option removed
+        del self.info.options.use_thread
 
     def validate(self):
+        num_threads = str(self.options.num_threads)
+        if num_threads != "None" and (not num_threads.isdigit() or int(num_threads) == 0):
+            raise ConanInvalidConfiguration("num_threads must be a positive integer")
+        if self.options.target and not re.fullmatch(r"[A-Z0-9_]+", str(self.options.target)):
+            raise ConanInvalidConfiguration(
+                "target must be an OpenBLAS TARGET name, as listed in TargetList.txt (e.g. HASWELL, SKYLAKEX, ZEN)"
+            )
+        if self.options.get_safe("dynamic_list") and not all(
+            re.fullmatch(r"[A-Z0-9_]+", it) for it in self._dynamic_list
+        ):
+            raise ConanInvalidConfiguration(
+                "dynamic_list must be a list of OpenBLAS TARGET names separated by spaces or commas"
+            )
+        if self.options.threading == "openmp" and self.settings.compiler not in ["gcc", "clang", "intel-cc"]:
+            raise ConanInvalidConfiguration(
+                f"threading=openmp is not supported with {self.settings.compiler} by this recipe"
+            )
         if hasattr(self, "settings_build") and tools.cross_building(self, skip_x64_x86=True):
             raise ConanInvalidConfiguration("Cross-building not implemented")
 
@@ -70,10 +114,20 @@ class OpenblasConan(ConanFile):
         cmake.definitions["NOFORTRAN"] = not self.options.build_lapack
         cmake.definitions["BUILD_WITHOUT_LAPACK"] = not self.options.build_lapack
         cmake.definitions["DYNAMIC_ARCH"] = self.options.dynamic_arch
-        cmake.definitions["USE_THREAD"] = self.options.use_thread
+        if self.options.get_safe("dynamic_list"):
+            # Kernels built in addition to the generic one, instead of all the kernels of the architecture
+            cmake.definitions["DYNAMIC_LIST"] = ";".join(self._dynamic_list)
+        if self.options.target:
+            # Single kernel build, or baseline of the common code with dynamic_arch
+            cmake.definitions["TARGET"] = str(self.options.target)
+        cmake.definitions["USE_THREAD"] = self.options.threading != "none"
+        cmake.definitions["USE_OPENMP"] = self.options.threading == "openmp"
+        if str(self.options.num_threads) != "None":
+            # Default is the number of cores of the build machine
+            cmake.definitions["NUM_THREADS"] = int(str(self.options.num_threads))
 
         # Required for safe concurrent calls to OpenBLAS routines
-        cmake.definitions["USE_LOCKING"] = not self.options.use_thread
+        cmake.definitions["USE_LOCKING"] = self.options.threading == "none"
 
         cmake.definitions[
             "MSVC_STATIC_CRT"
@@ -123,11 +177,14 @@ endif()"""
         # CMake config file:
         # - OpenBLAS always has one and only one of these components: openmp, pthread or serial.
         # - Whatever if this component is requested or not, official CMake imported target is always OpenBLAS::OpenBLAS
-        # - TODO: add openmp component when implemented in this recipe
         self.cpp_info.set_property("cmake_file_name", "OpenBLAS")
         self.cpp_info.set_property("cmake_target_name", "OpenBLAS::OpenBLAS")
         self.cpp_info.set_property("pkg_config_name", "openblas")
-        cmake_component_name = "pthread" if self.options.use_thread else "serial" # TODO: ow to model this in CMakeDeps?
+        cmake_component_name = {
+            "none": "serial",
+            "pthreads": "pthread",
+            "openmp": "openmp",
+        }[str(self.options.threading)] # TODO: ow to model this in CMakeDeps?
         self.cpp_info.components["openblas_component"].set_property("pkg_config_name", "openblas")
         self.cpp_info.components["openblas_component"].includedirs.append(
             os.path.join("include", "openblas")
@@ -135,10 +192,12 @@ endif()"""
         self.cpp_info.components["openblas_component"].libs = tools.collect_libs(self)
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["openblas_component"].system_libs.append("m")
-            if self.options.use_thread:
+            if self.options.threading != "none":
                 self.cpp_info.components["openblas_component"].system_libs.append("pthread")
             if self.options.build_lapack:
                 self.cpp_info.components["openblas_component"].system_libs.append("gfortran")
+        if self.options.threading == "openmp":
+            self.cpp_info.components["openblas_component"].system_libs.append(self._openmp_lib)
 
         self.output.info(
             "Setting OpenBLAS_HOME environment variable: {}".format(self.package_folder)
@@ -1,6 +1,28 @@
 #include <cblas.h>
 #include <stdio.h>
 
+#include <chrono>
+#include <vector>
+
+static void gemm_gflops(int n)
+{
+  std::vector<double> A(static_cast<size_t>(n) * n, 1.0);
+  std::vector<double> B(static_cast<size_t>(n) * n, 2.0);
+  std::vector<double> C(static_cast<size_t>(n) * n, 0.0);
+
+  // warm up the thread pool and the caches
+  cblas_dgemm(CblasColMajor, CblasNoTrans, CblasNoTrans, n, n, n, 1.0, A.data(), n, B.data(), n, 0.0, C.data(), n);
+
+  const int repetitions = 5;
+  const auto start = std::chrono::steady_clock::now();
+  for (int i = 0; i < repetitions; i++)
+    cblas_dgemm(CblasColMajor, CblasNoTrans, CblasNoTrans, n, n, n, 1.0, A.data(), n, B.data(), n, 0.0, C.data(), n);
+  const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+
+  const double flops = 2.0 * n * n * n * repetitions;
+  printf("dgemm %dx%d: %.2f GFLOP/s\n", n, n, flops / elapsed.count() / 1e9);
+}
+
 int main()
 {
   int i=0;
@@ -12,4 +34,9 @@ int main()
   for(i=0; i<9; i++)
     printf("%lf ", C[i]);
   printf("\n");
+
+  printf("OpenBLAS %s, core: %s, threads: %d\n", openblas_get_config(), openblas_get_corename(),
+         openblas_get_num_threads());
+  gemm_gflops(512);
+  return 0;
 }
@@ -25,6 +25,7 @@ class OpenSSLConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "enable_weak_ssl_ciphers": [True, False],
+        "enable_ktls": [True, False],
         "386": [True, False],
         "capieng_dialog": [True, False],
         "enable_capieng": [True, False],
@@ -107,6 +108,10 @@ class OpenSSLConan(ConanFile):
         else:
             del self.options.fPIC
 
+        # kernel TLS offload is only implemented by OpenSSL for Linux and FreeBSD
+        if self.settings.os not in ("Linux", "FreeBSD"):
+            del self.options.enable_ktls
+
         if self.settings.os == "Emscripten":
             self.options.no_asm = True
             self.options.no_threads = True
@@ -136,6 +141,8 @@ class OpenSSLConan(ConanFile):
         if self.settings.os == "Emscripten":
             if not all((self.options.no_asm, self.options.no_threads, self.options.no_stdio)):
                 raise ConanInvalidConfiguration("os=Emscripten requires openssl:{no_asm,no_threads,no_stdio}=True")
+        if self.options.get_safe("enable_ktls") and self.options.no_sock:
+            raise ConanInvalidConfiguration("openssl:enable_ktls=True requires openssl:no_sock=False")
 
     @property
     def _is_clangcl(self):
@@ -758,6 +765,8 @@ class OpenSSLConan(ConanFile):
         self.cpp_info.components["ssl"].names["cmake_find_package"] = "SSL"
         self.cpp_info.components["ssl"].names["cmake_find_package_multi"] = "SSL"
 
+        self.user_info.ktls = bool(self.options.get_safe("enable_ktls", False))
+
         openssl_modules_dir = os.path.join(self.package_folder, "lib", "ossl-modules")
         self.runenv_info.define_path("OPENSSL_MODULES", openssl_modules_dir)
 
@@ -12,12 +12,16 @@ class TestPackageConan(ConanFile):
             ((not self.options["openssl"].no_md4) or
               (not self.options["openssl"].no_rmd160)))
 
+    def _with_ktls(self):
+        return self.settings.os in ("Linux", "FreeBSD") and self.options["openssl"].enable_ktls
+
     def build(self):
         cmake = CMake(self)
         cmake.definitions["OPENSSL_WITH_ZLIB"] = not self.options["openssl"].no_zlib
         cmake.definitions["OPENSSL_WITH_LEGACY"] = self._with_legacy()
         cmake.definitions["OPENSSL_WITH_MD4"] = not self.options["openssl"].no_md4
         cmake.definitions["OPENSSL_WITH_RIPEMD160"] = not self.options["openssl"].no_rmd160
+        cmake.definitions["OPENSSL_WITH_KTLS"] = self._with_ktls()
         if self.settings.os == "Android":
             cmake.definitions["CONAN_LIBCXX"] = ""
         cmake.configure()
@@ -32,6 +36,11 @@ class TestPackageConan(ConanFile):
                 bin_legacy_path = os.path.join("bin", "digest_legacy")
                 self.run(bin_legacy_path, run_environment=True)
 
+            if self._with_ktls():
+                # skips itself when the running kernel has no TLS ULP support
+                bin_ktls_path = os.path.join("bin", "ktls")
+                self.run(bin_ktls_path, run_environment=True)
+
             if not self.options["openssl"].no_stdio:
                 self.run("openssl version", run_environment=True)
         assert os.path.exists(os.path.join(self.deps_cpp_info["openssl"].rootpath, "licenses", "LICENSE.txt"))
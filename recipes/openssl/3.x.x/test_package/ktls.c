@@ -0,0 +1,220 @@
+#include <openssl/bio.h>
+#include <openssl/err.h>
+#include <openssl/evp.h>
+#include <openssl/ssl.h>
+#include <openssl/x509.h>
+
+#include <arpa/inet.h>
+#include <errno.h>
+#include <fcntl.h>
+#include <netinet/in.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/socket.h>
+#include <unistd.h>
+
+#define PAYLOAD_SIZE 16384
+
+static int set_nonblocking(int fd) {
+    int flags = fcntl(fd, F_GETFL, 0);
+    return flags < 0 ? -1 : fcntl(fd, F_SETFL, flags | O_NONBLOCK);
+}
+
+static int loopback_pair(int *server_fd, int *client_fd) {
+    struct sockaddr_in addr;
+    socklen_t addr_len = sizeof(addr);
+    int listen_fd = socket(AF_INET, SOCK_STREAM, 0);
+
+    if (listen_fd < 0) {
+        return -1;
+    }
+    memset(&addr, 0, sizeof(addr));
+    addr.sin_family = AF_INET;
+    addr.sin_addr.s_addr = htonl(INADDR_LOOPBACK);
+    addr.sin_port = 0;
+    if (bind(listen_fd, (struct sockaddr *)&addr, sizeof(addr)) != 0 ||
+        listen(listen_fd, 1) != 0 ||
+        getsockname(listen_fd, (struct sockaddr *)&addr, &addr_len) != 0) {
+        close(listen_fd);
+        return -1;
+    }
+    *client_fd = socket(AF_INET, SOCK_STREAM, 0);
+    if (*client_fd < 0 || connect(*client_fd, (struct sockaddr *)&addr, sizeof(addr)) != 0) {
+        close(listen_fd);
+        return -1;
+    }
+    *server_fd = accept(listen_fd, NULL, NULL);
+    close(listen_fd);
+    if (*server_fd < 0) {
+        return -1;
+    }
+    if (set_nonblocking(*server_fd) != 0 || set_nonblocking(*client_fd) != 0) {
+        return -1;
+    }
+    return 0;
+}
+
+static int self_signed(EVP_PKEY **pkey, X509 **cert) {
+    X509_NAME *name;
+
+    *pkey = EVP_EC_gen("P-256");
+    *cert = X509_new();
+    if (*pkey == NULL || *cert == NULL) {
+        return -1;
+    }
+    X509_set_version(*cert, 2);
+    ASN1_INTEGER_set(X509_get_serialNumber(*cert), 1);
+    X509_gmtime_adj(X509_getm_notBefore(*cert), 0);
+    X509_gmtime_adj(X509_getm_notAfter(*cert), 3600);
+    X509_set_pubkey(*cert, *pkey);
+    name = X509_get_subject_name(*cert);
+    X509_NAME_add_entry_by_txt(name, "CN", MBSTRING_ASC, (const unsigned char *)"localhost", -1, -1, 0);
+    X509_set_issuer_name(*cert, name);
+    return X509_sign(*cert, *pkey, EVP_sha256()) > 0 ? 0 : -1;
+}
+
+static int is_retry(SSL *ssl, int ret) {
+    int err = SSL_get_error(ssl, ret);
+    return err == SSL_ERROR_WANT_READ || err == SSL_ERROR_WANT_WRITE;
+}
+
+static int handshake(SSL *server, SSL *client) {
+    int server_done = 0;
+    int client_done = 0;
+
+    while (!server_done || !client_done) {
+        if (!client_done) {
+            int ret = SSL_connect(client);
+            if (ret == 1) {
+                client_done = 1;
+            } else if (!is_retry(client, ret)) {
+                return -1;
+            }
+        }
+        if (!server_done) {
+            int ret = SSL_accept(server);
+            if (ret == 1) {
+                server_done = 1;
+            } else if (!is_retry(server, ret)) {
+                return -1;
+            }
+        }
+    }
+    return 0;
+}
+
+int main(void) {
+    EVP_PKEY *pkey = NULL;
+    X509 *cert = NULL;
+    SSL_CTX *server_ctx = NULL;
+    SSL_CTX *client_ctx = NULL;
+    SSL *server = NULL;
+    SSL *client = NULL;
+    int server_fd = -1;
+    int client_fd = -1;
+    int file_fd = -1;
+    char path[] = "/tmp/conan_ktls_XXXXXX";
+    unsigned char payload[PAYLOAD_SIZE];
+    unsigned char received[PAYLOAD_SIZE];
+    size_t received_len = 0;
+    ossl_ssize_t sent;
+    int result = EXIT_FAILURE;
+    size_t i;
+
+    printf("OpenSSL version: %s\n", OpenSSL_version(OPENSSL_VERSION));
+
+    if (self_signed(&pkey, &cert) != 0) {
+        fprintf(stderr, "could not create a self-signed certificate\n");
+        goto cleanup;
+    }
+
+    server_ctx = SSL_CTX_new(TLS_server_method());
+    client_ctx = SSL_CTX_new(TLS_client_method());
+    if (server_ctx == NULL || client_ctx == NULL ||
+        SSL_CTX_use_certificate(server_ctx, cert) != 1 ||
+        SSL_CTX_use_PrivateKey(server_ctx, pkey) != 1) {
+        fprintf(stderr, "could not create the TLS contexts\n");
+        goto cleanup;
+    }
+    /* AES-128-GCM is the cipher every kTLS capable kernel supports */
+    SSL_CTX_set_ciphersuites(server_ctx, "TLS_AES_128_GCM_SHA256");
+    SSL_CTX_set_cipher_list(server_ctx, "ECDHE-ECDSA-AES128-GCM-SHA256");
+    SSL_CTX_set_options(server_ctx, SSL_OP_ENABLE_KTLS);
+
+    if (loopback_pair(&server_fd, &client_fd) != 0) {
+        printf("SKIPPED: no loopback TCP socket available (%s)\n", strerror(errno));
+        result = EXIT_SUCCESS;
+        goto cleanup;
+    }
+
+    server = SSL_new(server_ctx);
+    client = SSL_new(client_ctx);
+    SSL_set_fd(server, server_fd);
+    SSL_set_fd(client, client_fd);
+    if (handshake(server, client) != 0) {
+        fprintf(stderr, "TLS handshake failed\n");
+        ERR_print_errors_fp(stderr);
+        goto cleanup;
+    }
+
+    if (!BIO_get_ktls_send(SSL_get_wbio(server))) {
+        printf("SKIPPED: kernel TLS transmit offload is not available on this kernel\n");
+        result = EXIT_SUCCESS;
+        goto cleanup;
+    }
+
+    for (i = 0; i < sizeof(payload); ++i) {
+        payload[i] = (unsigned char)(i * 31u + 7u);
+    }
+    file_fd = mkstemp(path);
+    if (file_fd < 0 || write(file_fd, payload, sizeof(payload)) != (ssize_t)sizeof(payload)) {
+        fprintf(stderr, "could not write the payload file\n");
+        goto cleanup;
+    }
+    unlink(path);
+
+    sent = SSL_sendfile(server, file_fd, 0, sizeof(payload), 0);
+    if (sent != (ossl_ssize_t)sizeof(payload)) {
+        fprintf(stderr, "SSL_sendfile sent %ld of %lu bytes\n", (long)sent, (unsigned long)sizeof(payload));
+        ERR_print_errors_fp(stderr);
+        goto cleanup;
+    }
+
+    while (received_len < sizeof(payload)) {
+        int ret = SSL_read(client, received + received_len, (int)(sizeof(received) - received_len));
+        if (ret > 0) {
+            received_len += (size_t)ret;
+        } else if (!is_retry(client, ret)) {
+            fprintf(stderr, "SSL_read failed after %lu bytes\n", (unsigned long)received_len);
+            ERR_print_errors_fp(stderr);
+            goto cleanup;
+        }
+    }
+
+    if (memcmp(payload, received, sizeof(payload)) != 0) {
+        fprintf(stderr, "payload mismatch after SSL_sendfile round trip\n");
+        goto cleanup;
+    }
+
+    printf("SSL_sendfile round trip of %lu bytes over kTLS succeeded\n", (unsigned long)sizeof(payload));
+    result = EXIT_SUCCESS;
+
+cleanup:
+    if (file_fd >= 0) {
+        close(file_fd);
+    }
+    SSL_free(server);
+    SSL_free(client);
+    if (server_fd >= 0) {
+        close(server_fd);
+    }
+    if (client_fd >= 0) {
+        close(client_fd);
+    }
+    SSL_CTX_free(server_ctx);
+    SSL_CTX_free(client_ctx);
+    X509_free(cert);
+    EVP_PKEY_free(pkey);
+    return result;
+}
@@ -0,0 +1,335 @@
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.build import cross_building
+from conan.tools.files import get, rename, rmdir
+from conan.tools.microsoft import is_msvc, msvc_runtime_flag
+from conans import AutoToolsBuildEnvironment, tools
+import fnmatch
+import functools
+import os
+import textwrap
+
+required_conan_version = ">=1.47.0"
+
+
+class QuictlsConan(ConanFile):
+    name = "quictls"
+    settings = "os", "arch", "compiler", "build_type"
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://github.com/quictls/openssl"
+    license = "Apache-2.0"
+    topics = ("openssl", "quic", "ssl", "tls", "encryption", "security")
+    description = "Fork of OpenSSL adding the QUIC API (SSL_set_quic_method & co) used by QUIC implementations"
+    # drop-in replacement of OpenSSL, same libraries and CMake targets: both can't be in the same graph
+    provides = "openssl"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "no_asm": [True, False],
+        "no_threads": [True, False],
+        "openssldir": "ANY",
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "no_asm": False,
+        "no_threads": False,
+        "openssldir": None,
+    }
+
+    @property
+    def _source_subfolder(self):
+        return "source_subfolder"
+
+    @property
+    def _settings_build(self):
+        return getattr(self, "settings_build", self.settings)
+
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+
+    def configure(self):
+        if self.options.shared:
+            del self.options.fPIC
+        del self.settings.compiler.libcxx
+        del self.settings.compiler.cppstd
+
+    def build_requirements(self):
+        if self._settings_build.os == "Windows":
+            if not self._win_bash:
+                self.build_requires("strawberryperl/5.30.0.1")
+            if not self.options.no_asm and not tools.which("nasm"):
+                self.build_requires("nasm/2.15.05")
+        if self._win_bash:
+            if not tools.get_env("CONAN_BASH_PATH"):
+                self.build_requires("msys2/cci.latest")
+
+    def validate(self):
+        # only the desktop targets used by QUIC stacks are handled, use openssl for the others
+        if self.settings.os not in ("Linux", "FreeBSD", "Macos", "Windows"):
+            raise ConanInvalidConfiguration(f"quictls doesn't support os={self.settings.os}, only Linux, FreeBSD, Macos and Windows")
+        if self.settings.os == "Windows" and self.settings.get_safe("os.subsystem") == "cygwin":
+            raise ConanInvalidConfiguration("quictls doesn't support Cygwin")
+
+    @property
+    def _is_clangcl(self):
+        return self.settings.compiler == "clang" and self.settings.os == "Windows"
+
+    @property
+    def _is_mingw(self):
+        return self.settings.os == "Windows" and self.settings.compiler == "gcc"
+
+    @property
+    def _use_nmake(self):
+        return self._is_clangcl or is_msvc(self)
+
+    def source(self):
+        get(self, **self.conan_data["sources"][self.version],
+            destination=self._source_subfolder, strip_root=True)
+
+    @property
+    def _target(self):
+        target = f"conan-{self.settings.build_type}-{self.settings.os}-{self.settings.arch}-{self.settings.compiler}-{self.settings.compiler.version}"
+        if self._use_nmake:
+            target = f"VC-{target}"  # VC- prefix is important as it's checked by Configure
+        if self._is_mingw:
+            target = f"mingw-{target}"
+        return target
+
+    @property
+    def _targets(self):
+        return {
+            "Linux-x86-clang": "linux-x86-clang",
+            "Linux-x86_64-clang": "linux-x86_64-clang",
+            "Linux-x86-*": "linux-x86",
+            "Linux-x86_64-*": "linux-x86_64",
+            "Linux-armv7*-*": "linux-armv4",
+            "Linux-armv8-*": "linux-aarch64",
+            "Linux-armv8.3-*": "linux-aarch64",
+            "Linux-ppc64le-*": "linux-ppc64le",
+            "Linux-s390x-*": "linux64-s390x",
+            "Linux-*-*": "linux-generic32",
+            "Macos-x86_64-*": "darwin64-x86_64-cc",
+            "Macos-armv8-*": "darwin64-arm64-cc",
+            "Macos-*-*": "darwin-common",
+            "Windows-x86-gcc": "mingw",
+            "Windows-x86_64-gcc": "mingw64",
+            "Windows-x86-*": "VC-WIN32",
+            "Windows-x86_64-*": "VC-WIN64A",
+            "Windows-armv8-*": "VC-WIN64-ARM",
+            "Windows-*-*": "VC-noCE-common",
+            "FreeBSD-x86-*": "BSD-x86",
+            "FreeBSD-x86_64-*": "BSD-x86_64",
+            "FreeBSD-*-*": "BSD-generic64",
+        }
+
+    @property
+    def _ancestor_target(self):
+        query = f"{self.settings.os}-{self.settings.arch}-{self.settings.compiler}"
+        ancestor = next((self._targets[i] for i in self._targets if fnmatch.fnmatch(query, i)), None)
+        if not ancestor:
+            raise ConanInvalidConfiguration(
+                f"quictls doesn't support {self.settings.os}/{self.settings.arch}/{self.settings.compiler}"
+            )
+        return ancestor
+
+    def _tool(self, env_name, apple_name):
+        if env_name in os.environ:
+            return os.environ[env_name]
+        if self.settings.compiler == "apple-clang":
+            return getattr(tools.XCRun(self.settings), apple_name)
+        return None
+
+    @functools.lru_cache(1)
+    def _get_env_build(self):
+        return AutoToolsBuildEnvironment(self)
+
+    def _get_default_openssl_dir(self):
+        if self.settings.os == "Linux":
+            return "/etc/ssl"
+        return os.path.join(self.package_folder, "res")
+
+    @property
+    def _configure_args(self):
+        openssldir = self.options.openssldir or self._get_default_openssl_dir()
+        prefix = tools.unix_path(self.package_folder) if self._win_bash else self.package_folder
+        openssldir = tools.unix_path(openssldir) if self._win_bash else openssldir
+        args = [
+            f'"{self._target}"',
+            "shared" if self.options.shared else "no-shared",
+            f'--prefix="{prefix}"',
+            "--libdir=lib",
+            f'--openssldir="{openssldir}"',
+            "no-unit-test",
+            "no-tests",
+            "no-fips",
+            "no-zlib",
+            "no-threads" if self.options.no_threads else "threads",
+            f"PERL={self._perl}",
+            "--debug" if self.settings.build_type == "Debug" else "--release",
+        ]
+        if self.options.no_asm:
+            args.append("no-asm")
+        if self.settings.os != "Windows":
+            args.append("-fPIC" if self.options.get_safe("fPIC", True) else "no-pic")
+        return args
+
+    def _create_targets(self):
+        config_template = textwrap.dedent("""\
+            my %targets = (
+                "{target}" => {{
+                    inherit_from => [ "{ancestor}" ],
+                    cflags => add("{cflags}"),
+                    {defines}
+                    includes => add({includes}),
+                    lflags => add("{lflags}"),
+                    {cc}
+                    {ar}
+                    {ranlib}
+                }},
+            );
+        """)
+        env_build = self._get_env_build()
+        cc = self._tool("CC", "cc")
+        ar = self._tool("AR", "ar")
+        ranlib = self._tool("RANLIB", "ranlib")
+        defines = " ".join(env_build.defines)
+        includes = ", ".join(f'"{include}"' for include in env_build.include_paths)
+        if self.settings.os == "Windows":
+            includes = includes.replace("\\", "/")  # OpenSSL doesn't like backslashes
+
+        config = config_template.format(
+            target=self._target,
+            ancestor=self._ancestor_target,
+            cflags=" ".join(env_build.vars_dict["CFLAGS"]),
+            defines=f'defines => add("{defines}"),' if defines else "",
+            includes=includes,
+            lflags=" ".join(env_build.link_flags),
+            cc=f'cc => "{cc}",' if cc else "",
+            ar=f'ar => "{ar}",' if ar else "",
+            ranlib=f'ranlib => "{ranlib}",' if ranlib else "",
+        )
+        self.output.info(f"using target: {self._target} -> {self._ancestor_target}")
+        self.output.info(config)
+        tools.save(os.path.join(self._source_subfolder, "Configurations", "20-conan.conf"), config)
+
+    def _run_make(self, targets=None, parallel=True):
+        command = [self._make_program]
+        if targets:
+            command.extend(targets)
+        if not self._use_nmake:
+            command.append(f"-j{tools.cpu_count()}" if parallel else "-j1")
+        self.run(" ".join(command), win_bash=self._win_bash)
+
+    @property
+    def _perl(self):
+        if tools.os_info.is_windows and not self._win_bash:
+            # enforce strawberry perl, otherwise wrong perl could be used (from Git bash, MSYS, etc.)
+            if "strawberryperl" in self.deps_cpp_info.deps:
+                return os.path.join(self.deps_cpp_info["strawberryperl"].rootpath, "bin", "perl.exe")
+            elif hasattr(self, "user_info_build") and "strawberryperl" in self.user_info_build:
+                return self.user_info_build["strawberryperl"].perl
+        return "perl"
+
+    @property
+    def _win_bash(self):
+        return self._settings_build.os == "Windows" and \
+               not self._use_nmake and \
+            (self._is_mingw or cross_building(self, skip_x64_x86=True))
+
+    @property
+    def _make_program(self):
+        if self._use_nmake:
+            return "nmake"
+        make_program = tools.get_env("CONAN_MAKE_PROGRAM", tools.which("make") or tools.which("mingw32-make"))
+        if not make_program:
+            raise Exception('could not find "make" executable. please set "CONAN_MAKE_PROGRAM" environment variable')
+        return tools.unix_path(make_program)
+
+    def _replace_runtime_in_file(self, filename):
+        runtime = msvc_runtime_flag(self)
+        for e in ["MDd", "MTd", "MD", "MT"]:
+            tools.replace_in_file(filename, f"/{e} ", f"/{runtime} ", strict=False)
+            tools.replace_in_file(filename, f"/{e}\"", f"/{runtime}\"", strict=False)
+
+    def build(self):
+        with tools.vcvars(self) if self._use_nmake else tools.no_op():
+            env_vars = {"PERL": self._perl}
+            if self.settings.compiler == "apple-clang":
+                xcrun = tools.XCRun(self.settings)
+                env_vars["CROSS_SDK"] = os.path.basename(xcrun.sdk_path)
+                env_vars["CROSS_TOP"] = os.path.dirname(os.path.dirname(xcrun.sdk_path))
+            with tools.environment_append(env_vars):
+                self._create_targets()
+                with tools.chdir(self._source_subfolder):
+                    if self._is_clangcl:
+                        # workaround for clang-cl not producing .pdb files
+                        tools.save("ossl_static.pdb", "")
+                    if self._use_nmake:
+                        self._replace_runtime_in_file(os.path.join("Configurations", "10-main.conf"))
+                    args = " ".join(self._configure_args)
+                    self.run(f"{self._perl} ./Configure {args}", win_bash=self._win_bash)
+                    self._run_make()
+
+    def package(self):
+        self.copy("*LICENSE*", src=self._source_subfolder, dst="licenses")
+        with tools.vcvars(self) if self._use_nmake else tools.no_op():
+            with tools.chdir(self._source_subfolder):
+                self._run_make(targets=["install_sw"], parallel=False)
+        for root, _, files in os.walk(self.package_folder):
+            for filename in files:
+                if fnmatch.fnmatch(filename, "*.pdb"):
+                    os.unlink(os.path.join(self.package_folder, root, filename))
+        if self._use_nmake and self.settings.build_type == "Debug":
+            with tools.chdir(os.path.join(self.package_folder, "lib")):
+                rename(self, "libssl.lib", "libssld.lib")
+                rename(self, "libcrypto.lib", "libcryptod.lib")
+        if self.options.shared:
+            libdir = os.path.join(self.package_folder, "lib")
+            for file in os.listdir(libdir):
+                if self._is_mingw and file.endswith(".dll.a"):
+                    continue
+                if file.endswith(".a"):
+                    os.unlink(os.path.join(libdir, file))
+        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+
+    def package_info(self):
+        self.cpp_info.set_property("cmake_file_name", "OpenSSL")
+        self.cpp_info.set_property("cmake_find_mode", "both")
+        self.cpp_info.set_property("pkg_config_name", "openssl")
+        self.cpp_info.names["cmake_find_package"] = "OpenSSL"
+        self.cpp_info.names["cmake_find_package_multi"] = "OpenSSL"
+
+        if self._use_nmake:
+            libsuffix = "d" if self.settings.build_type == "Debug" else ""
+            self.cpp_info.components["ssl"].libs = ["libssl" + libsuffix]
+            self.cpp_info.components["crypto"].libs = ["libcrypto" + libsuffix]
+        else:
+            self.cpp_info.components["ssl"].libs = ["ssl"]
+            self.cpp_info.components["crypto"].libs = ["crypto"]
+        self.cpp_info.components["ssl"].requires = ["crypto"]
+
+        if self.settings.os == "Windows":
+            self.cpp_info.components["crypto"].system_libs.extend(["crypt32", "ws2_32", "advapi32", "user32", "bcrypt"])
+        elif self.settings.os == "Linux":
+            self.cpp_info.components["crypto"].system_libs.extend(["dl", "rt"])
+            self.cpp_info.components["ssl"].system_libs.append("dl")
+            if not self.options.no_threads:
+                self.cpp_info.components["crypto"].system_libs.append("pthread")
+                self.cpp_info.components["ssl"].system_libs.append("pthread")
+
+        self.cpp_info.components["crypto"].set_property("cmake_target_name", "OpenSSL::Crypto")
+        self.cpp_info.components["crypto"].set_property("pkg_config_name", "libcrypto")
+        self.cpp_info.components["ssl"].set_property("cmake_target_name", "OpenSSL::SSL")
+        self.cpp_info.components["ssl"].set_property("pkg_config_name", "libssl")
+        self.cpp_info.components["crypto"].names["cmake_find_package"] = "Crypto"
+        self.cpp_info.components["crypto"].names["cmake_find_package_multi"] = "Crypto"
+        self.cpp_info.components["ssl"].names["cmake_find_package"] = "SSL"
+        self.cpp_info.components["ssl"].names["cmake_find_package_multi"] = "SSL"
+
+        openssl_modules_dir = os.path.join(self.package_folder, "lib", "ossl-modules")
+        self.runenv_info.define_path("OPENSSL_MODULES", openssl_modules_dir)
+
+        # For legacy 1.x downstream consumers, remove once recipe is 2.0 only:
+        self.env_info.OPENSSL_MODULES = openssl_modules_dir
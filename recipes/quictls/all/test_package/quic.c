@@ -0,0 +1,28 @@
+#include <openssl/ssl.h>
+
+#include <stdio.h>
+#include <stdlib.h>
+
+/* The QUIC API is what quictls adds on top of OpenSSL */
+static int set_read_secret(SSL *ssl, OSSL_ENCRYPTION_LEVEL level, const SSL_CIPHER *cipher,
+                           const uint8_t *secret, size_t secret_len) { return 1; }
+static int set_write_secret(SSL *ssl, OSSL_ENCRYPTION_LEVEL level, const SSL_CIPHER *cipher,
+                            const uint8_t *secret, size_t secret_len) { return 1; }
+static int add_handshake_data(SSL *ssl, OSSL_ENCRYPTION_LEVEL level, const uint8_t *data, size_t len) { return 1; }
+static int flush_flight(SSL *ssl) { return 1; }
+static int send_alert(SSL *ssl, OSSL_ENCRYPTION_LEVEL level, uint8_t alert) { return 1; }
+
+int main()
+{
+    static const SSL_QUIC_METHOD quic_method = {
+        set_read_secret, set_write_secret, add_handshake_data, flush_flight, send_alert,
+    };
+    SSL_CTX *ctx = SSL_CTX_new(TLS_client_method());
+    SSL *ssl = ctx ? SSL_new(ctx) : NULL;
+    int ok = ssl && SSL_set_quic_method(ssl, &quic_method) == 1 && SSL_is_quic(ssl);
+
+    printf("QUIC API: %s\n", ok ? "available" : "not working");
+    SSL_free(ssl);
+    SSL_CTX_free(ctx);
+    return ok ? EXIT_SUCCESS : EXIT_FAILURE;
+}
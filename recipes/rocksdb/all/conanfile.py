@@ -28,7 +28,9 @@ class RocksDB(ConanFile):
         "with_zstd": [True, False],
         "with_tbb": [True, False],
         "with_jemalloc": [True, False],
+        "with_liburing": [True, False],
         "enable_sse": [False, "sse42", "avx2"],
+        "portable": [True, False],
         "use_rtti": [True, False],
     }
     default_options = {
@@ -42,7 +44,9 @@ class RocksDB(ConanFile):
         "with_gflags": False,
         "with_tbb": False,
         "with_jemalloc": False,
+        "with_liburing": False,
         "enable_sse": False,
+        "portable": True,
         "use_rtti": False,
     }
 
@@ -61,6 +65,14 @@ class RocksDB(ConanFile):
     def _is_msvc(self):
         return str(self.settings.compiler) in ["Visual Studio", "msvc"]
 
+    @property
+    def _supports_liburing(self):
+        return tools.Version(self.version) >= "6.10.2"
+
+    @property
+    def _supports_force_avx2(self):
+        return tools.Version(self.version) >= "6.20.3"
+
     def export_sources(self):
         self.copy("CMakeLists.txt")
         for patch in self.conan_data.get("patches", {}).get(self.version, []):
@@ -71,6 +83,8 @@ class RocksDB(ConanFile):
             del self.options.fPIC
         if self.settings.arch != "x86_64":
             del self.options.with_tbb
+        if self.settings.os != "Linux" or not self._supports_liburing:
+            del self.options.with_liburing
         if self.settings.build_type == "Debug":
             self.options.use_rtti = True  # Rtti are used in asserts for debug mode...
 
@@ -93,6 +107,8 @@ class RocksDB(ConanFile):
             self.requires("onetbb/2020.3")
         if self.options.with_jemalloc:
             self.requires("jemalloc/5.2.1")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/2.2")
 
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
@@ -100,6 +116,10 @@ class RocksDB(ConanFile):
         if self.settings.arch not in ["x86_64", "ppc64le", "ppc64", "mips64", "armv8"]:
             raise ConanInvalidConfiguration("Rocksdb requires 64 bits")
 
+        if self.options.enable_sse == "avx2" and self.options.portable and not self._supports_force_avx2:
+            raise ConanInvalidConfiguration("Rocksdb {} can't force AVX2 in a portable build, "
+                                            "set portable=False".format(self.version))
+
         if self.settings.os == "Windows" and \
            self.settings.compiler == "Visual Studio" and \
            tools.Version(self.settings.compiler.version) < "15":
@@ -152,16 +172,21 @@ class RocksDB(ConanFile):
         self._cmake.definitions["ROCKSDB_LIBRARY_EXPORTS"] = self.settings.os == "Windows" and self.options.shared
         self._cmake.definitions["ROCKSDB_DLL" ] = self.settings.os == "Windows" and self.options.shared
 
+        if self._supports_liburing:
+            # RocksDB's Finduring.cmake only looks for liburing.a otherwise
+            self._cmake.definitions["WITH_LIBURING"] = self.options.get_safe("with_liburing", False)
+            if self.options.get_safe("with_liburing"):
+                liburing = self.deps_cpp_info["liburing"]
+                lib_name = "liburing.so" if self.options["liburing"].shared else "liburing.a"
+                self._cmake.definitions["uring_INCLUDE_DIR"] = liburing.include_paths[0]
+                self._cmake.definitions["uring_LIBRARIES"] = os.path.join(liburing.lib_paths[0], lib_name)
+
         self._cmake.definitions["USE_RTTI"] = self.options.use_rtti
-        if self.options.enable_sse == "False":
-          self._cmake.definitions["PORTABLE"] = True
-          self._cmake.definitions["FORCE_SSE42"] = False
-        elif self.options.enable_sse == "sse42":
-          self._cmake.definitions["PORTABLE"] = True
-          self._cmake.definitions["FORCE_SSE42"] = True
-        elif self.options.enable_sse == "avx2":
-          self._cmake.definitions["PORTABLE"] = False
-          self._cmake.definitions["FORCE_SSE42"] = False
+        # PORTABLE=OFF builds with -march=native, FORCE_* enable extensions on top of a portable build
+        self._cmake.definitions["PORTABLE"] = self.options.portable
+        self._cmake.definitions["FORCE_SSE42"] = self.options.enable_sse == "sse42"
+        if self._supports_force_avx2:
+            self._cmake.definitions["FORCE_AVX2"] = self.options.enable_sse == "avx2"
 
         # not available yet in CCI
 
@@ -239,3 +264,5 @@ class RocksDB(ConanFile):
             self.cpp_info.components["librocksdb"].requires.append("onetbb::onetbb")
         if self.options.with_jemalloc:
             self.cpp_info.components["librocksdb"].requires.append("jemalloc::jemalloc")
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["librocksdb"].requires.append("liburing::liburing")
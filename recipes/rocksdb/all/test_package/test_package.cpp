@@ -1,16 +1,64 @@
 #include <cstdlib>
 #include <iostream>
+#include <string>
+#include <vector>
 #include "rocksdb/db.h"
+#include "rocksdb/version.h"
+
+#define ROCKSDB_VERSION_AT_LEAST(major, minor) \
+  (ROCKSDB_MAJOR > (major) || (ROCKSDB_MAJOR == (major) && ROCKSDB_MINOR >= (minor)))
+
+static const int num_keys = 64;
+
+static std::string key(int i) {
+  return "key" + std::to_string(i);
+}
 
 int main() {
   rocksdb::DB* db;
   rocksdb::Options options;
   options.create_if_missing = true;
-  rocksdb::Status status = rocksdb::DB::Open(options, "testdb", &db);
-  
+  const std::string path = "testdb";
+  rocksdb::Status status = rocksdb::DB::Open(options, path, &db);
+
   if (!status.ok()) {
     std::cerr << "DB error: " << status.ToString() << std::endl;
+    return EXIT_SUCCESS;
+  }
+
+  for (int i = 0; i < num_keys; ++i) {
+    db->Put(rocksdb::WriteOptions(), key(i), "value" + std::to_string(i));
   }
+  // Serve the reads from a SST file, that's where MultiGet batches its I/O (io_uring with liburing)
+  db->Flush(rocksdb::FlushOptions());
+
+  std::vector<std::string> key_strings;
+  std::vector<rocksdb::Slice> keys;
+  for (int i = 0; i < num_keys; ++i) {
+    key_strings.push_back(key(i));
+  }
+  for (const std::string& k : key_strings) {
+    keys.emplace_back(k);
+  }
+
+  int found = 0;
+#if ROCKSDB_VERSION_AT_LEAST(6, 2)
+  std::vector<rocksdb::PinnableSlice> values(num_keys);
+  std::vector<rocksdb::Status> statuses(num_keys);
+  db->MultiGet(rocksdb::ReadOptions(), db->DefaultColumnFamily(), num_keys, keys.data(), values.data(),
+               statuses.data());
+#else
+  std::vector<std::string> values;
+  std::vector<rocksdb::Status> statuses = db->MultiGet(rocksdb::ReadOptions(), keys, &values);
+#endif
+  for (int i = 0; i < num_keys; ++i) {
+    if (statuses[i].ok() && rocksdb::Slice(values[i]).ToString() == "value" + std::to_string(i)) {
+      ++found;
+    }
+  }
+  std::cout << "MultiGet found " << found << "/" << num_keys << " keys" << std::endl;
+
   delete db;
-  return EXIT_SUCCESS;
+  rocksdb::DestroyDB(path, options);
+  return found == num_keys ? EXIT_SUCCESS : EXIT_FAILURE;
 }
@@ -6,6 +6,7 @@ from conan.tools.files import copy, get, replace_in_file, rmdir
 from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 import os
+import re
 
 required_conan_version = ">=1.53.0"
 
@@ -24,11 +25,15 @@ class SimdjsonConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "threads": [True, False],
+        "implementations": [None, "ANY"],
+        "builtin_implementation": [None, "fallback", "westmere", "haswell", "icelake", "arm64"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "threads": True,
+        "implementations": None,
+        "builtin_implementation": None,
     }
 
     @property
@@ -45,6 +50,37 @@ class SimdjsonConan(ConanFile):
             "apple-clang": "9.4",
         }
 
+    @property
+    def _supported_implementations(self):
+        if self.settings.arch == "x86_64":
+            implementations = ["westmere", "haswell"]
+            if Version(self.version) >= "2.0.0":
+                implementations.append("icelake")
+        elif self.settings.arch == "armv8":
+            implementations = ["arm64"]
+        else:
+            implementations = []
+        return implementations + ["fallback"]
+
+    @property
+    def _implementations(self):
+        """ Kernels compiled in, all the supported ones by default """
+        implementations = str(self.options.implementations)
+        if implementations == "None":
+            return self._supported_implementations
+        return [it for it in re.split(r"[\s,;]+", implementations) if it]
+
+    @property
+    def _implementation_defines(self):
+        # Needed by the library and by the consumers, the on demand API is compiled in their translation units
+        defines = []
+        if str(self.options.implementations) != "None":
+            defines.extend(f"SIMDJSON_IMPLEMENTATION_{it.upper()}={int(it in self._implementations)}"
+                           for it in self._supported_implementations)
+        if self.options.builtin_implementation:
+            defines.append(f"SIMDJSON_BUILTIN_IMPLEMENTATION={self.options.builtin_implementation}")
+        return defines
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
@@ -80,6 +116,19 @@ class SimdjsonConan(ConanFile):
             if self.settings.build_type == "Debug":
                 raise ConanInvalidConfiguration(f"{self.ref} doesn't support GCC 9 with Debug build type.")
 
+        unknown = [it for it in self._implementations if it not in self._supported_implementations]
+        if unknown or not self._implementations:
+            raise ConanInvalidConfiguration(
+                f"implementations must be a list of {', '.join(self._supported_implementations)} "
+                f"for {self.ref} on {self.settings.arch}"
+            )
+        builtin = self.options.builtin_implementation
+        if builtin and str(builtin) not in self._implementations:
+            raise ConanInvalidConfiguration(
+                f"builtin_implementation={builtin} must be one of the implementations compiled in: "
+                f"{', '.join(self._implementations)}"
+            )
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
@@ -92,6 +141,9 @@ class SimdjsonConan(ConanFile):
             tc.variables["SIMDJSON_JUST_LIBRARY"] = True
         else:
             tc.variables["SIMDJSON_DEVELOPER_MODE"] = False
+        for define in self._implementation_defines:
+            name, value = define.split("=")
+            tc.preprocessor_definitions[name] = value
         tc.generate()
 
     def _patch_sources(self):
@@ -129,8 +181,9 @@ class SimdjsonConan(ConanFile):
         self.cpp_info.libs = ["simdjson"]
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs = ["m"]
+        self.cpp_info.defines = self._implementation_defines
         if self.options.threads:
-            self.cpp_info.defines = ["SIMDJSON_THREADS_ENABLED=1"]
+            self.cpp_info.defines.append("SIMDJSON_THREADS_ENABLED=1")
             if self.settings.os in ["Linux", "FreeBSD"]:
                 self.cpp_info.system_libs.append("pthread")
         if self.options.shared:
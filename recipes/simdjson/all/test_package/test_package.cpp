@@ -2,7 +2,26 @@
 #include <iostream>
 #include <string>
 
+#define STRINGIFY_IMPL(x) #x
+#define STRINGIFY(x) STRINGIFY_IMPL(x)
+
+#ifdef SIMDJSON_IMPLEMENTATIONS_AS_GLOBALS
+// simdjson < 1.0 exposes the implementations as global variables
+#define AVAILABLE_IMPLEMENTATIONS() simdjson::available_implementations
+#define ACTIVE_IMPLEMENTATION() simdjson::active_implementation
+#else
+#define AVAILABLE_IMPLEMENTATIONS() simdjson::get_available_implementations()
+#define ACTIVE_IMPLEMENTATION() simdjson::get_active_implementation()
+#endif
+
 int main() {
+  std::cout << "builtin implementation: " << STRINGIFY(SIMDJSON_BUILTIN_IMPLEMENTATION) << std::endl;
+  std::cout << "compiled implementations:";
+  for (auto implementation : AVAILABLE_IMPLEMENTATIONS()) {
+    std::cout << " " << implementation->name();
+  }
+  std::cout << std::endl;
+
   std::string mystring = "{ \"hello\": \"simdjson\" }";
   simdjson::dom::parser parser;
   std::string_view string_value;
@@ -15,5 +34,8 @@ int main() {
     std::cerr << string_value << std::endl;
     return EXIT_FAILURE;
   }
+  // Selected on first use
+  const auto &active = ACTIVE_IMPLEMENTATION();
+  std::cout << "active implementation: " << active->name() << " (" << active->description() << ")" << std::endl;
   return EXIT_SUCCESS;
 }
@@ -2,6 +2,7 @@ from conan import ConanFile
 from conan.tools.build import check_min_cppstd, stdcpp_library
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir
+from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 import os
 
@@ -21,10 +22,16 @@ class SnappyConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_avx": [True, False],
+        "with_avx2": [True, False],
+        "with_bmi2": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_avx": False,
+        "with_avx2": False,
+        "with_bmi2": False,
     }
 
     def export_sources(self):
@@ -33,10 +40,20 @@ class SnappyConan(ConanFile):
     def config_options(self):
         if self.settings.os == 'Windows':
             del self.options.fPIC
+        if Version(self.version) < "1.1.8" or self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.with_avx
+            del self.options.with_avx2
+            del self.options.with_bmi2
+        elif is_msvc(self):
+            # /arch:AVX2 already enables BMI2 intrinsics, there is no dedicated flag
+            del self.options.with_bmi2
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if self.options.get_safe("with_avx2"):
+            # AVX2 processors support AVX, keep a single package id for both spellings
+            self.options.with_avx = True
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -50,11 +67,20 @@ class SnappyConan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
+        if self.options.get_safe("with_bmi2"):
+            # Upstream only enables the BMI2 decompression path if _bzhi_u32 compiles with the current flags
+            class Bmi2FlagsBlock:
+                template = 'string(APPEND CMAKE_CXX_FLAGS_INIT " -mbmi2")'
+
+                def context(self):
+                    return {}
+
+            tc.blocks["bmi2_flags"] = Bmi2FlagsBlock
         tc.variables["SNAPPY_BUILD_TESTS"] = False
         if Version(self.version) >= "1.1.8":
             tc.variables["SNAPPY_FUZZING_BUILD"] = False
-            tc.variables["SNAPPY_REQUIRE_AVX"] = False
-            tc.variables["SNAPPY_REQUIRE_AVX2"] = False
+            tc.variables["SNAPPY_REQUIRE_AVX"] = bool(self.options.get_safe("with_avx"))
+            tc.variables["SNAPPY_REQUIRE_AVX2"] = bool(self.options.get_safe("with_avx2"))
             tc.variables["SNAPPY_INSTALL"] = True
         if Version(self.version) >= "1.1.9":
             tc.variables["SNAPPY_BUILD_BENCHMARKS"] = False
@@ -1,12 +1,12 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 import os
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeToolchain", "CMakeDeps", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
     test_type = "explicit"
 
     def layout(self):
@@ -15,6 +15,14 @@ class TestPackageConan(ConanFile):
     def requirements(self):
         self.requires(self.tested_reference_str)
 
+    def generate(self):
+        options = self.dependencies["snappy"].options
+        tc = CMakeToolchain(self)
+        tc.variables["SNAPPY_WITH_AVX"] = bool(options.get_safe("with_avx"))
+        tc.variables["SNAPPY_WITH_AVX2"] = bool(options.get_safe("with_avx2"))
+        tc.variables["SNAPPY_WITH_BMI2"] = bool(options.get_safe("with_bmi2"))
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -26,3 +34,5 @@ class TestPackageConan(ConanFile):
             self.run(bin_path, env="conanrun")
             bin_path_c = os.path.join(self.cpp.build.bindirs[0], "test_package_c")
             self.run(bin_path_c, env="conanrun")
+            bin_path_throughput = os.path.join(self.cpp.build.bindirs[0], "test_throughput")
+            self.run(bin_path_throughput, env="conanrun")
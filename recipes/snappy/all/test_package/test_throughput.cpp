@@ -0,0 +1,57 @@
+#include <snappy.h>
+
+#include <chrono>
+#include <cstdlib>
+#include <iostream>
+#include <string>
+
+// Instruction sets the package was built for, the library can't run on a processor without them
+static bool cpu_supports_expected_isa() {
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+    __builtin_cpu_init();
+    if (EXPECTED_AVX && !__builtin_cpu_supports("avx")) return false;
+    if (EXPECTED_AVX2 && !__builtin_cpu_supports("avx2")) return false;
+    if (EXPECTED_BMI2 && !__builtin_cpu_supports("bmi2")) return false;
+#endif
+    return true;
+}
+
+int main() {
+    std::cout << "snappy built with AVX=" << EXPECTED_AVX << " AVX2=" << EXPECTED_AVX2 << " BMI2=" << EXPECTED_BMI2
+              << std::endl;
+    if (!cpu_supports_expected_isa()) {
+        std::cout << "The processor does not support these instruction sets, skipping the benchmark" << std::endl;
+        return EXIT_SUCCESS;
+    }
+
+    // Text-like data: a mix of literals and back references, the paths where the instruction sets matter
+    std::string input;
+    std::srand(42);
+    while (input.size() < 16 * 1024 * 1024) {
+        input += "conan-center-index snappy throughput ";
+        input += std::to_string(std::rand() % 100000);
+        input += static_cast<char>('a' + std::rand() % 26);
+    }
+
+    std::string compressed;
+    snappy::Compress(input.data(), input.size(), &compressed);
+
+    const int repetitions = 10;
+    std::string output;
+    const auto start = std::chrono::steady_clock::now();
+    for (int i = 0; i < repetitions; ++i) {
+        if (!snappy::Uncompress(compressed.data(), compressed.size(), &output)) {
+            std::cerr << "Uncompress failed" << std::endl;
+            return EXIT_FAILURE;
+        }
+    }
+    const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+    if (output != input) {
+        std::cerr << "Round trip mismatch" << std::endl;
+        return EXIT_FAILURE;
+    }
+
+    std::cout << "ratio " << static_cast<double>(compressed.size()) / input.size() << ", decompression "
+              << input.size() * repetitions / elapsed.count() / (1024 * 1024) << " MiB/s" << std::endl;
+    return EXIT_SUCCESS;
+}
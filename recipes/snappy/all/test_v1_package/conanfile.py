@@ -8,6 +8,8 @@ class TestPackageConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
+        for option in ["with_avx", "with_avx2", "with_bmi2"]:
+            cmake.definitions[f"SNAPPY_{option.upper()}"] = bool(self.options["snappy"].get_safe(option))
         cmake.configure()
         cmake.build()
 
@@ -17,3 +19,5 @@ class TestPackageConan(ConanFile):
             self.run(bin_path, run_environment=True)
             bin_path_c = os.path.join("bin", "test_package_c")
             self.run(bin_path_c, run_environment=True)
+            bin_path_throughput = os.path.join("bin", "test_throughput")
+            self.run(bin_path_throughput, run_environment=True)
@@ -26,6 +26,12 @@ class SpdlogConan(ConanFile):
         "wchar_support": [True, False],
         "wchar_filenames": [True, False],
         "no_exceptions": [True, False],
+        "active_level": [None, "trace", "debug", "info", "warn", "error", "critical", "off"],
+        "no_thread_id": [True, False],
+        "no_atomic_levels": [True, False],
+        "no_tls": [True, False],
+        "disable_default_logger": [True, False],
+        "use_std_format": [True, False],
     }
     default_options = {
         "shared": False,
@@ -34,22 +40,45 @@ class SpdlogConan(ConanFile):
         "wchar_support": False,
         "wchar_filenames": False,
         "no_exceptions": False,
+        "active_level": None,
+        "no_thread_id": False,
+        "no_atomic_levels": False,
+        "no_tls": False,
+        "disable_default_logger": False,
+        "use_std_format": False,
     }
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if Version(self.version) < "1.10.0":
+            del self.options.use_std_format
 
     def configure(self):
         if self.options.shared or self.options.header_only:
             self.options.rm_safe("fPIC")
         if self.options.header_only:
             del self.options.shared
+        if self.settings.os in ("iOS", "tvOS", "watchOS"):
+            self.options.no_tls = True
 
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    @property
+    def _public_defines(self):
+        """ Defines changing the ABI or the work done by each log call, the library and its consumers must agree """
+        defines = []
+        if self.options.active_level:
+            defines.append(f"SPDLOG_ACTIVE_LEVEL=SPDLOG_LEVEL_{str(self.options.active_level).upper()}")
+        for option in ["no_thread_id", "no_atomic_levels", "no_tls", "disable_default_logger", "use_std_format"]:
+            if self.options.get_safe(option):
+                defines.append(f"SPDLOG_{option.upper()}")
+        return defines
+
     def requirements(self):
+        if self.options.get_safe("use_std_format"):
+            return
         self_version = Version(self.version)
         fmt_version = "7.1.3"
 
@@ -73,6 +102,11 @@ class SpdlogConan(ConanFile):
             check_min_cppstd(self, 11)
         if self.settings.os != "Windows" and (self.options.wchar_support or self.options.wchar_filenames):
             raise ConanInvalidConfiguration("wchar is only supported under windows")
+        if self.options.get_safe("use_std_format"):
+            # The default standard of the compilers is older than C++20, it has to be set explicitly
+            if not self.settings.get_safe("compiler.cppstd"):
+                raise ConanInvalidConfiguration(f"{self.ref}:use_std_format=True requires compiler.cppstd=20 or later")
+            check_min_cppstd(self, 20)
         if self.options.get_safe("shared") and is_msvc_static_runtime(self):
             raise ConanInvalidConfiguration("Visual Studio build for shared library with MT runtime is not supported")
 
@@ -81,22 +115,26 @@ class SpdlogConan(ConanFile):
 
     def generate(self):
         if not self.options.header_only:
-            fmt = self.dependencies["fmt"]
             tc = CMakeToolchain(self)
             tc.variables["SPDLOG_BUILD_EXAMPLE"] = False
             tc.variables["SPDLOG_BUILD_EXAMPLE_HO"] = False
             tc.variables["SPDLOG_BUILD_TESTS"] = False
             tc.variables["SPDLOG_BUILD_TESTS_HO"] = False
             tc.variables["SPDLOG_BUILD_BENCH"] = False
-            tc.variables["SPDLOG_FMT_EXTERNAL"] = not fmt.options.header_only
-            tc.variables["SPDLOG_FMT_EXTERNAL_HO"] = fmt.options.header_only
+            if self.options.get_safe("use_std_format"):
+                tc.variables["SPDLOG_USE_STD_FORMAT"] = True
+            else:
+                fmt = self.dependencies["fmt"]
+                tc.variables["SPDLOG_FMT_EXTERNAL"] = not fmt.options.header_only
+                tc.variables["SPDLOG_FMT_EXTERNAL_HO"] = fmt.options.header_only
             tc.variables["SPDLOG_BUILD_SHARED"] = not self.options.header_only and self.options.shared
             tc.variables["SPDLOG_WCHAR_SUPPORT"] = self.options.wchar_support
             tc.variables["SPDLOG_WCHAR_FILENAMES"] = self.options.wchar_filenames
             tc.variables["SPDLOG_INSTALL"] = True
             tc.variables["SPDLOG_NO_EXCEPTIONS"] = self.options.no_exceptions
-            if self.settings.os in ("iOS", "tvOS", "watchOS"):
-                tc.variables["SPDLOG_NO_TLS"] = True
+            for define in self._public_defines:
+                name, _, value = define.partition("=")
+                tc.preprocessor_definitions[name] = value or "1"
             tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0091"] = "NEW"
             tc.generate()
         cmake_deps = CMakeDeps(self)
@@ -131,8 +169,9 @@ class SpdlogConan(ConanFile):
 
         # TODO: back to global scope in conan v2 once legacy generators removed
         self.cpp_info.components["libspdlog"].set_property("cmake_target_name", f"spdlog::{target}")
-        self.cpp_info.components["libspdlog"].defines.append("SPDLOG_FMT_EXTERNAL")
-        self.cpp_info.components["libspdlog"].requires = ["fmt::fmt"]
+        if not self.options.get_safe("use_std_format"):
+            self.cpp_info.components["libspdlog"].defines.append("SPDLOG_FMT_EXTERNAL")
+            self.cpp_info.components["libspdlog"].requires = ["fmt::fmt"]
 
         if not self.options.header_only:
             suffix = "d" if self.settings.build_type == "Debug" else ""
@@ -144,10 +183,9 @@ class SpdlogConan(ConanFile):
             self.cpp_info.components["libspdlog"].defines.append("SPDLOG_WCHAR_FILENAMES")
         if self.options.no_exceptions:
             self.cpp_info.components["libspdlog"].defines.append("SPDLOG_NO_EXCEPTIONS")
+        self.cpp_info.components["libspdlog"].defines.extend(self._public_defines)
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["libspdlog"].system_libs = ["pthread"]
-        if self.options.header_only and self.settings.os in ("iOS", "tvOS", "watchOS"):
-            self.cpp_info.components["libspdlog"].defines.append("SPDLOG_NO_TLS")
 
         self.cpp_info.names["cmake_find_package"] = "spdlog"
         self.cpp_info.names["cmake_find_package_multi"] = "spdlog"
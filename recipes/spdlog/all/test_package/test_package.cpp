@@ -1,7 +1,30 @@
+#include <chrono>
 #include <cstdlib>
+#include <memory>
 #include "spdlog/spdlog.h"
+#include "spdlog/sinks/stdout_sinks.h"
 
 int main(void) {
-    spdlog::info("Welcome to spdlog version {}.{}.{}  !", SPDLOG_VER_MAJOR, SPDLOG_VER_MINOR, SPDLOG_VER_PATCH);
+    // Not the default logger, it may be disabled with SPDLOG_DISABLE_DEFAULT_LOGGER
+    spdlog::logger logger("test_package", std::make_shared<spdlog::sinks::stdout_sink_st>());
+    logger.info("Welcome to spdlog version {}.{}.{}  !", SPDLOG_VER_MAJOR, SPDLOG_VER_MINOR, SPDLOG_VER_PATCH);
+
+    // Cost of a call below the runtime level, and of a macro below SPDLOG_ACTIVE_LEVEL
+    logger.set_level(spdlog::level::warn);
+    const int calls = 1000000;
+    auto start = std::chrono::steady_clock::now();
+    for (int i = 0; i < calls; ++i) {
+        logger.debug("disabled {}", i);
+    }
+    const std::chrono::duration<double, std::nano> runtime_elapsed = std::chrono::steady_clock::now() - start;
+    start = std::chrono::steady_clock::now();
+    for (int i = 0; i < calls; ++i) {
+        SPDLOG_LOGGER_TRACE(&logger, "disabled {}", i);
+    }
+    const std::chrono::duration<double, std::nano> macro_elapsed = std::chrono::steady_clock::now() - start;
+
+    logger.set_level(spdlog::level::info);
+    logger.info("disabled log call: {:.2f} ns, disabled SPDLOG_LOGGER_TRACE: {:.2f} ns (SPDLOG_ACTIVE_LEVEL={})",
+                runtime_elapsed.count() / calls, macro_elapsed.count() / calls, SPDLOG_ACTIVE_LEVEL);
     return EXIT_SUCCESS;
 }
@@ -8,6 +8,8 @@ class TestPackageConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
+        spdlog_options = self.options["spdlog"]
+        cmake.definitions["SPDLOG_USE_STD_FORMAT"] = "use_std_format" in spdlog_options and spdlog_options.use_std_format
         cmake.configure()
         cmake.build()
 
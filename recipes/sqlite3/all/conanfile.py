@@ -34,11 +34,11 @@ class Sqlite3Conan(ConanFile):
         "enable_soundex": [True, False],
         "enable_preupdate_hook": [True, False],
         "enable_rtree": [True, False],
-        "use_alloca": [True, False],
+        "use_alloca": [None, True, False],
         "omit_load_extension": [True, False],
         "omit_deprecated": [True, False],
         "enable_math_functions": [True, False],
-        "enable_unlock_notify": [True, False],
+        "enable_unlock_notify": [None, True, False],
         "enable_default_secure_delete": [True, False],
         "disable_gethostuuid": [True, False],
         "max_column": [None, "ANY"],
@@ -47,6 +47,15 @@ class Sqlite3Conan(ConanFile):
         "build_executable": [True, False],
         "enable_default_vfs": [True, False],
         "enable_dbpage_vtab": [True, False],
+        "performance_profile": [True, False],
+        "default_memstatus": [None, True, False],
+        "default_wal_synchronous": [None, "off", "normal", "full", "extra"],
+        "default_cache_size": [None, "ANY"],
+        "default_page_size": [None, 512, 1024, 2048, 4096, 8192, 16384, 32768, 65536],
+        "default_mmap_size": [None, "ANY"],
+        "max_mmap_size": [None, "ANY"],
+        "omit_shared_cache": [None, True, False],
+        "like_doesnt_match_blobs": [True, False],
     }
     default_options = {
         "shared": False,
@@ -63,11 +72,11 @@ class Sqlite3Conan(ConanFile):
         "enable_soundex": False,
         "enable_preupdate_hook": False,
         "enable_rtree": True,
-        "use_alloca": False,
+        "use_alloca": None,             # False, unless performance_profile=True
         "omit_load_extension": False,
         "omit_deprecated": False,
         "enable_math_functions": True,
-        "enable_unlock_notify": True,
+        "enable_unlock_notify": None,   # True, unless performance_profile=True or omit_shared_cache=True
         "enable_default_secure_delete": False,
         "disable_gethostuuid": False,
         "max_column": None,             # Uses default value from source
@@ -76,6 +85,15 @@ class Sqlite3Conan(ConanFile):
         "build_executable": True,
         "enable_default_vfs": True,
         "enable_dbpage_vtab": False,
+        "performance_profile": False,
+        "default_memstatus": None,          # True, unless performance_profile=True
+        "default_wal_synchronous": None,    # Uses default value from source
+        "default_cache_size": None,         # Uses default value from source
+        "default_page_size": None,          # Uses default value from source
+        "default_mmap_size": None,          # Uses default value from source
+        "max_mmap_size": None,              # Uses default value from source
+        "omit_shared_cache": None,          # False, unless performance_profile=True without enable_unlock_notify=True
+        "like_doesnt_match_blobs": False,
     }
 
     exports_sources = "CMakeLists.txt"
@@ -84,6 +102,18 @@ class Sqlite3Conan(ConanFile):
     def _has_enable_math_function_option(self):
         return Version(self.version) >= "3.35.0"
 
+    @property
+    def _performance_profile(self):
+        # Recommended compile-time options of https://www.sqlite.org/compile.html#rcmd, except
+        # LIKE_DOESNT_MATCH_BLOBS which changes the result of LIKE and GLOB on BLOBs.
+        return {
+            "default_memstatus": False,
+            "default_wal_synchronous": "normal",
+            "omit_shared_cache": True,
+            "enable_unlock_notify": False,
+            "use_alloca": True,
+        }
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
@@ -95,6 +125,27 @@ class Sqlite3Conan(ConanFile):
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
+        # Options left to None by the user get their value from the preset, or the upstream default
+        unset_values = {
+            "default_memstatus": True,
+            "omit_shared_cache": False,
+            "enable_unlock_notify": True,
+            "use_alloca": False,
+        }
+        if self.options.performance_profile:
+            unset_values.update(self._performance_profile)
+        # The unlock notify API relies on the shared cache, the one set by the user decides for the other
+        if str(self.options.enable_unlock_notify) == "True":
+            unset_values["omit_shared_cache"] = False
+        if str(self.options.omit_shared_cache) == "True":
+            unset_values["enable_unlock_notify"] = False
+        for option, value in unset_values.items():
+            if str(self.options.get_safe(option)) == "None":
+                setattr(self.options, option, value)
+
+    def package_id(self):
+        # Its effect is already in the values of the other options
+        del self.info.options.performance_profile
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -106,6 +157,17 @@ class Sqlite3Conan(ConanFile):
                 raise ConanInvalidConfiguration("build_executable=True cannot be combined with enable_default_vfs=False")
             if self.options.omit_load_extension:
                 raise ConanInvalidConfiguration("build_executable=True requires omit_load_extension=True")
+        if self.options.omit_shared_cache and self.options.enable_unlock_notify:
+            raise ConanInvalidConfiguration("omit_shared_cache=True cannot be combined with enable_unlock_notify=True")
+        for option, minimum in [("default_cache_size", None), ("default_mmap_size", 0), ("max_mmap_size", 0)]:
+            value = str(self.options.get_safe(option))
+            if value != "None" and (not value.lstrip("-").isdigit() or (minimum is not None and int(value) < minimum)):
+                raise ConanInvalidConfiguration(
+                    f"{option} must be an integer" + (f" greater or equal to {minimum}" if minimum is not None else "")
+                )
+        if str(self.options.default_mmap_size) != "None" and str(self.options.max_mmap_size) != "None" and \
+           int(str(self.options.default_mmap_size)) > int(str(self.options.max_mmap_size)):
+            raise ConanInvalidConfiguration("default_mmap_size cannot be greater than max_mmap_size")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -149,6 +211,15 @@ class Sqlite3Conan(ConanFile):
             tc.variables["MAX_BLOB_SIZE"] = self.options.max_blob_size
         tc.variables["DISABLE_DEFAULT_VFS"] = not self.options.enable_default_vfs
         tc.variables["ENABLE_DBPAGE_VTAB"] = self.options.enable_dbpage_vtab
+        tc.variables["DEFAULT_MEMSTATUS"] = self.options.default_memstatus
+        if self.options.default_wal_synchronous:
+            tc.variables["DEFAULT_WAL_SYNCHRONOUS"] = ["off", "normal", "full", "extra"].index(
+                str(self.options.default_wal_synchronous))
+        for option in ["default_cache_size", "default_page_size", "default_mmap_size", "max_mmap_size"]:
+            if str(self.options.get_safe(option)) != "None":
+                tc.variables[option.upper()] = str(self.options.get_safe(option))
+        tc.variables["OMIT_SHARED_CACHE"] = self.options.omit_shared_cache
+        tc.variables["LIKE_DOESNT_MATCH_BLOBS"] = self.options.like_doesnt_match_blobs
         tc.generate()
 
     def build(self):
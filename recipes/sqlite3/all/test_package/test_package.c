@@ -15,6 +15,11 @@ int main() {
 
     printf("SQLite Version: %s\n", sqlite3_libversion());
 
+    printf("Compile options:\n");
+    for (int i = 0; sqlite3_compileoption_get(i) != NULL; ++i) {
+        printf("  SQLITE_%s\n", sqlite3_compileoption_get(i));
+    }
+
     printf("Creating new data base ...\n");
     result = sqlite3_open(DB_NAME, &db_instance);
     if (result != SQLITE_OK) {
@@ -1,6 +1,6 @@
 from conan import ConanFile
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir, save
 import os
 
 required_conan_version = ">=1.53.0"
@@ -19,11 +19,13 @@ class XxHashConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "utility": [True, False],
+        "dispatch": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "utility": True,
+        "dispatch": False,
     }
 
     def export_sources(self):
@@ -32,6 +34,8 @@ class XxHashConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.dispatch
 
     def configure(self):
         if self.options.shared:
@@ -56,8 +60,15 @@ class XxHashConan(ConanFile):
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0042"] = "NEW"
         tc.generate()
 
-    def build(self):
+    def _patch_sources(self):
         apply_conandata_patches(self)
+        if self.options.get_safe("dispatch"):
+            # Runtime selection of the SSE2/AVX2/AVX512 XXH3 kernels, exported as XXH3_*_dispatch()
+            save(self, os.path.join(self.source_folder, "cmake_unofficial", "CMakeLists.txt"),
+                 '\ntarget_sources(xxhash PRIVATE "${XXHASH_DIR}/xxh_x86dispatch.c")\n', append=True)
+
+    def build(self):
+        self._patch_sources()
         cmake = CMake(self)
         cmake.configure(build_script_folder=os.path.join(self.source_folder, "cmake_unofficial"))
         cmake.build()
@@ -66,6 +77,8 @@ class XxHashConan(ConanFile):
         copy(self, "LICENSE", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
         cmake = CMake(self)
         cmake.install()
+        if self.options.get_safe("dispatch"):
+            copy(self, "xxh_x86dispatch.h", src=self.source_folder, dst=os.path.join(self.package_folder, "include"))
         rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
         rmdir(self, os.path.join(self.package_folder, "share"))
@@ -0,0 +1,25 @@
+#include "xxhash.h"
+#include "xxh_x86dispatch.h"
+
+#include <stdio.h>
+#include <stdlib.h>
+
+/* Defined in test_dispatch_reference.c, without the dispatching header */
+XXH64_hash_t reference_hash(const void* input, size_t length);
+
+
+int main()
+{
+    size_t const bufferSize = 1 << 20;
+    unsigned char* const buffer = malloc(bufferSize);
+    size_t i;
+    for (i = 0; i < bufferSize; i++)
+        buffer[i] = (unsigned char)((i * 2654435761u) >> 24);
+
+    /* Whichever SSE2/AVX2/AVX512 kernel is selected, it must agree with the default one */
+    XXH64_hash_t const dispatched = XXH3_64bits_dispatch(buffer, bufferSize);
+    XXH64_hash_t const reference = reference_hash(buffer, bufferSize);
+    printf("XXH3_64bits_dispatch: %016llx\n", (unsigned long long)dispatched);
+    free(buffer);
+    return dispatched == reference ? EXIT_SUCCESS : EXIT_FAILURE;
+}
@@ -0,0 +1,7 @@
+#include "xxhash.h"
+
+
+XXH64_hash_t reference_hash(const void* input, size_t length)
+{
+    return XXH3_64bits(input, length);
+}
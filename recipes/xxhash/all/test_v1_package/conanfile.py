@@ -8,6 +8,7 @@ class TestPackageConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
+        cmake.definitions["XXHASH_DISPATCH"] = bool(self.options["xxhash"].get_safe("dispatch"))
         cmake.configure()
         cmake.build()
 
@@ -15,3 +16,6 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if self.options["xxhash"].get_safe("dispatch"):
+                bin_path = os.path.join("bin", "test_dispatch")
+                self.run(bin_path, run_environment=True)
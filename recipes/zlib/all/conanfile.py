@@ -1,6 +1,8 @@
 from conan import ConanFile
+from conan.tools.apple import fix_apple_shared_install_name
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, export_conandata_patches, get, load, replace_in_file, save
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, replace_in_file, rmdir, save
+from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 import os
 
@@ -21,22 +23,35 @@ class ZlibConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "implementation": ["classic", "zlib-ng"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "implementation": "classic",
     }
 
     @property
     def _is_mingw(self):
         return self.settings.os == "Windows" and self.settings.compiler == "gcc"
 
+    @property
+    def _is_zlib_ng(self):
+        return self.options.get_safe("implementation") == "zlib-ng"
+
+    @property
+    def _zlib_ng_source_folder(self):
+        return os.path.join(self.build_folder, "zlib-ng")
+
     def export_sources(self):
         export_conandata_patches(self)
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # zlib-ng 2.0.x in compat mode implements the zlib 1.2.11 API (zlibVersion() is "1.2.11.zlib-ng")
+        if "zlib-ng" not in self.conan_data["sources"][self.version]:
+            del self.options.implementation
 
     def configure(self):
         if self.options.shared:
@@ -48,21 +63,32 @@ class ZlibConan(ConanFile):
         cmake_layout(self, src_folder="src")
 
     def source(self):
-        get(self, **self.conan_data["sources"][self.version],
+        get(self, **self.conan_data["sources"][self.version]["classic"],
             destination=self.source_folder, strip_root=True)
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["SKIP_INSTALL_ALL"] = False
-        tc.variables["SKIP_INSTALL_LIBRARIES"] = False
-        tc.variables["SKIP_INSTALL_HEADERS"] = False
-        tc.variables["SKIP_INSTALL_FILES"] = True
-        # Correct for misuse of "${CMAKE_INSTALL_PREFIX}/" in CMakeLists.txt
-        tc.variables["INSTALL_LIB_DIR"] = "lib"
-        tc.variables["INSTALL_INC_DIR"] = "include"
+        if self._is_zlib_ng:
+            # zlib-ng in zlib API/ABI compatible mode, with runtime dispatched SIMD kernels
+            tc.variables["ZLIB_COMPAT"] = True
+            tc.variables["ZLIB_ENABLE_TESTS"] = False
+            tc.variables["WITH_GZFILEOP"] = True
+            tc.variables["WITH_OPTIM"] = True
+            tc.variables["WITH_NEW_STRATEGIES"] = True
+            tc.variables["WITH_NATIVE_INSTRUCTIONS"] = False
+        else:
+            tc.variables["SKIP_INSTALL_ALL"] = False
+            tc.variables["SKIP_INSTALL_LIBRARIES"] = False
+            tc.variables["SKIP_INSTALL_HEADERS"] = False
+            tc.variables["SKIP_INSTALL_FILES"] = True
+            # Correct for misuse of "${CMAKE_INSTALL_PREFIX}/" in CMakeLists.txt
+            tc.variables["INSTALL_LIB_DIR"] = "lib"
+            tc.variables["INSTALL_INC_DIR"] = "include"
         tc.generate()
 
     def _patch_sources(self):
+        if self._is_zlib_ng:
+            return
         apply_conandata_patches(self)
 
         is_apple_clang12 = self.settings.compiler == "apple-clang" and Version(self.settings.compiler.version) >= "12.0"
@@ -79,9 +105,13 @@ class ZlibConan(ConanFile):
                                       '#if defined(HAVE_STDARG_H) && (1-HAVE_STDARG_H-1 != 0)')
 
     def build(self):
+        if self._is_zlib_ng:
+            # the source folder is shared by all configurations, only fetch zlib-ng when it is built
+            get(self, **self.conan_data["sources"][self.version]["zlib-ng"],
+                destination=self._zlib_ng_source_folder, strip_root=True)
         self._patch_sources()
         cmake = CMake(self)
-        cmake.configure()
+        cmake.configure(build_script_folder=self._zlib_ng_source_folder if self._is_zlib_ng else None)
         cmake.build()
 
     def _extract_license(self):
@@ -90,20 +120,35 @@ class ZlibConan(ConanFile):
         return license_contents
 
     def package(self):
-        save(self, os.path.join(self.package_folder, "licenses", "LICENSE"), self._extract_license())
+        if self._is_zlib_ng:
+            copy(self, "LICENSE.md", src=self._zlib_ng_source_folder, dst=os.path.join(self.package_folder, "licenses"))
+        else:
+            save(self, os.path.join(self.package_folder, "licenses", "LICENSE"), self._extract_license())
         cmake = CMake(self)
         cmake.install()
+        if self._is_zlib_ng:
+            rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+            # upstream CMakeLists intentionally hardcodes install_name with full install path
+            fix_apple_shared_install_name(self)
 
     def package_info(self):
         self.cpp_info.set_property("cmake_find_mode", "both")
         self.cpp_info.set_property("cmake_file_name", "ZLIB")
         self.cpp_info.set_property("cmake_target_name", "ZLIB::ZLIB")
         self.cpp_info.set_property("pkg_config_name", "zlib")
-        if self.settings.os == "Windows" and not self._is_mingw:
+        if self._is_zlib_ng and self.settings.os == "Windows":
+            # same naming as the zlib-ng recipe with zlib_compat=True
+            base = "zlib" if is_msvc(self) or self.options.shared else "z"
+            static_flag = "static" if is_msvc(self) and not self.options.shared else ""
+            build_type = "d" if self.settings.build_type == "Debug" else ""
+            libname = f"{base}{static_flag}{build_type}"
+        elif self.settings.os == "Windows" and not self._is_mingw:
             libname = "zdll" if self.options.shared else "zlib"
         else:
             libname = "z"
         self.cpp_info.libs = [libname]
+        if self._is_zlib_ng:
+            self.cpp_info.defines = ["ZLIB_COMPAT", "WITH_GZFILEOP"]
 
         self.cpp_info.names["cmake_find_package"] = "ZLIB"
         self.cpp_info.names["cmake_find_package_multi"] = "ZLIB"
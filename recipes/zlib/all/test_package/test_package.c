@@ -1,9 +1,71 @@
 #include <stdlib.h>
 #include <stdio.h>
 #include <string.h>
+#include <time.h>
 
 #include <zlib.h>
 
+#define BENCH_SIZE (2 * 1024 * 1024)
+#define BENCH_ROUNDS 4
+
+static double elapsed_seconds(clock_t start) {
+    double seconds = (double)(clock() - start) / CLOCKS_PER_SEC;
+    return seconds > 0.0 ? seconds : 1e-9;
+}
+
+/* compress & decompress a mildly redundant buffer and report the throughput */
+static int benchmark(void) {
+    const double megabytes = (double)BENCH_SIZE * BENCH_ROUNDS / (1024.0 * 1024.0);
+    uLong compressed_bound = compressBound(BENCH_SIZE);
+    unsigned char *input = malloc(BENCH_SIZE);
+    unsigned char *compressed = malloc(compressed_bound);
+    unsigned char *output = malloc(BENCH_SIZE);
+    uLongf compressed_len = 0;
+    uLongf output_len = 0;
+    unsigned int seed = 12345;
+    clock_t start;
+    size_t i;
+    int round;
+    int result = EXIT_FAILURE;
+
+    if (input == NULL || compressed == NULL || output == NULL) {
+        goto cleanup;
+    }
+    for (i = 0; i < BENCH_SIZE; ++i) {
+        seed = seed * 1103515245u + 12345u;
+        input[i] = (unsigned char)("Conan Package Manager "[(seed >> 16) % 22]);
+    }
+
+    start = clock();
+    for (round = 0; round < BENCH_ROUNDS; ++round) {
+        compressed_len = compressed_bound;
+        if (compress2(compressed, &compressed_len, input, BENCH_SIZE, Z_DEFAULT_COMPRESSION) != Z_OK) {
+            goto cleanup;
+        }
+    }
+    printf("compress:   %8.1f MB/s (ratio %.2f)\n", megabytes / elapsed_seconds(start),
+           (double)BENCH_SIZE / (double)compressed_len);
+
+    start = clock();
+    for (round = 0; round < BENCH_ROUNDS; ++round) {
+        output_len = BENCH_SIZE;
+        if (uncompress(output, &output_len, compressed, compressed_len) != Z_OK) {
+            goto cleanup;
+        }
+    }
+    printf("decompress: %8.1f MB/s\n", megabytes / elapsed_seconds(start));
+
+    if (output_len == BENCH_SIZE && memcmp(input, output, BENCH_SIZE) == 0) {
+        result = EXIT_SUCCESS;
+    }
+
+cleanup:
+    free(input);
+    free(compressed);
+    free(output);
+    return result;
+}
+
 int main(void) {
     char buffer_in [32] = {"Conan Package Manager"};
     char buffer_out [32] = {0};
@@ -26,7 +88,8 @@ int main(void) {
     printf("Compressed size is: %lu\n", strlen(buffer_out));
     printf("Compressed string is: %s\n", buffer_out);
 
+    /* zlib-ng in compat mode reports e.g. "1.2.11.zlib-ng" */
     printf("ZLIB VERSION: %s\n", zlibVersion());
 
-    return EXIT_SUCCESS;
+    return benchmark();
 }
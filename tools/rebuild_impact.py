@@ -0,0 +1,409 @@
+"""
+Which recipes have to be rebuilt because of a change, for each configuration of the build service.
+
+The reverse dependency graph is computed from the static index of `tools/recipe_index.py`. Conditional requirements
+are evaluated against the settings of every configuration in `.c3i/config_v2.yml` and the default options of the
+recipe, conditions which cannot be evaluated statically are considered true so the rebuild set is never too small.
+Recipes whose `package_id()` clears the info (header-only) propagate the change to their consumers, but they are not
+rebuilt themselves unless they changed.
+"""
+
+import argparse
+import ast
+import itertools
+import json
+import os
+import re
+import subprocess
+import sys
+
+import yaml
+
+from recipe_index import DEFAULT_DATABASE, DEFAULT_RECIPES_FOLDER, REPOSITORY_ROOT, connect, update_index
+
+
+DEFAULT_CONFIG = os.path.join(REPOSITORY_ROOT, ".c3i", "config_v2.yml")
+
+APPLE_OS = ("Macos", "iOS", "watchOS", "tvOS")
+MSVC_COMPILERS = ("msvc", "Visual Studio")
+
+# Binaries of the consumer depend on these kinds of requirement
+DEFAULT_KINDS = ("requires",)
+
+
+class _Unknown(Exception):
+    pass
+
+
+def _version_key(version):
+    return [(0, int(it), "") if it.isdigit() else (1, 0, it) for it in re.split(r"[.\-+]", str(version)) if it]
+
+
+def _compare(left, operator, right):
+    left, right = _version_key(left), _version_key(right)
+    # 1.2 == 1.2.0
+    size = max(len(left), len(right))
+    left += [(0, 0, "")] * (size - len(left))
+    right += [(0, 0, "")] * (size - len(right))
+    return {
+        "==": left == right, "!=": left != right,
+        ">": left > right, ">=": left >= right,
+        "<": left < right, "<=": left <= right,
+    }[operator]
+
+
+def version_matches(version, requirement):
+    """ Whether `version` satisfies a pinned version or a `[>=1.0 <2]` range, None if it cannot be known """
+    if requirement is None or "{" in requirement:
+        return None
+    if not requirement.startswith("["):
+        return requirement == version
+    expression = requirement[1:-1].split(",")[0].strip()
+    for alternative in expression.split("||"):
+        matched = True
+        for condition in alternative.split():
+            match = re.match(r"^(>=|<=|>|<|=|~|\^)?(.+)$", condition)
+            operator, bound = match.group(1) or "=", match.group(2)
+            if bound in ("*", ""):
+                continue
+            if operator in ("~", "^"):
+                # ~1.2.3 is >=1.2.3 <1.3, ^1.2.3 is >=1.2.3 <2
+                parts = bound.split(".")
+                index = 0 if operator == "^" or len(parts) == 1 else 1
+                upper = ".".join(parts[:index] + [str(int(parts[index]) + 1)]) if parts[index].isdigit() else None
+                matched = _compare(version, ">=", bound) and (upper is None or _compare(version, "<", upper))
+            else:
+                matched = _compare(version, "==" if operator == "=" else operator, bound)
+            if not matched:
+                break
+        if matched:
+            return True
+    return False
+
+
+class _ConditionEvaluator:
+    """ Evaluates the source of a requirement condition for given settings, options and version """
+
+    def __init__(self, settings, options, version):
+        self._settings = settings
+        self._options = options
+        self._version = version
+
+    def evaluate(self, condition):
+        """ True, False or None when the condition cannot be evaluated statically """
+        if not condition:
+            return True
+        try:
+            return bool(self._eval(ast.parse(condition, mode="eval").body))
+        except (_Unknown, SyntaxError, TypeError, ValueError):
+            return None
+
+    def _attribute_path(self, node):
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if isinstance(node, ast.Name):
+            parts.append(node.id)
+            return ".".join(reversed(parts))
+        raise _Unknown()
+
+    def _lookup(self, path):
+        if path.startswith("self.settings."):
+            setting = path[len("self.settings."):]
+            if setting not in self._settings:
+                raise _Unknown()
+            return self._settings[setting]
+        if path.startswith("self.options."):
+            option = path[len("self.options."):]
+            if option not in self._options:
+                raise _Unknown()
+            return self._options[option]
+        if path == "self.version":
+            return self._version
+        raise _Unknown()
+
+    def _call(self, node):
+        function = self._attribute_path(node.func)
+        arguments = node.args
+        if function in ("self.settings.get_safe", "self.options.get_safe") and arguments:
+            key = self._eval(arguments[0])
+            prefix = "self.settings." if function.startswith("self.settings") else "self.options."
+            try:
+                return self._lookup(prefix + key)
+            except _Unknown:
+                if prefix == "self.settings.":
+                    return None if not arguments[1:] else self._eval(arguments[1])
+                raise
+        if function in ("is_msvc", "tools.is_msvc"):
+            return self._settings.get("compiler") in MSVC_COMPILERS
+        if function in ("is_apple_os", "tools.is_apple_os"):
+            return self._settings.get("os") in APPLE_OS
+        if function in ("Version", "tools.Version", "scm.Version") and len(arguments) == 1:
+            value = self._eval(arguments[0])
+            if value is None:
+                raise _Unknown()
+            return _VersionValue(value)
+        if function == "str" and len(arguments) == 1:
+            return str(self._eval(arguments[0]))
+        raise _Unknown()
+
+    def _eval(self, node):
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+            return [self._eval(it) for it in node.elts]
+        if isinstance(node, ast.Attribute):
+            return self._lookup(self._attribute_path(node))
+        if isinstance(node, ast.Call):
+            return self._call(node)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return not self._eval(node.operand)
+        if isinstance(node, ast.BoolOp):
+            # An unknown operand is fine as long as another one decides the result
+            decisive = isinstance(node.op, ast.Or)
+            unknown = False
+            for value in node.values:
+                try:
+                    if bool(self._eval(value)) == decisive:
+                        return decisive
+                except _Unknown:
+                    unknown = True
+            if unknown:
+                raise _Unknown()
+            return not decisive
+        if isinstance(node, ast.Compare):
+            left = self._eval(node.left)
+            for operator, comparator in zip(node.ops, node.comparators):
+                right = self._eval(comparator)
+                if not self._compare(left, operator, right):
+                    return False
+                left = right
+            return True
+        raise _Unknown()
+
+    @staticmethod
+    def _compare(left, operator, right):
+        if isinstance(operator, ast.In):
+            return str(left) in [str(it) for it in right] if isinstance(right, list) else str(left) in str(right)
+        if isinstance(operator, ast.NotIn):
+            return not _ConditionEvaluator._compare(left, ast.In(), right)
+        symbols = {ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">="}
+        symbol = symbols.get(type(operator))
+        if symbol is None:
+            raise _Unknown()
+        if isinstance(left, _VersionValue) or isinstance(right, _VersionValue):
+            if left is None or right is None:
+                raise _Unknown()
+            return _compare(str(left), symbol, str(right))
+        if symbol in ("==", "!="):
+            # settings and options compare as strings in Conan
+            equal = str(left) == str(right) if left is not None and right is not None else left is right
+            return equal if symbol == "==" else not equal
+        raise _Unknown()
+
+
+class _VersionValue(str):
+    pass
+
+
+def _expand(content):
+    """ All the combinations of settings described by a `content` entry of the build service configuration """
+    keys = list(content)
+    choices = []
+    for key in keys:
+        values = []
+        for value in content[key]:
+            if isinstance(value, dict):
+                for name, nested in value.items():
+                    for sub in _expand(nested or {}):
+                        values.append(dict(sub, **{key: str(name)}))
+            else:
+                values.append({key: str(value)})
+        choices.append(values)
+    return [dict(item for part in combination for item in part.items()) for combination in itertools.product(*choices)]
+
+
+def load_configurations(config_path):
+    with open(config_path, encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    configurations = {}
+    for configuration in config.get("configurations") or []:
+        combinations = []
+        for content in configuration.get("content") or []:
+            combinations.extend(_expand(content))
+        configurations[configuration["id"]] = combinations
+    return configurations
+
+
+def changed_recipes(changed_files, recipes_folder, connection):
+    """ Versions of the recipes touched by a list of files, relative to the root of the repository """
+    prefix = os.path.relpath(recipes_folder, REPOSITORY_ROOT).replace("\\", "/") + "/"
+    changed = {}
+    for path in changed_files:
+        path = path.replace("\\", "/")
+        parts = path[len(prefix):].split("/") if path.startswith(prefix) else []
+        if len(parts) < 2:
+            continue
+        name = parts[0]
+        if len(parts) > 2:
+            folder = parts[1]
+            versions = {version for version, in connection.execute(
+                "SELECT version FROM versions WHERE name = ? AND folder = ?", (name, folder))}
+        else:  # config.yml, it can move versions between folders
+            versions = {version for version, in connection.execute(
+                "SELECT version FROM versions WHERE name = ?", (name,))}
+        changed.setdefault(name, set()).update(versions)
+    return changed
+
+
+class ReverseDependencies:
+    """ Reverse dependency graph of the index, edges keep their version requirement and condition """
+
+    def __init__(self, connection, kinds=DEFAULT_KINDS):
+        self.versions = {}
+        self.default_options = {}
+        self.clears_info = set()
+        self.dependents = {}
+        for name, version, folder in connection.execute("SELECT name, version, folder FROM versions"):
+            self.versions.setdefault(name, {})[version] = folder
+        for name, folder, default_options, clears_info in connection.execute(
+                "SELECT name, folder, default_options, clears_info FROM recipes"):
+            self.default_options[(name, folder)] = json.loads(default_options)
+            if clears_info:
+                self.clears_info.add((name, folder))
+        query = "SELECT name, folder, require_name, require_version, condition FROM requirements " \
+                f"WHERE require_name IS NOT NULL AND kind IN ({', '.join('?' for _ in kinds)})"
+        for name, folder, require_name, require_version, condition in connection.execute(query, kinds):
+            if require_name == name:
+                continue
+            self.dependents.setdefault(require_name, []).append((name, folder, require_version, condition))
+
+    def _active(self, name, folder, version, condition, combinations):
+        options = {key: value for key, value in self.default_options.get((name, folder), {}).items()
+                   if value != "<dynamic>"}
+        for settings in combinations:
+            if _ConditionEvaluator(settings, options, version).evaluate(condition) is not False:
+                return True
+        return False
+
+    def impacted(self, changed, combinations):
+        """ Every version of every recipe which has to be rebuilt, including the changed ones """
+        reached = self._reached(changed, combinations)
+        # The package id of header-only recipes doesn't depend on their requirements, nothing to rebuild
+        impacted = {}
+        for name, versions in reached.items():
+            versions = {version for version in versions if version in changed.get(name, ()) or
+                        (name, self.versions.get(name, {}).get(version)) not in self.clears_info}
+            if versions:
+                impacted[name] = versions
+        return impacted
+
+    def _reached(self, changed, combinations):
+        impacted = {name: set(versions) for name, versions in changed.items()}
+        pending = list(changed)
+        while pending:
+            required = pending.pop()
+            required_versions = impacted[required]
+            for name, folder, require_version, condition in self.dependents.get(required, []):
+                for version, version_folder in self.versions.get(name, {}).items():
+                    if version_folder != folder or version in impacted.get(name, ()):
+                        continue
+                    if self._requires_any(require_version, required_versions, version) and \
+                       self._active(name, folder, version, condition, combinations):
+                        impacted.setdefault(name, set()).add(version)
+                        if name not in pending:
+                            pending.append(name)
+        return impacted
+
+    @staticmethod
+    def _requires_any(require_version, versions, version):
+        if require_version and "{" in require_version:
+            # f-string, only the version of the recipe itself can be substituted
+            require_version = require_version.replace("{self.version}", version)
+        return any(version_matches(it, require_version) is not False for it in versions)
+
+    def build_order(self, impacted):
+        """ Topological order of the impacted recipes, a recipe always comes after its requirements """
+        requirements = {name: set() for name in impacted}
+        header_only = {name for name, _ in self.clears_info}
+        for required in impacted:
+            # Header-only recipes left out of the result still order their consumers after their requirements
+            visited = set()
+            pending = [required]
+            while pending:
+                for name, _, _, _ in self.dependents.get(pending.pop(), []):
+                    if name in requirements:
+                        requirements[name].add(required)
+                    elif name in header_only and name not in visited:
+                        visited.add(name)
+                        pending.append(name)
+        order = []
+        ready = sorted(name for name, it in requirements.items() if not it)
+        while ready:
+            current = ready.pop(0)
+            order.append(current)
+            for name, it in requirements.items():
+                if current in it:
+                    it.discard(current)
+                    if not it and name not in order and name not in ready:
+                        ready.append(name)
+            ready.sort()
+        # Cycles cannot be ordered, keep them at the end
+        order.extend(sorted(set(requirements) - set(order)))
+        return [(name, sorted(impacted[name], key=_version_key)) for name in order]
+
+
+def git_changed_files(base):
+    """ Files changed between the merge base with `base` and the working tree """
+    merge_base = subprocess.check_output(["git", "merge-base", base, "HEAD"], cwd=REPOSITORY_ROOT, text=True).strip()
+    output = subprocess.check_output(["git", "diff", "--name-only", merge_base], cwd=REPOSITORY_ROOT, text=True)
+    return [line for line in output.splitlines() if line]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Minimal and ordered set of recipes to rebuild because of a change, for each configuration.",
+        epilog="Requirements conditioned on options are only evaluated for the default value of the options, "
+               "consumers of a change which only depend on it through a non-default option are not listed.")
+    parser.add_argument("--base", default="origin/master", help="git reference the changes are compared to.")
+    parser.add_argument("--files", nargs="+", help="changed files, relative to the repository, instead of git.")
+    parser.add_argument("--config", default=DEFAULT_CONFIG, help="build service configuration.")
+    parser.add_argument("--configuration", action="append", help="only this configuration id, can be repeated.")
+    parser.add_argument("--tool-requires", action="store_true",
+                        help="also rebuild the consumers of a changed tool requirement.")
+    parser.add_argument("--recipes", default=DEFAULT_RECIPES_FOLDER, help="recipes folder.")
+    parser.add_argument("--database", default=DEFAULT_DATABASE, help="SQLite file holding the recipe index.")
+    parser.add_argument("--json", action="store_true", help="print results as JSON.")
+    args = parser.parse_args()
+
+    connection = connect(args.database)
+    update_index(connection, args.recipes)
+
+    files = args.files if args.files else git_changed_files(args.base)
+    changed = changed_recipes(files, args.recipes, connection)
+    kinds = DEFAULT_KINDS + (("tool_requires",) if args.tool_requires else ())
+    graph = ReverseDependencies(connection, kinds)
+
+    configurations = load_configurations(args.config)
+    if args.configuration:
+        unknown = set(args.configuration) - set(configurations)
+        if unknown:
+            print(f"error: unknown configuration(s): {', '.join(sorted(unknown))}", file=sys.stderr)
+            sys.exit(1)
+        configurations = {key: value for key, value in configurations.items() if key in args.configuration}
+
+    result = {configuration: graph.build_order(graph.impacted(changed, combinations))
+              for configuration, combinations in configurations.items()}
+    if args.json:
+        print(json.dumps({configuration: [{"name": name, "versions": versions} for name, versions in order]
+                          for configuration, order in result.items()}, indent=2))
+        return
+    for configuration, order in result.items():
+        print(f"{configuration}: {len(order)} recipe(s)")
+        for name, versions in order:
+            print(f"  {name}: {', '.join(versions)}")
+
+
+if __name__ == "__main__":
+    main()
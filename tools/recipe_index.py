@@ -0,0 +1,447 @@
+"""
+Static metadata index of all the recipes in ConanCenterIndex.
+
+Recipes are never imported nor executed: the class attributes and the requirements are read from the AST of each
+`conanfile.py`, and the versions from `config.yml` (or `conandata.yml` when there is no `config.yml`). The result is
+stored in a SQLite database which is updated incrementally, only recipes whose files changed are parsed again.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+
+import yaml
+
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_RECIPES_FOLDER = os.path.join(REPOSITORY_ROOT, "recipes")
+DEFAULT_DATABASE = os.path.join(REPOSITORY_ROOT, ".recipe_index.sqlite")
+
+# Bump it whenever the extraction or the schema changes, it forces a full rebuild
+INDEX_FORMAT = 2
+
+REQUIREMENT_METHODS = {
+    "requires": "requires",
+    "build_requires": "tool_requires",
+    "tool_requires": "tool_requires",
+    "test_requires": "test_requires",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, recipe TEXT, mtime_ns INTEGER, size INTEGER, sha256 TEXT);
+CREATE TABLE IF NOT EXISTS recipes (
+    name TEXT, folder TEXT, class_name TEXT, package_type TEXT, options TEXT, default_options TEXT,
+    clears_info INTEGER, PRIMARY KEY (name, folder));
+CREATE TABLE IF NOT EXISTS versions (name TEXT, version TEXT, folder TEXT, PRIMARY KEY (name, version));
+CREATE TABLE IF NOT EXISTS options (name TEXT, folder TEXT, option TEXT, "values" TEXT, "default" TEXT);
+CREATE TABLE IF NOT EXISTS requirements (
+    name TEXT, folder TEXT, kind TEXT, reference TEXT, require_name TEXT, require_version TEXT,
+    condition TEXT, method TEXT, line INTEGER);
+CREATE INDEX IF NOT EXISTS options_by_option ON options (option);
+CREATE INDEX IF NOT EXISTS requirements_by_require_name ON requirements (require_name);
+CREATE INDEX IF NOT EXISTS options_by_name ON options (name);
+CREATE INDEX IF NOT EXISTS requirements_by_name ON requirements (name);
+CREATE INDEX IF NOT EXISTS files_by_recipe ON files (recipe);
+"""
+
+_UNKNOWN = "<dynamic>"
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return _UNKNOWN
+
+
+def _dict_literal(node, known):
+    """ Best effort evaluation of a dict, keys or values which are not literals are kept as `<dynamic>` """
+    if isinstance(node, ast.Dict):
+        result = {}
+        for key, value in zip(node.keys, node.values):
+            if key is None:  # {**other}
+                other = known.get(value.id) if isinstance(value, ast.Name) else None
+                result.update(other if isinstance(other, dict) else {})
+                continue
+            key = _literal(key)
+            if isinstance(key, str):
+                result[key] = _literal(value)
+        return result
+    if isinstance(node, ast.DictComp) and len(node.generators) == 1:
+        # default_options = {key: False for key in options.keys()}
+        iterable = node.generators[0].iter
+        if isinstance(iterable, ast.Call) and isinstance(iterable.func, ast.Attribute):
+            iterable = iterable.func.value
+        source = known.get(iterable.id) if isinstance(iterable, ast.Name) else None
+        if isinstance(source, dict):
+            value = _literal(node.value)
+            return {key: value for key in source}
+    return _UNKNOWN
+
+
+def _conanfile_class(tree):
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            for base in node.bases:
+                base_name = base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", None)
+                if base_name == "ConanFile":
+                    return node
+    return None
+
+
+def _as_references(value):
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        return [it for it in value if isinstance(it, str)]
+    return []
+
+
+def _split_reference(reference):
+    if reference is None or "/" not in reference:
+        return None, None
+    name, version = reference.split("/", 1)
+    if "{" in name:  # f-string in the name itself
+        return None, None
+    return name, version.split("@", 1)[0]
+
+
+class _RequirementsVisitor(ast.NodeVisitor):
+    """ Collects the self.requires() & co calls of a method, together with the conditions guarding them """
+
+    def __init__(self, lines, method):
+        self._lines = lines
+        self._method = method
+        self._conditions = []
+        self.requirements = []
+
+    def _segment(self, node):
+        # Same as ast.get_source_segment(), without splitting the whole file again for every node,
+        # offsets are in UTF-8 bytes
+        lines = self._lines[node.lineno - 1:node.end_lineno]
+        if not lines:
+            return ""
+        if len(lines) == 1:
+            lines[0] = lines[0][node.col_offset:node.end_col_offset]
+        else:
+            lines[0] = lines[0][node.col_offset:]
+            lines[-1] = lines[-1][:node.end_col_offset]
+        return " ".join(b" ".join(lines).decode("utf-8").split())
+
+    def visit_If(self, node):
+        condition = self._segment(node.test)
+        self._conditions.append(condition)
+        for child in node.body:
+            self.visit(child)
+        self._conditions[-1] = f"not ({condition})"
+        for child in node.orelse:
+            self.visit(child)
+        self._conditions.pop()
+
+    def _visit_loop(self, node):
+        self._conditions.append(f"loop: {self._segment(node.iter)}" if hasattr(node, "iter") else "loop")
+        self.generic_visit(node)
+        self._conditions.pop()
+
+    visit_For = _visit_loop
+    visit_While = _visit_loop
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Attribute) and func.attr in REQUIREMENT_METHODS and \
+           isinstance(func.value, ast.Name) and func.value.id == "self" and node.args:
+            argument = node.args[0]
+            if isinstance(argument, ast.Constant) and isinstance(argument.value, str):
+                reference = argument.value
+            else:
+                reference = self._segment(argument)
+                if isinstance(argument, ast.JoinedStr):
+                    # keep the f-string body, e.g. openssl/{self._openssl_version}
+                    reference = reference[2:-1] if len(reference) > 3 else reference
+            kind = REQUIREMENT_METHODS[func.attr]
+            if self._method == "build_requirements" and kind == "requires":
+                kind = "tool_requires"
+            self.requirements.append({
+                "kind": kind,
+                "reference": reference,
+                "condition": " and ".join(self._conditions) or None,
+                "method": self._method,
+                "line": node.lineno,
+            })
+        self.generic_visit(node)
+
+
+def _clears_info(method):
+    """ Whether package_id() unconditionally drops the settings, options and requirements (header-only) """
+    for node in method.body:
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+            func = node.value.func
+            if isinstance(func, ast.Attribute) and func.attr in ("clear", "header_only") and \
+               isinstance(func.value, ast.Attribute) and func.value.attr == "info" and \
+               isinstance(func.value.value, ast.Name) and func.value.value.id == "self":
+                return True
+    return False
+
+
+def extract_conanfile(source):
+    """ Static description of a conanfile.py: class attributes, options and requirements """
+    tree = ast.parse(source)
+    klass = _conanfile_class(tree)
+    if klass is None:
+        return None
+
+    lines = [line.encode("utf-8") for line in source.splitlines()]
+    attributes = {}
+    requirements = []
+    clears_info = False
+    for node in klass.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    if target.id in ("options", "default_options"):
+                        attributes[target.id] = _dict_literal(node.value, attributes)
+                    else:
+                        attributes[target.id] = _literal(node.value)
+                elif isinstance(target, ast.Subscript) and isinstance(target.value, ast.Name) and \
+                        isinstance(attributes.get(target.value.id), dict):
+                    # default_options["fPIC"] = True
+                    key = _literal(target.slice.value if isinstance(target.slice, ast.Index) else target.slice)
+                    if isinstance(key, str):
+                        attributes[target.value.id][key] = _literal(node.value)
+        elif isinstance(node, ast.FunctionDef):
+            if node.name == "package_id":
+                clears_info = _clears_info(node)
+            visitor = _RequirementsVisitor(lines, node.name)
+            for child in node.body:
+                visitor.visit(child)
+            requirements.extend(visitor.requirements)
+
+    for attribute, kind in (("requires", "requires"), ("build_requires", "tool_requires"),
+                            ("tool_requires", "tool_requires"), ("test_requires", "test_requires")):
+        for reference in _as_references(attributes.get(attribute)):
+            requirements.append({"kind": kind, "reference": reference, "condition": None,
+                                 "method": None, "line": klass.lineno})
+
+    for requirement in requirements:
+        requirement["require_name"], requirement["require_version"] = _split_reference(requirement["reference"])
+
+    options = attributes.get("options")
+    default_options = attributes.get("default_options")
+    return {
+        "class_name": klass.name,
+        "name": attributes.get("name") if isinstance(attributes.get("name"), str) else None,
+        "package_type": attributes.get("package_type") if isinstance(attributes.get("package_type"), str) else None,
+        "options": options if isinstance(options, dict) else {},
+        "default_options": default_options if isinstance(default_options, dict) else {},
+        "clears_info": clears_info,
+        "requirements": requirements,
+    }
+
+
+def _load_yaml(path):
+    if not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        try:
+            return yaml.safe_load(f)
+        except yaml.YAMLError:
+            return None
+
+
+def _recipe_files(recipe_folder):
+    files = [os.path.join(recipe_folder, "config.yml")]
+    for folder in sorted(os.listdir(recipe_folder)):
+        for filename in ("conanfile.py", "conandata.yml"):
+            path = os.path.join(recipe_folder, folder, filename)
+            if os.path.isfile(path):
+                files.append(path)
+    return [it for it in files if os.path.isfile(it)]
+
+
+def _sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def connect(database=DEFAULT_DATABASE):
+    connection = sqlite3.connect(database)
+    connection.executescript(SCHEMA)
+    row = connection.execute("SELECT value FROM metadata WHERE key = 'format'").fetchone()
+    if row is None or int(row[0]) != INDEX_FORMAT:
+        with connection:
+            # The schema may have changed too, start from scratch
+            for table in ("files", "recipes", "versions", "options", "requirements"):
+                connection.execute(f"DROP TABLE IF EXISTS {table}")
+            connection.executescript(SCHEMA)
+            connection.execute("INSERT OR REPLACE INTO metadata VALUES ('format', ?)", (str(INDEX_FORMAT),))
+    return connection
+
+
+def _changed_files(connection, name, files):
+    """ Files of a recipe whose content changed, the hash is only computed when mtime or size differ """
+    stored = {path: (mtime_ns, size, sha256) for path, mtime_ns, size, sha256 in connection.execute(
+        "SELECT path, mtime_ns, size, sha256 FROM files WHERE recipe = ?", (name,))}
+    current = {}
+    changed = set(stored) - set(files)
+    for path in files:
+        stat = os.stat(path)
+        previous = stored.get(path)
+        if previous and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size:
+            current[path] = previous
+            continue
+        sha256 = _sha256(path)
+        current[path] = (stat.st_mtime_ns, stat.st_size, sha256)
+        if not previous or previous[2] != sha256:
+            changed.add(path)
+    return changed, current
+
+
+def _index_recipe(connection, recipes_folder, name, files):
+    recipe_folder = os.path.join(recipes_folder, name)
+    for table in ("recipes", "versions", "options", "requirements"):
+        connection.execute(f"DELETE FROM {table} WHERE name = ?", (name,))
+
+    config = _load_yaml(os.path.join(recipe_folder, "config.yml")) or {}
+    versions = {str(version): str((data or {}).get("folder"))
+                for version, data in (config.get("versions") or {}).items()}
+
+    for path in files:
+        if os.path.basename(path) != "conanfile.py":
+            continue
+        folder = os.path.basename(os.path.dirname(path))
+        if not config:
+            conandata = _load_yaml(os.path.join(recipe_folder, folder, "conandata.yml")) or {}
+            versions.update({str(version): folder for version in (conandata.get("sources") or {})})
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        try:
+            recipe = extract_conanfile(source)
+        except SyntaxError as error:
+            print(f"warning: {os.path.relpath(path, recipes_folder)}: {error}", file=sys.stderr)
+            recipe = None
+        if recipe is None:
+            continue
+        connection.execute("INSERT INTO recipes VALUES (?, ?, ?, ?, ?, ?, ?)", (
+            name, folder, recipe["class_name"], recipe["package_type"],
+            json.dumps(recipe["options"], default=str), json.dumps(recipe["default_options"], default=str),
+            int(recipe["clears_info"])))
+        connection.executemany("INSERT INTO options VALUES (?, ?, ?, ?, ?)", [
+            (name, folder, option, json.dumps(values, default=str),
+             json.dumps(recipe["default_options"].get(option), default=str))
+            for option, values in recipe["options"].items()])
+        connection.executemany("INSERT INTO requirements VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", [
+            (name, folder, it["kind"], it["reference"], it["require_name"], it["require_version"],
+             it["condition"], it["method"], it["line"])
+            for it in recipe["requirements"]])
+
+    connection.executemany("INSERT OR REPLACE INTO versions VALUES (?, ?, ?)",
+                           [(name, version, folder) for version, folder in versions.items()])
+
+
+def update_index(connection, recipes_folder=DEFAULT_RECIPES_FOLDER):
+    """ Bring the index up to date with the recipes folder, returns the names of the re-indexed recipes """
+    names = sorted(it for it in os.listdir(recipes_folder) if os.path.isdir(os.path.join(recipes_folder, it)))
+    updated = []
+    with connection:
+        indexed = {row[0] for row in connection.execute("SELECT DISTINCT recipe FROM files")}
+        for name in indexed - set(names):
+            for table in ("recipes", "versions", "options", "requirements"):
+                connection.execute(f"DELETE FROM {table} WHERE name = ?", (name,))
+            connection.execute("DELETE FROM files WHERE recipe = ?", (name,))
+            updated.append(name)
+
+        for name in names:
+            files = _recipe_files(os.path.join(recipes_folder, name))
+            changed, current = _changed_files(connection, name, files)
+            if changed or name not in indexed:
+                _index_recipe(connection, recipes_folder, name, files)
+                updated.append(name)
+            connection.execute("DELETE FROM files WHERE recipe = ?", (name,))
+            connection.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?)",
+                                   [(path, name, *data) for path, data in current.items()])
+    return updated
+
+
+def recipes_with_option(connection, option):
+    rows = connection.execute(
+        'SELECT name, folder, "values", "default" FROM options WHERE option = ? ORDER BY name, folder', (option,))
+    return [(name, folder, json.loads(values), json.loads(default)) for name, folder, values, default in rows]
+
+
+def recipes_requiring(connection, require_name, kinds=None):
+    query = "SELECT name, folder, kind, reference, condition FROM requirements WHERE require_name = ?"
+    parameters = [require_name]
+    if kinds:
+        query += f" AND kind IN ({', '.join('?' for _ in kinds)})"
+        parameters.extend(kinds)
+    return connection.execute(query + " ORDER BY name, folder, line", parameters).fetchall()
+
+
+def recipe_info(connection, name):
+    info = {"name": name, "versions": {}, "folders": {}}
+    for version, folder in connection.execute("SELECT version, folder FROM versions WHERE name = ?", (name,)):
+        info["versions"][version] = folder
+    for folder, class_name, package_type, options, default_options, clears_info in connection.execute(
+            "SELECT folder, class_name, package_type, options, default_options, clears_info FROM recipes "
+            "WHERE name = ?", (name,)):
+        info["folders"][folder] = {
+            "class_name": class_name,
+            "package_type": package_type,
+            "clears_info": bool(clears_info),
+            "options": json.loads(options),
+            "default_options": json.loads(default_options),
+            "requirements": [
+                {"kind": kind, "reference": reference, "condition": condition}
+                for kind, reference, condition in connection.execute(
+                    "SELECT kind, reference, condition FROM requirements WHERE name = ? AND folder = ? ORDER BY line",
+                    (name, folder))
+            ],
+        }
+    return info
+
+
+def _print_rows(rows, as_json, columns):
+    if as_json:
+        print(json.dumps([dict(zip(columns, row)) for row in rows], indent=2))
+        return
+    for row in rows:
+        print("  ".join("" if it is None else str(it) for it in row))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Static metadata index of ConanCenterIndex recipes.")
+    parser.add_argument("--recipes", default=DEFAULT_RECIPES_FOLDER, help="recipes folder to index.")
+    parser.add_argument("--database", default=DEFAULT_DATABASE, help="SQLite file holding the index.")
+    parser.add_argument("--json", action="store_true", help="print results as JSON.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("update", help="update the index, only recipes whose files changed are parsed.")
+    option_parser = subparsers.add_parser("option", help="recipes exposing an option.")
+    option_parser.add_argument("option")
+    requires_parser = subparsers.add_parser("requires", help="recipes requiring a package.")
+    requires_parser.add_argument("package")
+    requires_parser.add_argument("--kind", action="append", choices=sorted(set(REQUIREMENT_METHODS.values())),
+                                 help="only this kind of requirement, can be repeated.")
+    show_parser = subparsers.add_parser("show", help="all the metadata of a recipe.")
+    show_parser.add_argument("name")
+    args = parser.parse_args()
+
+    connection = connect(args.database)
+    updated = update_index(connection, args.recipes)
+    if args.command == "update":
+        print(f"{len(updated)} recipe(s) indexed")
+    elif args.command == "option":
+        _print_rows(recipes_with_option(connection, args.option), args.json, ("name", "folder", "values", "default"))
+    elif args.command == "requires":
+        _print_rows(recipes_requiring(connection, args.package, args.kind), args.json,
+                    ("name", "folder", "kind", "reference", "condition"))
+    elif args.command == "show":
+        print(json.dumps(recipe_info(connection, args.name), indent=2))
+
+
+if __name__ == "__main__":
+    main()